@@ -7,14 +7,20 @@ import pytest
 import allure
 from datetime import datetime
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from utils.auth_session import AuthSessionCache
+from utils.browser_profile import ProfileTemplate
+from utils.command_profiler import CommandProfiler
 from utils.config_manager import ConfigManager
+from utils.driver_pool import DriverPool
+from utils.driver_service import DriverServiceManager
+from utils.driver_spawner import DriverSpawner
+from utils.grid_client import GridClient
 from utils.logger import Logger
+from utils.round_trip_analyzer import RoundTripAnalyzer
+from utils.webdriver_utils import WebDriverUtils
+
+# 本进程是否执行测试（xdist工作进程或未并行的进程）；xdist主进程也会收到测试开始的钩子，但不执行测试
+_RUNS_TESTS = True
 
 
 def pytest_configure(config):
@@ -25,6 +31,30 @@ def pytest_configure(config):
     os.makedirs("reports/screenshots", exist_ok=True)
     os.makedirs("reports/logs", exist_ok=True)
 
+    # 并行执行时由主进程统一写日志文件，工作进程把日志发送到主进程
+    global _RUNS_TESTS
+    is_worker = hasattr(config, "workerinput")
+    _RUNS_TESTS = is_worker or not config.getoption("numprocesses", default=None)
+    if not _RUNS_TESTS and ConfigManager.get_instance().get("logging.collector", True):
+        Logger.get_logger().start_collector()
+
+    # 主进程确定本次运行的数据种子和运行标记，工作进程通过环境变量继承
+    if not is_worker:
+        from utils.data_manager import DataManager
+        data_seed = config.getoption("--data-seed")
+        if data_seed is not None:
+            os.environ[DataManager.RUN_SEED_ENV] = str(data_seed)
+        DataManager.get_run_seed(ConfigManager.get_instance())
+        DataManager.get_run_id()
+
+
+def pytest_unconfigure(config):
+    """pytest结束钩子"""
+    # 停止本工作进程的驱动服务
+    DriverServiceManager.get_manager().stop_all()
+    ProfileTemplate.cleanup_all()
+    Logger.get_logger().stop_collector()
+
 
 def pytest_addoption(parser):
     """添加命令行选项"""
@@ -45,61 +75,162 @@ def pytest_addoption(parser):
         default="https://automationexercise.com",
         help="Base URL for testing"
     )
+    parser.addoption(
+        "--grid-url",
+        action="store",
+        default=None,
+        help="Selenium Grid hub URL, e.g. http://localhost:4444 (runs tests on Remote WebDriver)"
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        help="Record WebDriver commands per test and write a summary to reports/profiles"
+    )
+    parser.addoption(
+        "--detect-n-plus-one",
+        action="store_true",
+        help="Profile WebDriver commands and rank page-object methods that send one command per element"
+    )
+    parser.addoption(
+        "--data-seed",
+        action="store",
+        type=int,
+        default=None,
+        help="Seed for generated test data; reuse the seed logged by a previous run to reproduce its data"
+    )
 
 
 @pytest.fixture(scope="session")
 def config():
     """配置管理器fixture"""
-    return ConfigManager()
+    return ConfigManager.get_instance()
 
 
 @pytest.fixture(scope="session")
 def logger():
     """日志记录器fixture"""
-    return Logger()
+    return Logger.get_logger()
 
 
-@pytest.fixture(scope="function")
-def browser_setup(request, config, logger):
-    """浏览器设置fixture"""
+@pytest.fixture(scope="session")
+def driver_pool(request, config, logger):
+    """WebDriver池fixture（每个xdist工作进程一个）"""
     browser_name = request.config.getoption("--browser")
     headless = request.config.getoption("--headless")
+    depth = config.get("driver_pool.prewarm.depth", 1)
+
+    grid = None
+    grid_url = request.config.getoption("--grid-url") or config.get("grid.url", "")
+    if grid_url:
+        grid = GridClient(grid_url, slot_dir=config.get("grid.slot_dir", ".webdriver/grid_slots"))
+        # 当前工作进程的会话数 = 1个使用中的会话 + 备用会话，不超过分到的槽位配额（创建会话时由reserve_session保证）
+        budget = grid.get_worker_session_budget(browser_name)
+        depth = min(depth, budget - 1)
+
+    spawner = DriverSpawner(
+        factory=lambda: _create_driver(browser_name, headless, config, logger, grid),
+        depth=depth,
+        memory_ceiling_mb=config.get("driver_pool.prewarm.memory_ceiling_mb", 2048),
+        session_memory_mb=config.get("driver_pool.prewarm.session_memory_mb", 400)
+    )
+    spawner.start()
 
-    logger.info(f"启动 {browser_name} 浏览器，headless模式: {headless}")
+    pool = DriverPool(
+        factory=spawner.take,
+        max_uses=config.get("driver_pool.max_uses", 50),
+        max_idle=1 if config.get("driver_pool.enabled", True) else 0
+    )
 
-    driver = None
+    yield pool
 
-    try:
-        if browser_name.lower() == "chrome":
-            driver = _setup_chrome_driver(headless, config)
-        elif browser_name.lower() == "firefox":
-            driver = _setup_firefox_driver(headless, config)
-        elif browser_name.lower() == "edge":
-            driver = _setup_edge_driver(headless, config)
-        else:
-            raise ValueError(f"不支持的浏览器: {browser_name}")
-
-        # 配置浏览器
-        window_size = config.get("browser.window_size", "1920,1080")
-        width, height = map(int, window_size.split(","))
-        driver.set_window_size(width, height)
+    logger.info("关闭浏览器池")
+    pool.close_all()
+    spawner.stop()
 
-        driver.implicitly_wait(config.get("browser.implicit_wait", 10))
-        driver.set_page_load_timeout(config.get("browser.page_load_timeout", 30))
 
-        yield driver
+@pytest.fixture(scope="session")
+def command_profiler(request, config, logger):
+    """WebDriver命令分析器fixture，未开启时为None，不包装命令执行器"""
+    detect_n_plus_one = (request.config.getoption("--detect-n-plus-one") or
+                         config.get("profiling.detect_n_plus_one", False))
+    if not (detect_n_plus_one or request.config.getoption("--profile-commands") or
+            config.get("profiling.enabled", False)):
+        yield None
+        return
+
+    report_dir = config.get("reports.profiles", "reports/profiles")
+    analyzer = RoundTripAnalyzer(config.get("profiling.n_plus_one_min_elements", 3)) if detect_n_plus_one else None
+
+    yield CommandProfiler(report_dir=report_dir, slowest=config.get("profiling.slowest", 10), analyzer=analyzer)
+
+    if analyzer is not None:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        report_file = analyzer.write_report(os.path.join(report_dir, f"n_plus_one_{worker}.json"))
+        for entry in analyzer.ranking()[:5]:
+            logger.warning(f"N+1: {entry['caller']} ({entry['site']}) {entry['command']} x{entry['round_trips']}, "
+                           f"{entry['duration']}s")
+        logger.info(f"N+1检测报告: {report_file}")
 
+
+@pytest.fixture(scope="function")
+def browser_setup(request, driver_pool, logger, command_profiler):
+    """浏览器设置fixture"""
+    try:
+        driver = driver_pool.acquire()
     except Exception as e:
         logger.error(f"浏览器设置失败: {str(e)}")
         raise
-    finally:
-        if driver:
-            logger.info("关闭浏览器")
-            driver.quit()
 
+    if command_profiler is not None:
+        command_profiler.attach(driver)
+        command_profiler.start_test(request.node.nodeid)
 
-def _setup_chrome_driver(headless: bool, config: ConfigManager) -> webdriver.Chrome:
-    """设置Chrome浏览器"""
+    yield driver
+
+    # 先结束统计，归还浏览器时的重置命令不计入测试
+    if command_profiler is not None:
+        command_profiler.report(command_profiler.stop_test())
+
+    driver_pool.release(driver)
+
+
+def _create_driver(browser_name: str, headless: bool, config: ConfigManager, logger: Logger,
+                   grid: GridClient = None):
+    """创建并配置新的浏览器实例"""
+    logger.info(f"启动 {browser_name} 浏览器，headless模式: {headless}")
+
+    if grid is not None:
+        driver = _setup_remote_driver(browser_name, headless, config, grid)
+    elif browser_name.lower() == "chrome":
+        driver = _setup_chrome_driver(headless, config)
+    elif browser_name.lower() == "firefox":
+        driver = _setup_firefox_driver(headless, config)
+    elif browser_name.lower() == "edge":
+        driver = _setup_edge_driver(headless, config)
+    else:
+        raise ValueError(f"不支持的浏览器: {browser_name}")
+
+    # 配置浏览器
+    window_size = config.get("browser.window_size", "1920,1080")
+    width, height = map(int, window_size.split(","))
+    driver.set_window_size(width, height)
+
+    # 仅显式等待模式下关闭隐式等待，避免与WebDriverUtils的显式等待叠加
+    if config.get("browser.explicit_wait_only", False):
+        driver.implicitly_wait(0)
+    else:
+        driver.implicitly_wait(config.get("browser.implicit_wait", 10))
+    driver.set_page_load_timeout(config.get("browser.page_load_timeout", 30))
+
+    # 注入页面埋点脚本，供 wait_for_settled 判断网络和DOM是否空闲
+    WebDriverUtils.install_settle_instrumentation(driver)
+
+    return driver
+
+
+def _build_chrome_options(headless: bool, config: ConfigManager,
+                          profile_dir: str = None) -> webdriver.ChromeOptions:
+    """构建Chrome浏览器选项"""
     options = webdriver.ChromeOptions()
 
     # 添加基础选项
@@ -110,6 +241,9 @@ def _setup_chrome_driver(headless: bool, config: ConfigManager) -> webdriver.Chr
     if headless:
         options.add_argument("--headless")
 
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+
     # 设置下载目录
     prefs = {
         "download.default_directory": os.path.abspath("downloads"),
@@ -118,33 +252,18 @@ def _setup_chrome_driver(headless: bool, config: ConfigManager) -> webdriver.Chr
         "safebrowsing.enabled": True
     }
     options.add_experimental_option("prefs", prefs)
+    return options
 
-    # 修复ChromeDriver路径问题
-    try:
-        # 清理并重新获取ChromeDriver
-        driver_path = ChromeDriverManager().install()
-
-        # 确保路径指向正确的chromedriver.exe
-        if not driver_path.endswith('.exe'):
-            # 如果路径不是.exe文件，尝试找到正确的chromedriver.exe
-            driver_dir = os.path.dirname(driver_path)
-            for file in os.listdir(driver_dir):
-                if file.startswith('chromedriver') and file.endswith('.exe'):
-                    driver_path = os.path.join(driver_dir, file)
-                    break
-
-        service = ChromeService(driver_path)
-        return webdriver.Chrome(service=service, options=options)
 
-    except Exception as e:
-        # 如果自动下载失败，尝试使用系统PATH中的chromedriver
-        print(f"自动下载ChromeDriver失败，尝试使用系统ChromeDriver: {e}")
-        service = ChromeService()  # 使用系统PATH中的chromedriver
-        return webdriver.Chrome(service=service, options=options)
+def _setup_chrome_driver(headless: bool, config: ConfigManager) -> webdriver.Remote:
+    """设置Chrome浏览器"""
+    profile_dir = _clone_profile("chrome", headless, config)
+    options = _build_chrome_options(headless, config, profile_dir)
+    return _start_local_driver("chrome", options, config, profile_dir)
 
 
-def _setup_firefox_driver(headless: bool, config: ConfigManager) -> webdriver.Firefox:
-    """设置Firefox浏览器"""
+def _build_firefox_options(headless: bool, config: ConfigManager) -> webdriver.FirefoxOptions:
+    """构建Firefox浏览器选项"""
     options = webdriver.FirefoxOptions()
 
     if headless:
@@ -154,23 +273,148 @@ def _setup_firefox_driver(headless: bool, config: ConfigManager) -> webdriver.Fi
     for option in firefox_options:
         options.add_argument(option)
 
-    service = FirefoxService(GeckoDriverManager().install())
-    return webdriver.Firefox(service=service, options=options)
+    return options
 
 
-def _setup_edge_driver(headless: bool, config: ConfigManager) -> webdriver.Edge:
-    """设置Edge浏览器"""
+def _setup_firefox_driver(headless: bool, config: ConfigManager) -> webdriver.Remote:
+    """设置Firefox浏览器"""
+    options = _build_firefox_options(headless, config)
+    return DriverServiceManager.get_manager().create_driver("firefox", options)
+
+
+def _build_edge_options(headless: bool, config: ConfigManager,
+                        profile_dir: str = None) -> webdriver.EdgeOptions:
+    """构建Edge浏览器选项"""
     options = webdriver.EdgeOptions()
 
     if headless:
         options.add_argument("--headless")
 
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+
     edge_options = config.get("browsers.edge.options", [])
     for option in edge_options:
         options.add_argument(option)
 
-    service = EdgeService(EdgeChromiumDriverManager().install())
-    return webdriver.Edge(service=service, options=options)
+    return options
+
+
+def _setup_edge_driver(headless: bool, config: ConfigManager) -> webdriver.Remote:
+    """设置Edge浏览器"""
+    profile_dir = _clone_profile("edge", headless, config)
+    options = _build_edge_options(headless, config, profile_dir)
+    return _start_local_driver("edge", options, config, profile_dir)
+
+
+def _profile_template(browser_name: str, config: ConfigManager) -> ProfileTemplate:
+    """获取浏览器对应的配置文件模板"""
+    return ProfileTemplate.get_template(
+        browser_name,
+        config.get("profile_template.dir", ".webdriver/profiles"),
+        config.get("profile_template.clone_dir", "") or None
+    )
+
+
+def _start_local_driver(browser_name: str, options, config: ConfigManager, profile_dir: str = None):
+    """启动本地浏览器，会话退出（回收或关闭）或启动失败时删除它的配置文件副本"""
+    if profile_dir is None:
+        return DriverServiceManager.get_manager().create_driver(browser_name, options)
+
+    template = _profile_template(browser_name, config)
+    try:
+        driver = DriverServiceManager.get_manager().create_driver(browser_name, options)
+    except Exception:
+        template.remove_clone(profile_dir)
+        raise
+
+    _on_quit(driver, lambda: template.remove_clone(profile_dir))
+    return driver
+
+
+def _clone_profile(browser_name: str, headless: bool, config: ConfigManager):
+    """从配置文件模板复制出本次会话的用户数据目录，未启用模板时返回None"""
+    if not config.get("profile_template.enabled", False):
+        return None
+
+    template = _profile_template(browser_name, config)
+    template.ensure(lambda build_dir: _warm_profile(browser_name, headless, config, build_dir))
+    return template.clone()
+
+
+def _warm_profile(browser_name: str, headless: bool, config: ConfigManager, profile_dir: str):
+    """在指定用户数据目录中启动浏览器并访问站点，写入偏好设置并预热HTTP缓存"""
+    if browser_name == "chrome":
+        options = _build_chrome_options(headless, config, profile_dir)
+    else:
+        options = _build_edge_options(headless, config, profile_dir)
+
+    driver = DriverServiceManager.get_manager().create_driver(browser_name, options)
+    try:
+        driver.set_page_load_timeout(config.get("browser.page_load_timeout", 30))
+        driver.get(config.base_url)
+        # 登录态等会话状态不能带入副本；磁盘上的Cookie和页面存储由ProfileTemplate.ensure再清理一次
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    finally:
+        driver.quit()
+
+
+def _setup_remote_driver(browser_name: str, headless: bool, config: ConfigManager,
+                         grid: GridClient) -> webdriver.Remote:
+    """在Selenium Grid上创建Remote WebDriver会话"""
+    option_builders = {
+        "chrome": _build_chrome_options,
+        "firefox": _build_firefox_options,
+        "edge": _build_edge_options
+    }
+    builder = option_builders.get(browser_name.lower())
+    if builder is None:
+        raise ValueError(f"不支持的浏览器: {browser_name}")
+
+    options = builder(headless, config)
+
+    # 占用槽位（本进程配额和所有工作进程合计都不超限），等不到时报错而不是让会话在Hub队列中排队超时
+    release_slot = grid.reserve_session(browser_name, timeout=config.get("grid.slot_wait_timeout", 300))
+    try:
+        driver = webdriver.Remote(command_executor=grid.grid_url, options=options)
+    except Exception:
+        release_slot()
+        raise
+
+    _on_quit(driver, release_slot)
+    return driver
+
+
+def _on_quit(driver, callback):
+    """在driver.quit()之后执行回调（无论退出是否成功）"""
+    original_quit = driver.quit
+
+    def quit():
+        try:
+            original_quit()
+        finally:
+            callback()
+
+    driver.quit = quit
+
+
+@pytest.fixture(scope="session")
+def auth_session(config):
+    """登录会话缓存fixture（每个工作进程一个）"""
+    from pages.login_page import LoginPage
+
+    def login_via_form(driver, email: str, password: str) -> bool:
+        login_page = LoginPage(driver, config)
+        login_page.open_login_page()
+        login_page.login_user(email, password)
+        return login_page.wait_for_login_result()
+
+    return AuthSessionCache(
+        base_url=config.base_url,
+        login_func=login_via_form,
+        check_func=lambda driver: LoginPage(driver, config).verify_logged_in()
+    )
 
 
 @pytest.fixture(scope="function")
@@ -179,9 +423,15 @@ def base_url(request):
     return request.config.getoption("--base-url")
 
 
+def pytest_runtest_logstart(nodeid, location):
+    """测试开始钩子 - 开始缓存本测试的日志（只在执行测试的进程中，缓存在teardown报告后停止）"""
+    if _RUNS_TESTS:
+        Logger.get_logger().start_test_capture(nodeid)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """测试执行结果钩子 - 用于截图"""
+    """测试执行结果钩子 - 用于截图和保存失败测试的日志"""
     outcome = yield
     rep = outcome.get_result()
 
@@ -192,6 +442,15 @@ def pytest_runtest_makereport(item, call):
             # 截图
             _take_screenshot(driver, item.name)
 
+    # 失败时把缓存的日志写入磁盘并添加到Allure报告，通过的测试在teardown后丢弃缓存
+    test_logger = Logger.get_logger()
+    if rep.failed:
+        text = test_logger.flush_test_capture()
+        if text:
+            allure.attach(text, name=f"日志_{rep.when}", attachment_type=allure.attachment_type.TEXT)
+    if rep.when == "teardown":
+        test_logger.stop_test_capture()
+
 
 def _take_screenshot(driver, test_name: str):
     """截图功能"""
@@ -212,11 +471,20 @@ def _take_screenshot(driver, test_name: str):
         print(f"截图失败: {str(e)}")
 
 
-@pytest.fixture(scope="function")
-def test_data(config):
-    """测试数据fixture"""
+@pytest.fixture(scope="session")
+def data_manager(config, logger):
+    """数据管理器fixture（每个xdist工作进程一个）"""
     from utils.data_manager import DataManager
-    return DataManager(config)
+    manager = DataManager(config)
+    logger.info(f"测试数据种子: {manager.run_seed}（使用 --data-seed={manager.run_seed} 复现）")
+    return manager
+
+
+@pytest.fixture(scope="function")
+def test_data(request, data_manager):
+    """测试数据fixture：复用工作进程的数据管理器，按测试ID重新设置随机种子"""
+    data_manager.reseed(request.node.nodeid)
+    return data_manager
 
 
 def pytest_collection_modifyitems(config, items):
@@ -4,6 +4,8 @@ AutomationExercise网站账户创建成功确认页面
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -16,9 +18,9 @@ class AccountCreatedPage(BasePage):
     CONTINUE_BUTTON = (By.XPATH, "//a[@data-qa='continue-button']")
     CONGRATULATIONS_MESSAGE = (By.XPATH, "//p[contains(text(), 'Congratulations')]")
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化账户创建成功页面"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = f"{self.base_url}/account_created"
 
     def verify_page_loaded(self) -> bool:
@@ -39,7 +41,7 @@ class AccountCreatedPage(BasePage):
     def click_continue_button(self):
         """点击继续按钮"""
         log.step("Clicking continue button")
-        self.click_element(self.CONTINUE_BUTTON)
+        self.click_element(self.CONTINUE_BUTTON, settle=True)
         return self
 
     def get_success_message_text(self) -> str:
@@ -6,24 +6,51 @@ import time
 from typing import List, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
+from utils.dom_snapshot import DomSnapshot
 from utils.webdriver_utils import WebDriverUtils
 from utils.config_manager import ConfigManager
 from utils.logger import log
 
 
+# 产品卡片提取脚本，首页、产品页以及分类/品牌页共用同一套产品卡片结构
+PRODUCTS_EXTRACT_JS = """
+return Array.prototype.map.call(document.querySelectorAll('.productinfo'), function (card) {
+    var wrapper = card.closest('.product-image-wrapper') || card;
+    var button = card.querySelector('[data-product-id]');
+    var image = card.querySelector('img');
+    var link = wrapper.querySelector('a[href*="/product_details/"]');
+    // 与WebElement.text一致：取渲染后的文本（含text-transform），未显示的元素（如轮播图中隐藏的卡片）为空字符串
+    var text = function (selector) {
+        var el = card.querySelector(selector);
+        if (!el || !(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) { return ''; }
+        return el.innerText.trim();
+    };
+    return {
+        id: button ? button.getAttribute('data-product-id') : null,
+        name: text('p'),
+        price: text('h2'),
+        image: image ? image.src : null,
+        href: link ? link.href : null
+    };
+});
+"""
+
+
 class BasePage:
     """页面对象模型基类"""
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """
         初始化基础页面
 
         Args:
             driver: WebDriver实例
+            config: 共享的配置管理器，默认使用进程内共享实例
+            utils: 共享的WebDriver工具实例，默认新建
         """
         self.driver = driver
-        self.config = ConfigManager()
-        self.utils = WebDriverUtils(driver, self.config.explicit_wait)
+        self.config = config or ConfigManager.get_instance()
+        self.utils = utils or WebDriverUtils(driver, self.config.explicit_wait)
         self.base_url = self.config.base_url
 
     def open_page(self, url: str = None):
@@ -42,6 +69,10 @@ class BasePage:
         """等待页面加载完成"""
         self.utils.wait_for_page_load(timeout)
 
+    def wait_for_settled(self, timeout: int = None, quiet_ms: int = 300) -> bool:
+        """等待网络请求结束且DOM不再变化"""
+        return self.utils.wait_for_settled(timeout, quiet_ms)
+
     def get_current_url(self) -> str:
         """获取当前URL"""
         return self.utils.get_current_url()
@@ -99,30 +130,63 @@ class BasePage:
         """等待元素可点击"""
         return self.utils.wait_for_element_clickable(locator, timeout)
 
-    def click_element(self, locator: tuple, timeout: int = None) -> bool:
-        """点击元素"""
-        return self.utils.click_element(locator, timeout)
+    def click_element(self, locator: tuple, timeout: int = None, settle: bool = False) -> bool:
+        """点击元素，settle为True时等待点击引发的请求和DOM变化结束"""
+        clicked = self.utils.click_element(locator, timeout)
+        if clicked and settle:
+            self.wait_for_settled()
+        return clicked
 
     def send_keys(self, locator: tuple, text: str, clear: bool = True, timeout: int = None) -> bool:
         """输入文本"""
         return self.utils.send_keys(locator, text, clear, timeout)
 
+    def fill_form(self, fields: dict, typed: tuple = (), timeout: int = None) -> bool:
+        """
+        批量填写表单
+
+        Args:
+            fields: {定位器: 值}
+            typed: 需要真实键盘输入的定位器（用于测试按键处理逻辑）
+            timeout: 等待超时时间
+
+        Returns:
+            是否所有字段都填写成功
+        """
+        return self.utils.fill_form(fields, typed, timeout)
+
     def get_text(self, locator: tuple, timeout: int = None) -> str:
         """获取元素文本"""
         return self.utils.get_text(locator, timeout)
 
+    def wait_for_text(self, locator: tuple, text: str, timeout: int = None) -> bool:
+        """等待元素文本包含指定内容"""
+        return self.utils.wait_for_text(locator, text, timeout)
+
     def get_attribute(self, locator: tuple, attribute: str, timeout: int = None) -> str:
         """获取元素属性"""
         return self.utils.get_attribute(locator, attribute, timeout)
 
-    def is_element_present(self, locator: tuple) -> bool:
+    def is_element_present(self, locator: tuple, timeout: int = None) -> bool:
         """检查元素是否存在"""
-        return self.utils.is_element_present(locator)
+        return self.utils.is_element_present(locator, timeout)
 
     def is_element_visible(self, locator: tuple, timeout: int = 3) -> bool:
         """检查元素是否可见"""
         return self.utils.is_element_visible(locator, timeout)
 
+    def is_element_invisible(self, locator: tuple, timeout: int = 3) -> bool:
+        """检查元素是否不可见"""
+        return self.utils.is_element_invisible(locator, timeout)
+
+    def wait_any(self, *locators: tuple, timeout: int = None, state: str = "visible") -> Optional[tuple]:
+        """等待任意一个元素满足条件，返回匹配的定位器"""
+        return self.utils.wait_any(*locators, timeout=timeout, state=state)
+
+    def wait_all(self, *locators: tuple, timeout: int = None, state: str = "visible") -> bool:
+        """等待所有元素满足条件"""
+        return self.utils.wait_all(*locators, timeout=timeout, state=state)
+
     def hover_element(self, locator: tuple, timeout: int = None) -> bool:
         """鼠标悬停"""
         return self.utils.hover_element(locator, timeout)
@@ -143,6 +207,56 @@ class BasePage:
         """获取元素列表"""
         return self.utils.find_elements(locator, timeout)
 
+    @classmethod
+    def declared_locators(cls) -> dict:
+        """
+        获取页面类及其父类中声明的所有定位器（大写的 (By.xxx, "...") 类属性）
+
+        Returns:
+            {属性名: 定位器元组}，子类中的同名定位器覆盖父类
+        """
+        strategies = {value for name, value in vars(By).items() if name.isupper()}
+        locators = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if (name.isupper() and isinstance(value, tuple) and len(value) == 2 and
+                        value[0] in strategies and isinstance(value[1], str)):
+                    locators[name] = value
+        return locators
+
+    def snapshot(self, names: List[str] = None) -> dict:
+        """
+        一次脚本调用获取页面声明的定位器状态
+
+        Args:
+            names: 需要的定位器属性名，默认全部声明的定位器
+
+        Returns:
+            {属性名: {"present", "visible", "count", "text", "texts", "value"}}
+        """
+        locators = self.declared_locators()
+        if names is not None:
+            locators = {name: locators[name] for name in names}
+        return self.utils.snapshot(locators)
+
+    def extract_products(self, timeout: int = None) -> List[dict]:
+        """
+        一次脚本调用提取页面上所有产品卡片
+
+        Args:
+            timeout: 页面上还没有产品卡片时的等待时间
+
+        Returns:
+            产品记录列表，每条包含 id/name/price/image/href
+        """
+        products = self.utils.extract_cached("products", PRODUCTS_EXTRACT_JS)
+        wait_time = self.utils.timeout if timeout is None else timeout
+        if not products and self.is_element_present((By.CLASS_NAME, "productinfo"), wait_time):
+            products = self.utils.extract_cached("products", PRODUCTS_EXTRACT_JS)
+
+        log.step(f"Extracted {len(products)} products")
+        return products
+
     def execute_javascript(self, script: str, *args):
         """执行JavaScript"""
         return self.utils.execute_javascript(script, *args)
@@ -177,7 +291,8 @@ class BasePage:
         log.assertion("Current URL verification", expected_url, actual_url)
         return is_match
 
-    def verify_element_text(self, locator: tuple, expected_text: str, timeout: int = None) -> bool:
+    def verify_element_text(self, locator: tuple, expected_text: str, timeout: int = None,
+                            wait_for_match: bool = False) -> bool:
         """
         验证元素文本
 
@@ -185,12 +300,17 @@ class BasePage:
             locator: 定位器
             expected_text: 期望的文本
             timeout: 等待超时时间
+            wait_for_match: 为True时等待文本变为期望值（文本异步更新的场景），默认取到文本后立即比较
 
         Returns:
             是否匹配
         """
-        actual_text = self.get_text(locator, timeout)
-        is_match = expected_text in actual_text
+        if wait_for_match:
+            is_match = self.utils.wait_for_text(locator, expected_text, timeout)
+            actual_text = self.get_text(locator, 0)
+        else:
+            actual_text = self.get_text(locator, timeout)
+            is_match = expected_text in actual_text
         log.assertion("Element text verification", expected_text, actual_text)
         return is_match
 
@@ -220,9 +340,9 @@ class BasePage:
         Returns:
             是否不可见
         """
-        is_visible = self.is_element_visible(locator, timeout)
-        log.assertion("Element invisibility", "not visible", "not visible" if not is_visible else "visible")
-        return not is_visible
+        is_invisible = self.is_element_invisible(locator, timeout)
+        log.assertion("Element invisibility", "not visible", "not visible" if is_invisible else "visible")
+        return is_invisible
 
     def wait_and_click(self, locator: tuple, timeout: int = None) -> bool:
         """
@@ -254,6 +374,10 @@ class BasePage:
         """
         return self.send_keys(locator, text, clear=True, timeout=timeout)
 
+    def dom(self) -> DomSnapshot:
+        """获取离线DOM快照，用于不关心可见性的只读检查"""
+        return self.utils.get_dom_snapshot()
+
     def get_page_source(self) -> str:
-        """获取页面源码"""
-        return self.driver.page_source
+        """获取页面源码（页面未变化时复用已获取的快照）"""
+        return self.dom().source
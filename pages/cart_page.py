@@ -4,6 +4,8 @@ AutomationExercise网站购物车页面
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -43,9 +45,9 @@ class CartPage(BasePage):
     # 总价区域
     TOTAL_AMOUNT = (By.XPATH, "//tr[@id='total_amount']//p")
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化购物车页面"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = f"{self.base_url}/view_cart"
 
     def open_cart_page(self):
@@ -57,8 +59,7 @@ class CartPage(BasePage):
     def verify_page_loaded(self) -> bool:
         """验证页面加载成功"""
         log.step("Verifying cart page loaded")
-        return (self.verify_element_visible(self.CART_TABLE) or
-                self.verify_element_visible(self.EMPTY_CART_MESSAGE))
+        return self.wait_any(self.CART_TABLE, self.EMPTY_CART_MESSAGE, timeout=3) is not None
 
     def verify_cart_table_visible(self) -> bool:
         """验证购物车表格可见"""
@@ -67,7 +68,8 @@ class CartPage(BasePage):
 
     def get_cart_item_count(self) -> int:
         """获取购物车商品数量"""
-        items = self.get_elements(self.CART_ITEMS)
+        # 页面已加载完成，空购物车时不等待商品行出现
+        items = self.get_elements(self.CART_ITEMS, timeout=0)
         count = len(items)
         log.step(f"Cart contains {count} items")
         return count
@@ -75,8 +77,8 @@ class CartPage(BasePage):
     def verify_cart_is_empty(self) -> bool:
         """验证购物车为空"""
         log.step("Verifying cart is empty")
-        return (self.verify_element_visible(self.EMPTY_CART_MESSAGE) or
-                self.get_cart_item_count() == 0)
+        return (self.get_cart_item_count() == 0 or
+                self.verify_element_visible(self.EMPTY_CART_MESSAGE, timeout=0))
 
     def verify_cart_has_items(self) -> bool:
         """验证购物车有商品"""
@@ -135,6 +137,7 @@ class CartPage(BasePage):
         delete_buttons = self.get_elements(self.DELETE_BUTTONS)
         if index < len(delete_buttons):
             delete_buttons[index].click()
+            self.wait_for_settled()
         else:
             log.error(f"Product index {index} not found")
 
@@ -212,7 +215,7 @@ class CartPage(BasePage):
     def click_proceed_to_checkout(self):
         """点击结账按钮"""
         log.step("Clicking proceed to checkout")
-        self.click_element(self.PROCEED_TO_CHECKOUT_BUTTON)
+        self.click_element(self.PROCEED_TO_CHECKOUT_BUTTON, settle=True)
         return self
 
     def verify_proceed_to_checkout_button(self) -> bool:
@@ -236,13 +239,8 @@ class CartPage(BasePage):
 
         # 删除所有商品
         while self.verify_cart_has_items():
+            # delete_first_product 会等待删除请求和表格更新完成
             self.delete_first_product()
-            # 等待页面更新
-            self.wait_for_page_load()
-
-            # 防止无限循环
-            import time
-            time.sleep(1)
 
         return self
 
@@ -250,11 +248,13 @@ class CartPage(BasePage):
         """获取购物车摘要信息"""
         log.step("Getting cart summary")
 
+        state = self.snapshot(["CART_ITEMS", "PRODUCT_NAMES", "TOTAL_AMOUNT", "EMPTY_CART_MESSAGE"])
+        item_count = state["CART_ITEMS"]["count"]
         summary = {
-            "item_count": self.get_cart_item_count(),
-            "product_names": self.get_product_names_in_cart(),
-            "total_amount": self.get_total_amount() if self.verify_total_amount_visible() else "N/A",
-            "is_empty": self.verify_cart_is_empty()
+            "item_count": item_count,
+            "product_names": state["PRODUCT_NAMES"]["texts"],
+            "total_amount": state["TOTAL_AMOUNT"]["text"] if state["TOTAL_AMOUNT"]["visible"] else "N/A",
+            "is_empty": item_count == 0 or state["EMPTY_CART_MESSAGE"]["visible"]
         }
 
         log.step(f"Cart summary: {summary}")
@@ -264,10 +264,11 @@ class CartPage(BasePage):
         """验证购物车页面关键元素"""
         log.step("Verifying cart page elements")
 
+        state = self.snapshot(["CART_ITEMS", "EMPTY_CART_MESSAGE", "CART_TABLE", "PROCEED_TO_CHECKOUT_BUTTON"])
+
         # 如果购物车为空，只需验证空消息
-        if self.verify_cart_is_empty():
-            return self.verify_element_visible(self.EMPTY_CART_MESSAGE)
+        if state["CART_ITEMS"]["count"] == 0 or state["EMPTY_CART_MESSAGE"]["visible"]:
+            return state["EMPTY_CART_MESSAGE"]["visible"]
 
         # 如果有商品，验证表格和结账按钮
-        return (self.verify_cart_table_visible() and
-                self.verify_proceed_to_checkout_button())
+        return state["CART_TABLE"]["visible"] and state["PROCEED_TO_CHECKOUT_BUTTON"]["visible"]
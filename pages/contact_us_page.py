@@ -4,6 +4,8 @@ AutomationExercise网站联系我们页面
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -36,9 +38,9 @@ class ContactUsPage(BasePage):
     # 联系信息区域
     CONTACT_INFO = (By.XPATH, "//div[@class='contact-info']")
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化联系我们页面"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = f"{self.base_url}/contact_us"
 
     def open_contact_us_page(self):
@@ -69,17 +71,12 @@ class ContactUsPage(BasePage):
         """
         log.step(f"Filling contact form - Name: {name}, Email: {email}")
 
-        # 填写姓名
-        self.send_keys(self.NAME_INPUT, name)
-
-        # 填写邮箱
-        self.send_keys(self.EMAIL_INPUT, email)
-
-        # 填写主题
-        self.send_keys(self.SUBJECT_INPUT, subject)
-
-        # 填写消息
-        self.send_keys(self.MESSAGE_TEXTAREA, message)
+        self.fill_form({
+            self.NAME_INPUT: name,
+            self.EMAIL_INPUT: email,
+            self.SUBJECT_INPUT: subject,
+            self.MESSAGE_TEXTAREA: message
+        })
 
         return self
 
@@ -146,8 +143,9 @@ class ContactUsPage(BasePage):
         # 提交表单
         self.click_submit_button()
 
-        # 处理可能的警告框
+        # 处理可能的警告框，确认后等待表单提交完成
         self.handle_alert()
+        self.wait_for_settled()
 
         return self
 
@@ -171,7 +169,7 @@ class ContactUsPage(BasePage):
     def click_home_button(self):
         """点击返回首页按钮"""
         log.step("Clicking home button")
-        self.click_element(self.HOME_BUTTON)
+        self.click_element(self.HOME_BUTTON, settle=True)
         return self
 
     def verify_form_fields_visible(self) -> bool:
@@ -186,11 +184,7 @@ class ContactUsPage(BasePage):
             self.SUBMIT_BUTTON
         ]
 
-        for field in required_fields:
-            if not self.verify_element_visible(field):
-                return False
-
-        return True
+        return self.wait_all(*required_fields, timeout=3)
 
     def clear_form(self):
         """清空表单"""
@@ -207,11 +201,12 @@ class ContactUsPage(BasePage):
         """获取表单字段值"""
         log.step("Getting form field values")
 
+        state = self.snapshot(["NAME_INPUT", "EMAIL_INPUT", "SUBJECT_INPUT", "MESSAGE_TEXTAREA"])
         return {
-            "name": self.get_attribute(self.NAME_INPUT, "value"),
-            "email": self.get_attribute(self.EMAIL_INPUT, "value"),
-            "subject": self.get_attribute(self.SUBJECT_INPUT, "value"),
-            "message": self.get_attribute(self.MESSAGE_TEXTAREA, "value")
+            "name": state["NAME_INPUT"]["value"] or "",
+            "email": state["EMAIL_INPUT"]["value"] or "",
+            "subject": state["SUBJECT_INPUT"]["value"] or "",
+            "message": state["MESSAGE_TEXTAREA"]["value"] or ""
         }
 
     def verify_form_validation(self) -> bool:
@@ -4,6 +4,8 @@ AutomationExercise网站首页
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -72,9 +74,9 @@ class HomePage(BasePage):
     # 页脚版权信息
     COPYRIGHT = (By.XPATH, "//p[contains(text(), 'Copyright')]")
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化首页"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = self.base_url
 
     def open_home_page(self):
@@ -86,37 +88,36 @@ class HomePage(BasePage):
     def verify_page_loaded(self) -> bool:
         """验证页面加载成功"""
         log.step("Verifying home page loaded")
-        return (self.verify_element_visible(self.LOGO) and
-                self.verify_element_visible(self.FEATURES_ITEMS_TITLE))
+        return self.wait_all(self.LOGO, self.FEATURES_ITEMS_TITLE, timeout=3)
 
     def click_products_link(self):
         """点击产品链接"""
         log.step("Clicking products link")
-        self.click_element(self.PRODUCTS_LINK)
+        self.click_element(self.PRODUCTS_LINK, settle=True)
         return self
 
     def click_cart_link(self):
         """点击购物车链接"""
         log.step("Clicking cart link")
-        self.click_element(self.CART_LINK)
+        self.click_element(self.CART_LINK, settle=True)
         return self
 
     def click_signup_login_link(self):
         """点击注册/登录链接"""
         log.step("Clicking signup/login link")
-        self.click_element(self.SIGNUP_LOGIN_LINK)
+        self.click_element(self.SIGNUP_LOGIN_LINK, settle=True)
         return self
 
     def click_contact_us_link(self):
         """点击联系我们链接"""
         log.step("Clicking contact us link")
-        self.click_element(self.CONTACT_US_LINK)
+        self.click_element(self.CONTACT_US_LINK, settle=True)
         return self
 
     def click_test_cases_link(self):
         """点击测试用例链接"""
         log.step("Clicking test cases link")
-        self.click_element(self.TEST_CASES_LINK)
+        self.click_element(self.TEST_CASES_LINK, settle=True)
         return self
 
     def expand_women_category(self):
@@ -141,21 +142,21 @@ class HomePage(BasePage):
         """点击女装连衣裙分类"""
         log.step("Clicking women dress category")
         self.expand_women_category()
-        self.click_element(self.WOMEN_DRESS)
+        self.click_element(self.WOMEN_DRESS, settle=True)
         return self
 
     def click_women_tops_category(self):
         """点击女装上衣分类"""
         log.step("Clicking women tops category")
         self.expand_women_category()
-        self.click_element(self.WOMEN_TOPS)
+        self.click_element(self.WOMEN_TOPS, settle=True)
         return self
 
     def click_men_tshirts_category(self):
         """点击男装T恤分类"""
         log.step("Clicking men tshirts category")
         self.expand_men_category()
-        self.click_element(self.MEN_TSHIRTS)
+        self.click_element(self.MEN_TSHIRTS, settle=True)
         return self
 
     def click_brand(self, brand_name: str):
@@ -167,7 +168,7 @@ class HomePage(BasePage):
         """
         log.step(f"Clicking brand: {brand_name}")
         brand_locator = (By.XPATH, f"//a[@href='/brand_products/{brand_name}']")
-        self.click_element(brand_locator)
+        self.click_element(brand_locator, settle=True)
         return self
 
     def get_product_count(self) -> int:
@@ -179,15 +180,13 @@ class HomePage(BasePage):
 
     def get_product_names(self) -> list:
         """获取所有产品名称"""
-        elements = self.get_elements(self.PRODUCT_NAMES)
-        names = [element.text for element in elements]
+        names = [product["name"] for product in self.extract_products()]
         log.step(f"Got product names: {names}")
         return names
 
     def get_product_prices(self) -> list:
         """获取所有产品价格"""
-        elements = self.get_elements(self.PRODUCT_PRICES)
-        prices = [element.text for element in elements]
+        prices = [product["price"] for product in self.extract_products()]
         log.step(f"Got product prices: {prices}")
         return prices
 
@@ -202,6 +201,7 @@ class HomePage(BasePage):
         buttons = self.get_elements(self.ADD_TO_CART_BUTTONS)
         if index < len(buttons):
             buttons[index].click()
+            self.wait_for_settled()
         return self
 
     def click_view_product_by_index(self, index: int = 0):
@@ -215,6 +215,7 @@ class HomePage(BasePage):
         links = self.get_elements(self.VIEW_PRODUCT_LINKS)
         if index < len(links):
             links[index].click()
+            self.wait_for_settled()
         return self
 
     def hover_on_product(self, index: int = 0):
@@ -252,7 +253,7 @@ class HomePage(BasePage):
             return False
 
         # 点击订阅按钮
-        if not self.click_element(self.SUBSCRIBE_BUTTON):
+        if not self.click_element(self.SUBSCRIBE_BUTTON, settle=True):
             return False
 
         # 验证成功消息
@@ -293,11 +294,12 @@ class HomePage(BasePage):
     def get_navigation_links(self) -> dict:
         """获取导航链接状态"""
         log.step("Getting navigation links status")
+        state = self.snapshot(["HOME_LINK", "PRODUCTS_LINK", "CART_LINK", "SIGNUP_LOGIN_LINK", "CONTACT_US_LINK"])
         links = {
-            "home": self.is_element_visible(self.HOME_LINK),
-            "products": self.is_element_visible(self.PRODUCTS_LINK),
-            "cart": self.is_element_visible(self.CART_LINK),
-            "signup_login": self.is_element_visible(self.SIGNUP_LOGIN_LINK),
-            "contact_us": self.is_element_visible(self.CONTACT_US_LINK)
+            "home": state["HOME_LINK"]["visible"],
+            "products": state["PRODUCTS_LINK"]["visible"],
+            "cart": state["CART_LINK"]["visible"],
+            "signup_login": state["SIGNUP_LOGIN_LINK"]["visible"],
+            "contact_us": state["CONTACT_US_LINK"]["visible"]
         }
         return links
@@ -4,6 +4,8 @@ AutomationExercise网站登录和注册页面
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -30,9 +32,12 @@ class LoginPage(BasePage):
     # 成功消息
     SUCCESS_MESSAGE = (By.CLASS_NAME, "alert-success")
 
-    def __init__(self, driver):
+    # 登录后导航栏显示的用户信息
+    LOGGED_IN_AS = (By.XPATH, "//a[contains(text(), 'Logged in as')]")
+
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化登录页面"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = f"{self.base_url}/login"
 
     def open_login_page(self):
@@ -44,8 +49,7 @@ class LoginPage(BasePage):
     def verify_page_loaded(self) -> bool:
         """验证页面加载成功"""
         log.step("Verifying login page loaded")
-        return (self.verify_element_visible(self.NEW_USER_SIGNUP) and
-                self.verify_element_visible(self.LOGIN_TO_ACCOUNT))
+        return self.wait_all(self.NEW_USER_SIGNUP, self.LOGIN_TO_ACCOUNT, timeout=3)
 
     def verify_signup_section_visible(self) -> bool:
         """验证注册区域可见"""
@@ -67,14 +71,8 @@ class LoginPage(BasePage):
         """
         log.step(f"Filling signup form with name: {name}, email: {email}")
 
-        # 输入姓名
-        if not self.send_keys(self.SIGNUP_NAME_INPUT, name):
-            log.error("Failed to enter signup name")
-            return False
-
-        # 输入邮箱
-        if not self.send_keys(self.SIGNUP_EMAIL_INPUT, email):
-            log.error("Failed to enter signup email")
+        if not self.fill_form({self.SIGNUP_NAME_INPUT: name, self.SIGNUP_EMAIL_INPUT: email}):
+            log.error("Failed to fill signup form")
             return False
 
         return True
@@ -82,7 +80,7 @@ class LoginPage(BasePage):
     def click_signup_button(self):
         """点击注册按钮"""
         log.step("Clicking signup button")
-        self.click_element(self.SIGNUP_BUTTON)
+        self.click_element(self.SIGNUP_BUTTON, settle=True)
         return self
 
     def signup_new_user(self, name: str, email: str):
@@ -108,14 +106,8 @@ class LoginPage(BasePage):
         """
         log.step(f"Filling login form with email: {email}")
 
-        # 输入邮箱
-        if not self.send_keys(self.LOGIN_EMAIL_INPUT, email):
-            log.error("Failed to enter login email")
-            return False
-
-        # 输入密码
-        if not self.send_keys(self.LOGIN_PASSWORD_INPUT, password):
-            log.error("Failed to enter login password")
+        if not self.fill_form({self.LOGIN_EMAIL_INPUT: email, self.LOGIN_PASSWORD_INPUT: password}):
+            log.error("Failed to fill login form")
             return False
 
         return True
@@ -123,7 +115,7 @@ class LoginPage(BasePage):
     def click_login_button(self):
         """点击登录按钮"""
         log.step("Clicking login button")
-        self.click_element(self.LOGIN_BUTTON)
+        self.click_element(self.LOGIN_BUTTON, settle=True)
         return self
 
     def login_user(self, email: str, password: str):
@@ -139,6 +131,29 @@ class LoginPage(BasePage):
         self.click_login_button()
         return self
 
+    def wait_for_login_result(self, timeout: int = 10) -> bool:
+        """
+        等待登录结果（出现已登录标识或登录错误消息）
+
+        Args:
+            timeout: 等待超时时间
+
+        Returns:
+            是否登录成功
+        """
+        log.step("Waiting for login result")
+        matched = self.wait_any(self.LOGGED_IN_AS, self.INCORRECT_LOGIN_ERROR, timeout=timeout)
+        if matched is None:
+            log.warning(f"No login result within {timeout} seconds")
+            return False
+
+        return matched == self.LOGGED_IN_AS
+
+    def verify_logged_in(self, timeout: int = 3) -> bool:
+        """验证当前为已登录状态"""
+        log.step("Verifying user logged in")
+        return self.verify_element_visible(self.LOGGED_IN_AS, timeout)
+
     def get_error_message(self) -> str:
         """获取错误消息"""
         log.step("Getting error message")
@@ -157,16 +172,12 @@ class LoginPage(BasePage):
     def verify_signup_form_fields(self) -> bool:
         """验证注册表单字段"""
         log.step("Verifying signup form fields")
-        return (self.verify_element_visible(self.SIGNUP_NAME_INPUT) and
-                self.verify_element_visible(self.SIGNUP_EMAIL_INPUT) and
-                self.verify_element_visible(self.SIGNUP_BUTTON))
+        return self.wait_all(self.SIGNUP_NAME_INPUT, self.SIGNUP_EMAIL_INPUT, self.SIGNUP_BUTTON, timeout=3)
 
     def verify_login_form_fields(self) -> bool:
         """验证登录表单字段"""
         log.step("Verifying login form fields")
-        return (self.verify_element_visible(self.LOGIN_EMAIL_INPUT) and
-                self.verify_element_visible(self.LOGIN_PASSWORD_INPUT) and
-                self.verify_element_visible(self.LOGIN_BUTTON))
+        return self.wait_all(self.LOGIN_EMAIL_INPUT, self.LOGIN_PASSWORD_INPUT, self.LOGIN_BUTTON, timeout=3)
 
     def clear_signup_form(self):
         """清空注册表单"""
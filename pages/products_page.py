@@ -4,6 +4,8 @@ AutomationExercise网站产品页面
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -53,9 +55,9 @@ class ProductsPage(BasePage):
     # 无产品消息
     NO_PRODUCTS_MESSAGE = (By.XPATH, "//p[contains(text(), 'No products found')]")
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化产品页面"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = f"{self.base_url}/products"
 
     def open_products_page(self):
@@ -87,7 +89,7 @@ class ProductsPage(BasePage):
         self.send_keys(self.SEARCH_INPUT, search_term)
 
         # 点击搜索按钮
-        self.click_element(self.SEARCH_BUTTON)
+        self.click_element(self.SEARCH_BUTTON, settle=True)
 
         return self
 
@@ -105,15 +107,13 @@ class ProductsPage(BasePage):
 
     def get_product_names(self) -> list:
         """获取所有产品名称"""
-        elements = self.get_elements(self.PRODUCT_NAMES)
-        names = [element.text for element in elements if element.text.strip()]
+        names = [product["name"] for product in self.extract_products() if product["name"]]
         log.step(f"Got product names: {names}")
         return names
 
     def get_product_prices(self) -> list:
         """获取所有产品价格"""
-        elements = self.get_elements(self.PRODUCT_PRICES)
-        prices = [element.text for element in elements if element.text.strip()]
+        prices = [product["price"] for product in self.extract_products() if product["price"]]
         log.step(f"Got product prices: {prices}")
         return prices
 
@@ -136,6 +136,7 @@ class ProductsPage(BasePage):
             # 滚动到元素
             self.scroll_to_element(self.VIEW_PRODUCT_LINKS)
             view_links[index].click()
+            self.wait_for_settled()
         else:
             log.error(f"Product index {index} not found")
 
@@ -161,6 +162,7 @@ class ProductsPage(BasePage):
             # 滚动到元素
             self.scroll_to_element(self.ADD_TO_CART_BUTTONS)
             add_buttons[index].click()
+            self.wait_for_settled()
         else:
             log.error(f"Product index {index} not found")
 
@@ -192,7 +194,7 @@ class ProductsPage(BasePage):
     def click_overlay_add_to_cart(self):
         """点击叠加层的添加到购物车按钮"""
         log.step("Clicking overlay add to cart")
-        self.click_element(self.OVERLAY_ADD_TO_CART)
+        self.click_element(self.OVERLAY_ADD_TO_CART, settle=True)
         return self
 
     def verify_modal_appeared(self) -> bool:
@@ -203,13 +205,13 @@ class ProductsPage(BasePage):
     def click_continue_shopping(self):
         """点击继续购物按钮"""
         log.step("Clicking continue shopping")
-        self.click_element(self.CONTINUE_SHOPPING_BUTTON)
+        self.click_element(self.CONTINUE_SHOPPING_BUTTON, settle=True)
         return self
 
     def click_view_cart_from_modal(self):
         """从模态框点击查看购物车"""
         log.step("Clicking view cart from modal")
-        self.click_element(self.VIEW_CART_BUTTON)
+        self.click_element(self.VIEW_CART_BUTTON, settle=True)
         return self
 
     def search_and_verify_results(self, search_term: str) -> bool:
@@ -280,8 +282,9 @@ class ProductsPage(BasePage):
         """获取可用品牌列表"""
         log.step("Getting available brands")
 
-        brand_elements = self.get_elements(self.BRAND_LINKS)
-        brands = [element.text for element in brand_elements if element.text.strip()]
+        # 链接内的 <span>(6)</span> 是商品数角标，只取品牌名本身；站点CSS把品牌名显示为大写，
+        # 返回值与浏览器渲染的文本（WebElement.text）保持一致
+        brands = [text.upper() for text in self.dom().get_own_texts(self.BRAND_LINKS) if text]
 
         log.step(f"Found brands: {brands}")
         return brands
@@ -296,7 +299,7 @@ class ProductsPage(BasePage):
         log.step(f"Clicking brand: {brand_name}")
 
         brand_locator = (By.XPATH, f"//a[contains(@href, '/brand_products/{brand_name}')]")
-        self.click_element(brand_locator)
+        self.click_element(brand_locator, settle=True)
 
         return self
 
@@ -4,6 +4,8 @@ AutomationExercise网站用户注册详细信息页面
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config_manager import ConfigManager
+from utils.webdriver_utils import WebDriverUtils
 from utils.logger import log
 
 
@@ -53,9 +55,9 @@ class SignupPage(BasePage):
     # 错误消息
     ERROR_MESSAGE = (By.CLASS_NAME, "alert-danger")
 
-    def __init__(self, driver):
+    def __init__(self, driver, config: ConfigManager = None, utils: WebDriverUtils = None):
         """初始化注册表单页面"""
-        super().__init__(driver)
+        super().__init__(driver, config, utils)
         self.page_url = f"{self.base_url}/signup"
 
     def verify_page_loaded(self) -> bool:
@@ -100,18 +102,19 @@ class SignupPage(BasePage):
         """
         log.step("Filling account information")
 
-        # 输入密码
-        self.send_keys(self.PASSWORD_INPUT, password)
+        fields = {self.PASSWORD_INPUT: password}
 
         # 选择生日（如果提供）
         if birth_day:
-            self.select_dropdown_by_value(self.BIRTH_DAY_SELECT, birth_day)
+            fields[self.BIRTH_DAY_SELECT] = birth_day
 
         if birth_month:
-            self.select_dropdown_by_text(self.BIRTH_MONTH_SELECT, birth_month)
+            fields[self.BIRTH_MONTH_SELECT] = birth_month
 
         if birth_year:
-            self.select_dropdown_by_value(self.BIRTH_YEAR_SELECT, birth_year)
+            fields[self.BIRTH_YEAR_SELECT] = birth_year
+
+        self.fill_form(fields)
 
         return self
 
@@ -136,43 +139,23 @@ class SignupPage(BasePage):
         """
         log.step("Filling address information")
 
-        # 填写姓名
-        if "first_name" in user_data:
-            self.send_keys(self.FIRST_NAME_INPUT, user_data["first_name"])
-
-        if "last_name" in user_data:
-            self.send_keys(self.LAST_NAME_INPUT, user_data["last_name"])
-
-        # 填写公司（可选）
-        if "company" in user_data:
-            self.send_keys(self.COMPANY_INPUT, user_data["company"])
-
-        # 填写地址
-        if "address" in user_data:
-            self.send_keys(self.ADDRESS1_INPUT, user_data["address"])
-
-        if "address2" in user_data:
-            self.send_keys(self.ADDRESS2_INPUT, user_data["address2"])
-
-        # 选择国家
-        if "country" in user_data:
-            self.select_dropdown_by_text(self.COUNTRY_SELECT, user_data["country"])
-
-        # 填写州/省
-        if "state" in user_data:
-            self.send_keys(self.STATE_INPUT, user_data["state"])
-
-        # 填写城市
-        if "city" in user_data:
-            self.send_keys(self.CITY_INPUT, user_data["city"])
-
-        # 填写邮编
-        if "zipcode" in user_data:
-            self.send_keys(self.ZIPCODE_INPUT, user_data["zipcode"])
-
-        # 填写手机号
-        if "mobile_number" in user_data:
-            self.send_keys(self.MOBILE_NUMBER_INPUT, user_data["mobile_number"])
+        # 用户数据字段到表单定位器的映射，按表单顺序填写
+        field_locators = {
+            "first_name": self.FIRST_NAME_INPUT,
+            "last_name": self.LAST_NAME_INPUT,
+            "company": self.COMPANY_INPUT,
+            "address": self.ADDRESS1_INPUT,
+            "address2": self.ADDRESS2_INPUT,
+            "country": self.COUNTRY_SELECT,
+            "state": self.STATE_INPUT,
+            "city": self.CITY_INPUT,
+            "zipcode": self.ZIPCODE_INPUT,
+            "mobile_number": self.MOBILE_NUMBER_INPUT
+        }
+
+        self.fill_form({
+            locator: user_data[key] for key, locator in field_locators.items() if key in user_data
+        })
 
         return self
 
@@ -180,7 +163,7 @@ class SignupPage(BasePage):
         """点击创建账户按钮"""
         log.step("Clicking create account button")
         self.scroll_to_element(self.CREATE_ACCOUNT_BUTTON)
-        self.click_element(self.CREATE_ACCOUNT_BUTTON)
+        self.click_element(self.CREATE_ACCOUNT_BUTTON, settle=True)
         return self
 
     def complete_registration(self, user_data: dict):
@@ -268,11 +251,7 @@ class SignupPage(BasePage):
             self.MOBILE_NUMBER_INPUT
         ]
 
-        for field in required_fields:
-            if not self.verify_element_visible(field):
-                return False
-
-        return True
+        return self.wait_all(*required_fields, timeout=3)
 
     def get_selected_country(self) -> str:
         """获取选中的国家"""
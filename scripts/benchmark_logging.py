@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+日志开销基准测试
+比较WebDriverUtils热路径上一次 page_action 调用在原实现（立即格式化、全部输出）和
+新实现（延迟构造消息，verbose/quiet 两种模式）下的耗时
+
+运行: python -m scripts.benchmark_logging
+"""
+import argparse
+import copy
+import sys
+import timeit
+from contextlib import contextmanager
+
+import loguru
+from selenium.webdriver.common.by import By
+
+import utils.logger as logger_module
+from utils.logger import Logger
+
+
+LOCATOR = (By.XPATH, "//div[@class='productinfo text-center']/p")
+TEXT = "Blue Top"
+LOG_FORMAT = "{time} | {level} | {name}:{function}:{line} | {message}"
+
+
+def isolated_loguru():
+    """
+    复制一个独立的loguru实例，只带一个空sink，不影响进程全局logger的sink
+
+    标准输出/错误流按原对象共享而不是复制（它们不能被deepcopy）
+    """
+    isolated = copy.deepcopy(loguru.logger, {id(sys.stdout): sys.stdout, id(sys.stderr): sys.stderr})
+    isolated.remove()
+    return isolated
+
+
+@contextmanager
+def patched_loguru(isolated):
+    """在构造Logger期间让utils.logger使用独立的loguru实例"""
+    original = logger_module.logger
+    logger_module.logger = isolated
+    try:
+        yield
+    finally:
+        logger_module.logger = original
+
+
+def build_logger(profile: str) -> Logger:
+    """创建指定模式的日志管理器，输出到空sink，只测量日志本身的开销"""
+    isolated = isolated_loguru()
+    with patched_loguru(isolated):
+        instance = Logger(profile=profile)
+    # 去掉Logger添加的控制台/文件sink，换成空sink
+    isolated.remove()
+    isolated.add(lambda message: None, format=LOG_FORMAT)
+    return instance
+
+
+def build_baseline():
+    """原实现：每次调用都拼接消息并交给loguru，由级别过滤决定是否输出"""
+    isolated = isolated_loguru()
+    isolated.add(lambda message: None, format=LOG_FORMAT)
+    bound = isolated.bind(name="AutomationTest")
+
+    def page_action(action: str, element: str = None):
+        element_info = f" on '{element}'" if element else ""
+        bound.info(f"🔄 Page Action: {action}{element_info}")
+
+    return page_action
+
+
+def measure(statement, number: int) -> float:
+    """返回单次调用的平均耗时（微秒）"""
+    return min(timeit.repeat(statement, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="日志开销基准测试")
+    parser.add_argument("--number", type=int, default=20000, help="每组调用次数")
+    args = parser.parse_args()
+
+    baseline = build_baseline()
+    verbose = build_logger("verbose")
+    quiet = build_logger("quiet")
+
+    # 场景 -> (原实现的调用, 新实现的调用)
+    cases = {
+        "取文本": (
+            lambda: baseline("Got text", f"{LOCATOR[0]}='{LOCATOR[1]}' text='{TEXT}'"),
+            lambda log: log.page_action("Got text", lambda: f"{LOCATOR[0]}='{LOCATOR[1]}' text='{TEXT}'")
+        ),
+        "查找元素": (
+            lambda: baseline("Found element", f"{LOCATOR[0]}='{LOCATOR[1]}'"),
+            lambda log: log.page_action("Found element", LOCATOR)
+        )
+    }
+
+    print(f"{'场景':<10}{'原实现(μs)':>12}{'新verbose(μs)':>16}{'新quiet(μs)':>14}{'quiet加速':>10}")
+    for name, (old_call, new_call) in cases.items():
+        old = measure(old_call, args.number)
+        new_verbose = measure(lambda: new_call(verbose), args.number)
+        new_quiet = measure(lambda: new_call(quiet), args.number)
+        print(f"{name:<10}{old:>12.3f}{new_verbose:>16.3f}{new_quiet:>14.3f}{old / new_quiet:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
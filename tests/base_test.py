@@ -5,6 +5,7 @@
 import pytest
 import allure
 import time
+from functools import cached_property
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from pages.signup_page import SignupPage
@@ -13,6 +14,7 @@ from pages.products_page import ProductsPage
 from pages.contact_us_page import ContactUsPage
 from pages.cart_page import CartPage
 from utils.logger import log
+from utils.webdriver_utils import WebDriverUtils
 
 
 class BaseTest:
@@ -29,20 +31,50 @@ class BaseTest:
         log.test_end(method.__name__, "COMPLETED", duration)
 
     @pytest.fixture(autouse=True)
-    def setup(self, browser_setup, config, test_data):
+    def setup(self, browser_setup, config, test_data, auth_session):
         """自动设置fixture"""
         self.driver = browser_setup
         self.config = config
         self.test_data = test_data
-
-        # 初始化页面对象
-        self.home_page = HomePage(self.driver)
-        self.login_page = LoginPage(self.driver)
-        self.signup_page = SignupPage(self.driver)
-        self.account_created_page = AccountCreatedPage(self.driver)
-        self.products_page = ProductsPage(self.driver)
-        self.contact_us_page = ContactUsPage(self.driver)
-        self.cart_page = CartPage(self.driver)
+        self.auth_session = auth_session
+
+        # 页面对象按需创建，共享同一个配置和WebDriver工具实例
+        self.utils = WebDriverUtils(self.driver, self.config.explicit_wait)
+
+    @cached_property
+    def home_page(self) -> HomePage:
+        """首页页面对象"""
+        return HomePage(self.driver, self.config, self.utils)
+
+    @cached_property
+    def login_page(self) -> LoginPage:
+        """登录页面对象"""
+        return LoginPage(self.driver, self.config, self.utils)
+
+    @cached_property
+    def signup_page(self) -> SignupPage:
+        """注册页面对象"""
+        return SignupPage(self.driver, self.config, self.utils)
+
+    @cached_property
+    def account_created_page(self) -> AccountCreatedPage:
+        """账户创建成功页面对象"""
+        return AccountCreatedPage(self.driver, self.config, self.utils)
+
+    @cached_property
+    def products_page(self) -> ProductsPage:
+        """产品页面对象"""
+        return ProductsPage(self.driver, self.config, self.utils)
+
+    @cached_property
+    def contact_us_page(self) -> ContactUsPage:
+        """联系我们页面对象"""
+        return ContactUsPage(self.driver, self.config, self.utils)
+
+    @cached_property
+    def cart_page(self) -> CartPage:
+        """购物车页面对象"""
+        return CartPage(self.driver, self.config, self.utils)
 
     def take_screenshot(self, name: str = None) -> str:
         """
@@ -102,6 +134,18 @@ class BaseTest:
                 log.error(f"{page_name}页面加载失败")
             return is_loaded
 
+    def wait_for_settled(self, timeout: int = None) -> bool:
+        """
+        等待页面网络请求结束且DOM不再变化，替代固定时长的sleep
+
+        Args:
+            timeout: 等待超时时间
+
+        Returns:
+            是否在超时前进入空闲状态
+        """
+        return self.utils.wait_for_settled(timeout)
+
     def navigate_to_home(self):
         """导航到首页"""
         with allure.step("导航到首页"):
@@ -143,7 +187,7 @@ class BaseTest:
             是否注册成功
         """
         if user_data is None:
-            user_data = self.test_data.generate_test_user()
+            user_data = self.test_data.next_test_user()
 
         with allure.step(f"注册新用户: {user_data['first_name']} {user_data['last_name']}"):
             # 导航到登录页面
@@ -183,23 +227,12 @@ class BaseTest:
             password = user_data.get("valid_user", {}).get("password", "Test123456")
 
         with allure.step(f"用户登录: {email}"):
-            # 导航到登录页面
-            if not self.navigate_to_login():
-                return False
-
-            # 执行登录
-            self.login_page.login_user(email, password)
-
-            # 验证登录成功（通过URL变化或页面元素）
-            time.sleep(2)  # 等待页面跳转
-            current_url = self.driver.current_url
-
-            # 如果URL包含login，说明登录失败
-            if "/login" in current_url:
-                log.error("登录失败，仍在登录页面")
+            # 每个工作进程只走一次登录表单，之后注入缓存的Cookie
+            if not self.auth_session.login(self.driver, email, password):
+                log.error("登录失败")
                 return False
 
-            log.step(f"登录成功，当前URL: {current_url}")
+            log.step(f"登录成功，当前URL: {self.driver.current_url}")
             return True
 
     def add_product_to_cart(self, product_index: int = 0) -> bool:
@@ -220,8 +253,8 @@ class BaseTest:
             # 添加产品到购物车
             self.home_page.add_product_to_cart_by_index(product_index)
 
-            # 等待模态框出现
-            time.sleep(2)
+            # 等待添加请求完成、模态框出现
+            self.wait_for_settled()
 
             return True
 
@@ -0,0 +1,86 @@
+"""
+登录会话缓存测试
+使用模拟的WebDriver和登录函数验证Cookie缓存的命中规则，不需要浏览器
+"""
+import allure
+import pytest
+from utils.auth_session import AuthSessionCache
+
+
+EMAIL = "user@example.com"
+PASSWORD = "Secret123"
+
+
+class FakeDriver:
+    """记录Cookie的模拟WebDriver"""
+
+    def __init__(self):
+        self.cookies = []
+
+    def get(self, url):
+        pass
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+
+@pytest.fixture
+def form_logins():
+    """登录表单被调用的记录"""
+    return []
+
+
+@pytest.fixture
+def cache(form_logins):
+    """只有 EMAIL/PASSWORD 能通过表单登录的会话缓存"""
+    def login_via_form(driver, email, password):
+        form_logins.append((email, password))
+        if (email, password) != (EMAIL, PASSWORD):
+            return False
+        driver.add_cookie({"name": "sessionid", "value": "abc", "sameSite": "Lax"})
+        return True
+
+    return AuthSessionCache(
+        base_url="https://example.com/",
+        login_func=login_via_form,
+        check_func=lambda driver: any(cookie["name"] == "sessionid" for cookie in driver.cookies)
+    )
+
+
+@allure.feature("登录会话缓存")
+class TestAuthSessionCache:
+    """登录会话缓存测试类"""
+
+    @allure.title("同一账户第二次登录注入缓存的Cookie")
+    def test_second_login_uses_cookies(self, cache, form_logins):
+        """只有第一次走登录表单，sameSite字段不回写"""
+        assert cache.login(FakeDriver(), EMAIL, PASSWORD)
+        driver = FakeDriver()
+        assert cache.login(driver, EMAIL, PASSWORD)
+
+        assert form_logins == [(EMAIL, PASSWORD)]
+        assert driver.cookies == [{"name": "sessionid", "value": "abc"}]
+
+    @allure.title("错误密码不命中缓存")
+    def test_wrong_password_not_served_from_cache(self, cache, form_logins):
+        """缓存按邮箱和密码区分，错误密码必须走表单并失败"""
+        assert cache.login(FakeDriver(), EMAIL, PASSWORD)
+
+        assert not cache.login(FakeDriver(), EMAIL, "wrong")
+        assert form_logins == [(EMAIL, PASSWORD), (EMAIL, "wrong")]
+
+        # 错误密码的失败不影响正确密码的缓存
+        assert cache.login(FakeDriver(), EMAIL, PASSWORD)
+        assert len(form_logins) == 2
+
+    @allure.title("清除缓存后重新走登录表单")
+    def test_invalidate_forces_form_login(self, cache, form_logins):
+        """invalidate(email) 清除该邮箱的所有缓存"""
+        assert cache.login(FakeDriver(), EMAIL, PASSWORD)
+        cache.invalidate(EMAIL)
+
+        assert cache.login(FakeDriver(), EMAIL, PASSWORD)
+        assert len(form_logins) == 2
@@ -43,7 +43,7 @@ class TestCart(BaseTest):
             # 清空购物车以确保测试环境
             if self.cart_page.verify_cart_has_items():
                 self.cart_page.clear_cart()
-                time.sleep(2)
+                self.wait_for_settled()
 
             is_empty = self.cart_page.verify_cart_is_empty()
             self.assert_with_screenshot(
@@ -72,7 +72,7 @@ class TestCart(BaseTest):
 
         with allure.step("添加第一个产品到购物车"):
             self.home_page.add_product_to_cart_by_index(0)
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("导航到购物车页面"):
             self.navigate_to_cart()
@@ -108,7 +108,7 @@ class TestCart(BaseTest):
 
         with allure.step("添加产品到购物车"):
             self.products_page.add_first_product_to_cart()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证模态框并查看购物车"):
             if self.products_page.verify_modal_appeared():
@@ -149,7 +149,7 @@ class TestCart(BaseTest):
 
         with allure.step("删除第一个商品"):
             self.cart_page.delete_first_product()
-            time.sleep(3)  # 等待页面更新
+            self.wait_for_settled()  # 等待页面更新
 
         with allure.step("验证商品已删除"):
             final_count = self.cart_page.get_cart_item_count()
@@ -233,7 +233,7 @@ class TestCart(BaseTest):
         with allure.step("更新第一个商品数量"):
             new_quantity = "2"
             self.cart_page.update_product_quantity(0, new_quantity)
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证数量已更新"):
             # 注意：实际网站可能需要刷新页面或点击更新按钮
@@ -263,7 +263,7 @@ class TestCart(BaseTest):
 
         with allure.step("添加第一个商品"):
             self.home_page.add_product_to_cart_by_index(0)
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("添加第二个商品"):
             # 可能需要关闭模态框或继续购物
@@ -271,12 +271,12 @@ class TestCart(BaseTest):
                 # 如果有继续购物按钮，点击它
                 if self.home_page.verify_element_visible((By.XPATH, "//button[text()='Continue Shopping']"), timeout=3):
                     self.home_page.click_element((By.XPATH, "//button[text()='Continue Shopping']"))
-                    time.sleep(1)
+                    self.wait_for_settled()
             except:
                 pass
 
             self.home_page.add_product_to_cart_by_index(1)
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("导航到购物车页面"):
             self.navigate_to_cart()
@@ -307,7 +307,7 @@ class TestCart(BaseTest):
 
         with allure.step("点击结账按钮"):
             self.cart_page.click_proceed_to_checkout()
-            time.sleep(3)
+            self.wait_for_settled()
 
         with allure.step("验证跳转"):
             current_url = self.cart_page.get_current_url()
@@ -385,7 +385,7 @@ class TestCart(BaseTest):
 
         with allure.step("导航到其他页面"):
             self.navigate_to_home()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("返回购物车页面"):
             self.navigate_to_cart()
@@ -426,7 +426,7 @@ class TestCart(BaseTest):
             if self.cart_page.verify_cart_has_items():
                 start_time = time.time()
                 self.cart_page.delete_first_product()
-                time.sleep(3)
+                self.wait_for_settled()
                 delete_time = time.time() - start_time
                 log.performance("Delete from cart time", delete_time, "seconds")
 
@@ -0,0 +1,82 @@
+"""
+WebDriver命令分析器测试
+使用模拟的command_executor验证命令记录和N+1检测，不需要浏览器
+"""
+import allure
+import pytest
+from utils.command_profiler import CommandProfiler
+from utils.round_trip_analyzer import RoundTripAnalyzer
+
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+ELEMENT_IDS = ["el-1", "el-2", "el-3", "el-4"]
+
+
+class FakeExecutor:
+    """模拟的命令执行器：findElements返回固定的元素引用，其他命令返回空值"""
+
+    def execute(self, command, params):
+        if command == "findElements":
+            return {"value": [{ELEMENT_KEY: element_id} for element_id in ELEMENT_IDS]}
+        return {"value": None}
+
+
+class FakeDriver:
+    """只提供command_executor的模拟WebDriver"""
+
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """已附加到模拟WebDriver的命令分析器"""
+    driver = FakeDriver()
+    profiler = CommandProfiler(report_dir=str(tmp_path), analyzer=RoundTripAnalyzer(min_elements=3))
+    profiler.attach(driver)
+    profiler.start_test("test_command_profiler")
+    return profiler, driver.command_executor
+
+
+@allure.feature("WebDriver命令分析")
+class TestCommandProfiler:
+    """WebDriver命令分析器测试类"""
+
+    @allure.story("N+1检测")
+    @allure.title("get_attribute循环被识别为N+1")
+    def test_attribute_loop_detected(self, profiler):
+        """Selenium 4 的 get_attribute 通过 w3cExecuteScript 发送，元素引用在 args 中"""
+        profiler, executor = profiler
+        response = executor.execute("findElements", {"using": "css selector", "value": ".cart_quantity"})
+        for element in response["value"]:
+            executor.execute("w3cExecuteScript", {"script": "return getAttribute(...)", "args": [element, "value"]})
+
+        findings = profiler.stop_test()["n_plus_one"]
+
+        assert len(findings) == 1
+        assert findings[0]["command"] == "w3cExecuteScript"
+        assert findings[0]["lookup"] == "findElements"
+        assert findings[0]["elements"] == len(ELEMENT_IDS)
+
+    @allure.story("N+1检测")
+    @allure.title("元素命令循环被识别为N+1")
+    def test_element_command_loop_detected(self, profiler):
+        """getElementText 等命令的元素引用在 params["id"] 中"""
+        profiler, executor = profiler
+        response = executor.execute("findElements", {"using": "css selector", "value": ".productinfo p"})
+        for element in response["value"]:
+            executor.execute("getElementText", {"id": element[ELEMENT_KEY]})
+
+        findings = profiler.stop_test()["n_plus_one"]
+
+        assert [finding["command"] for finding in findings] == ["getElementText"]
+
+    @allure.story("N+1检测")
+    @allure.title("单次脚本调用不算N+1")
+    def test_single_script_not_reported(self, profiler):
+        """不带元素参数的脚本调用不归属到任何查找"""
+        profiler, executor = profiler
+        executor.execute("findElements", {"using": "css selector", "value": ".cart_quantity"})
+        executor.execute("w3cExecuteScript", {"script": "return 1", "args": []})
+
+        assert profiler.stop_test()["n_plus_one"] == []
@@ -0,0 +1,78 @@
+"""
+配置管理器测试
+验证get()缓存、返回值隔离、环境变量覆盖和配置文件变更后的重新加载，不需要浏览器
+"""
+import os
+import allure
+import pytest
+from utils.config_manager import ConfigManager
+
+
+CONFIG_TEXT = """
+browser:
+  default: "chrome"
+  explicit_wait: 15
+browsers:
+  chrome:
+    options:
+      - "--no-sandbox"
+"""
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """使用临时配置文件的配置管理器，工作目录中没有.env"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("BROWSER_DEFAULT", raising=False)
+    monkeypatch.delenv("BROWSER_EXPLICIT_WAIT", raising=False)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIG_TEXT, encoding="utf-8")
+    return ConfigManager(str(config_file))
+
+
+@allure.feature("配置管理")
+class TestConfigManager:
+    """配置管理器测试类"""
+
+    @allure.title("配置文件中的值被缓存")
+    def test_file_value_cached(self, config):
+        """第二次get()直接命中缓存，不再解析配置字典"""
+        assert config.get("browser.default") == "chrome"
+        config.config["browser"]["default"] = "firefox"
+
+        assert config.get("browser.default") == "chrome"
+        assert config.get("browser.missing", 42) == 42
+
+    @allure.title("修改返回的列表不影响缓存")
+    def test_returned_containers_are_copies(self, config):
+        """字典和列表返回副本"""
+        options = config.get("browsers.chrome.options")
+        options.append("--headless")
+        config.get("browsers.chrome")["options"].clear()
+
+        assert config.get("browsers.chrome.options") == ["--no-sandbox"]
+        assert config.config["browsers"]["chrome"]["options"] == ["--no-sandbox"]
+
+    @allure.title("首次get()之后设置的环境变量立即生效")
+    def test_env_override_not_cached(self, config, monkeypatch):
+        """环境变量不进入缓存"""
+        assert config.get("browser.explicit_wait") == 15
+
+        monkeypatch.setenv("BROWSER_EXPLICIT_WAIT", "30")
+        assert config.get("browser.explicit_wait") == 30
+
+        monkeypatch.delenv("BROWSER_EXPLICIT_WAIT")
+        assert config.get("browser.explicit_wait") == 15
+
+    @allure.title("配置文件修改后重新加载")
+    def test_reload_on_mtime_change(self, config, tmp_path):
+        """修改时间变化后清空缓存并读取新内容"""
+        config.RELOAD_CHECK_INTERVAL = 0
+        assert config.get("browser.default") == "chrome"
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(CONFIG_TEXT.replace('"chrome"', '"edge"'), encoding="utf-8")
+        mtime = os.stat(config_file).st_mtime + 10
+        os.utime(config_file, (mtime, mtime))
+
+        assert config.get("browser.default") == "edge"
@@ -58,7 +58,7 @@ class TestContactUs(BaseTest):
 
             # 处理可能的JavaScript警告框
             self.contact_us_page.handle_alert()
-            time.sleep(3)
+            self.wait_for_settled()
 
         with allure.step("验证成功消息"):
             success = self.contact_us_page.verify_success_message()
@@ -95,7 +95,7 @@ class TestContactUs(BaseTest):
 
         with allure.step("直接提交空表单"):
             self.contact_us_page.click_submit_button()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证表单验证"):
             # 检查HTML5表单验证或仍在当前页面
@@ -122,7 +122,7 @@ class TestContactUs(BaseTest):
 
         with allure.step("提交表单"):
             self.contact_us_page.click_submit_button()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证邮箱验证"):
             # 验证HTML5邮箱验证或仍在当前页面
@@ -154,7 +154,7 @@ class TestContactUs(BaseTest):
 
             self.contact_us_page.click_submit_button()
             self.contact_us_page.handle_alert()
-            time.sleep(3)
+            self.wait_for_settled()
 
             if should_succeed:
                 # 应该成功提交
@@ -196,7 +196,7 @@ class TestContactUs(BaseTest):
 
             with allure.step("提交包含文件的表单"):
                 self.contact_us_page.submit_contact_form(contact_data, absolute_path)
-                time.sleep(3)
+                self.wait_for_settled()
 
             with allure.step("验证提交成功"):
                 success = self.contact_us_page.verify_success_message()
@@ -227,7 +227,7 @@ class TestContactUs(BaseTest):
             # 注意：需要确认网站是否有返回首页按钮
             if self.contact_us_page.verify_element_visible(self.contact_us_page.HOME_BUTTON):
                 self.contact_us_page.click_home_button()
-                time.sleep(2)
+                self.wait_for_settled()
 
                 current_url = self.driver.current_url
                 self.assert_with_screenshot(
@@ -324,10 +324,10 @@ class TestContactUs(BaseTest):
 
                 self.contact_us_page.click_submit_button()
                 self.contact_us_page.handle_alert()
-                time.sleep(3)
+                self.wait_for_settled()
 
                 # 验证页面没有执行恶意脚本
-                page_source = self.driver.page_source
+                page_source = self.contact_us_page.get_page_source()
                 self.assert_with_screenshot(
                     payload not in page_source or "alert" not in page_source,
                     f"XSS payload应该被过滤: {payload}"
@@ -355,7 +355,7 @@ class TestContactUs(BaseTest):
         with allure.step("模拟网络中断后恢复"):
             # 刷新页面来模拟网络问题恢复
             self.contact_us_page.refresh_page()
-            time.sleep(3)
+            self.wait_for_settled()
 
         with allure.step("验证页面恢复"):
             assert self.contact_us_page.verify_page_loaded(), "页面应该能够恢复正常"
@@ -0,0 +1,68 @@
+"""
+数据管理器测试
+验证按测试ID重设种子后数据可复现、多语言混合以及Faker代理的复制，不需要浏览器
+"""
+import copy
+import pickle
+import allure
+import pytest
+from utils.config_manager import ConfigManager
+from utils.data_manager import DataManager, LazyFaker
+
+
+NODE_ID = "tests/test_user_authentication.py::TestUserAuthentication::test_user_registration"
+
+
+def build_users(seed: int, node_id: str, count: int = 3) -> list:
+    """用指定的运行种子和测试ID生成若干用户"""
+    data_manager = DataManager(ConfigManager.get_instance(), seed=seed)
+    data_manager.reseed(node_id)
+    return [data_manager.build_test_user() for _ in range(count)]
+
+
+def has_cjk(text: str) -> bool:
+    """是否包含中文字符"""
+    return any("一" <= char <= "鿿" for char in text)
+
+
+@allure.feature("测试数据")
+class TestDataManager:
+    """数据管理器测试类"""
+
+    @allure.title("相同运行种子和测试ID生成相同数据")
+    def test_reseed_is_deterministic(self):
+        """同一测试在同一次运行（相同种子）中总是得到相同的数据"""
+        assert build_users(42, NODE_ID) == build_users(42, NODE_ID)
+
+    @allure.title("测试ID或运行种子不同时数据不同")
+    def test_reseed_differs_by_node_and_seed(self):
+        """不同的测试、不同的运行互不重复"""
+        users = build_users(42, NODE_ID)
+
+        assert build_users(42, NODE_ID + "[2]") != users
+        assert build_users(43, NODE_ID) != users
+
+    @allure.title("每次访问数据类型时随机选择语言")
+    def test_locale_mix_across_accesses(self):
+        """两种语言都会被选中"""
+        fake = LazyFaker(["zh_CN", "en_US"], seed=1)
+
+        names = [fake.first_name() for _ in range(40)]
+
+        assert any(has_cjk(name) for name in names)
+        assert any(not has_cjk(name) for name in names)
+
+    @allure.title("未初始化的代理访问属性时不递归")
+    def test_uninitialized_proxy_raises_attribute_error(self):
+        """copy/pickle会在__init__之前访问属性，应得到AttributeError而不是RecursionError"""
+        with pytest.raises(AttributeError):
+            LazyFaker.__new__(LazyFaker).first_name
+
+    @allure.title("代理可以复制和序列化")
+    def test_proxy_copy_and_pickle(self):
+        """复制后的代理与原代理生成相同的数据"""
+        fake = LazyFaker(["en_US"], seed=5)
+        clone = copy.deepcopy(fake)
+        restored = pickle.loads(pickle.dumps(fake))
+
+        assert clone.first_name() == restored.first_name() == fake.first_name()
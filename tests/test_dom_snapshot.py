@@ -0,0 +1,41 @@
+"""
+离线DOM快照测试
+用固定的HTML验证定位器求值和文本提取，不需要浏览器
+"""
+import allure
+from selenium.webdriver.common.by import By
+from utils.dom_snapshot import DomSnapshot
+
+
+BRANDS_HTML = """
+<div class="brands_products">
+  <ul>
+    <li><a href="/brand_products/Polo"><span class="pull-right">(6)</span>Polo</a></li>
+    <li><a href="/brand_products/H&amp;M"><span class="pull-right">(5)</span>H&amp;M</a></li>
+  </ul>
+</div>
+"""
+BRAND_LINKS = (By.XPATH, "//div[@class='brands_products']//li/a")
+
+
+@allure.feature("离线DOM快照")
+class TestDomSnapshot:
+    """离线DOM快照测试类"""
+
+    @allure.title("自身文本不包含子元素的计数角标")
+    def test_own_texts_skip_badges(self):
+        """get_texts 返回完整的文本内容，get_own_texts 只返回元素自身的文本"""
+        snapshot = DomSnapshot(BRANDS_HTML)
+
+        assert snapshot.get_texts(BRAND_LINKS) == ["(6)Polo", "(5)H&M"]
+        assert snapshot.get_own_texts(BRAND_LINKS) == ["Polo", "H&M"]
+
+    @allure.title("各种定位方式在本地求值")
+    def test_locator_strategies(self):
+        """CSS、类名和链接文本定位与XPath定位结果一致"""
+        snapshot = DomSnapshot(BRANDS_HTML)
+
+        assert snapshot.count((By.CSS_SELECTOR, ".brands_products li a")) == 2
+        assert snapshot.count((By.CLASS_NAME, "pull-right")) == 2
+        assert snapshot.get_attribute((By.PARTIAL_LINK_TEXT, "Polo"), "href") == "/brand_products/Polo"
+        assert not snapshot.is_element_present((By.ID, "missing"))
@@ -0,0 +1,147 @@
+"""
+WebDriver池测试
+使用模拟的WebDriver验证复用、回收和状态重置，不需要浏览器
+"""
+import allure
+import pytest
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+
+class FakeSwitchTo:
+    """记录窗口切换的模拟switch_to"""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+    def window(self, handle):
+        self.driver.current = handle
+
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    """记录重置操作的模拟WebDriver"""
+
+    def __init__(self, windows: int = 1, fail_reset: bool = False):
+        self.window_handles = [f"w{index}" for index in range(windows)]
+        self.current = self.window_handles[0]
+        self.switch_to = FakeSwitchTo(self)
+        self.fail_reset = fail_reset
+        self.cookies_cleared = False
+        self.url = None
+        self.quit_count = 0
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def execute_script(self, script):
+        if self.fail_reset:
+            raise WebDriverException("session deleted")
+
+    def execute(self, command, params):
+        raise WebDriverException("CDP not supported")
+
+    def delete_all_cookies(self):
+        self.cookies_cleared = True
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_count += 1
+
+
+@pytest.fixture
+def created():
+    """工厂创建的所有模拟WebDriver"""
+    return []
+
+
+@pytest.fixture
+def make_pool(created):
+    """创建使用模拟WebDriver工厂的池"""
+    from utils.driver_pool import DriverPool
+
+    def make(**kwargs):
+        def factory():
+            driver = FakeDriver()
+            created.append(driver)
+            return driver
+        return DriverPool(factory, **kwargs)
+
+    return make
+
+
+@allure.feature("WebDriver池")
+class TestDriverPool:
+    """WebDriver池测试类"""
+
+    @allure.title("归还的实例被下一个测试复用")
+    def test_released_driver_is_reused(self, make_pool, created):
+        """重置成功的实例回到池中，不再创建新实例"""
+        pool = make_pool()
+        driver = pool.acquire()
+        pool.release(driver)
+
+        assert pool.acquire() is driver
+        assert len(created) == 1
+        assert driver.cookies_cleared and driver.url == "about:blank"
+
+    @allure.title("达到最大使用次数后回收")
+    def test_recycled_after_max_uses(self, make_pool, created):
+        """第max_uses次使用后退出，下一次借出新实例"""
+        pool = make_pool(max_uses=2)
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+
+        second = pool.acquire()
+
+        assert second is not first
+        assert first.quit_count == 1
+        assert len(created) == 2
+
+    @allure.title("重置失败或要求丢弃时回收")
+    def test_discard_and_failed_reset_recycle(self, make_pool):
+        """discard=True 或重置失败的实例不回到池中"""
+        pool = make_pool()
+        discarded = pool.acquire()
+        pool.release(discarded, discard=True)
+
+        broken = pool.acquire()
+        broken.fail_reset = True
+        pool.release(broken)
+
+        assert discarded.quit_count == 1
+        assert broken.quit_count == 1
+        assert pool.acquire() not in (discarded, broken)
+
+    @allure.title("重置时只保留第一个窗口")
+    def test_reset_closes_extra_windows(self, make_pool):
+        """多余的窗口被关闭，焦点回到第一个窗口"""
+        pool = make_pool()
+        driver = FakeDriver(windows=3)
+
+        assert pool.reset(driver)
+        assert driver.window_handles == ["w0"]
+        assert driver.current == "w0"
+
+    @allure.title("超出空闲上限的实例被退出")
+    def test_max_idle(self, make_pool):
+        """max_idle=0 时归还即退出；close_all退出所有空闲实例"""
+        pool = make_pool(max_idle=0)
+        driver = pool.acquire()
+        pool.release(driver)
+        assert driver.quit_count == 1
+
+        pool = make_pool(max_idle=1)
+        driver = pool.acquire()
+        pool.release(driver)
+        pool.close_all()
+        assert driver.quit_count == 1
@@ -0,0 +1,107 @@
+"""
+驱动清单解析测试
+替换浏览器版本检测和驱动下载，验证磁盘清单缓存，不需要浏览器
+"""
+import json
+
+import allure
+import pytest
+
+
+@pytest.fixture
+def driver_file(tmp_path):
+    """已缓存的驱动可执行文件"""
+    path = tmp_path / "chromedriver"
+    path.write_text("")
+    return path
+
+
+@pytest.fixture
+def make_resolver(tmp_path, driver_file):
+    """创建使用临时清单的解析器，记录版本检测和安装调用"""
+    from utils.driver_resolver import DriverResolver
+
+    def make(browser_version="120.0.6099.109", manifest=None):
+        manifest_file = tmp_path / "manifest.json"
+        if manifest is not None:
+            manifest_file.write_text(json.dumps(manifest), encoding="utf-8")
+
+        resolver = DriverResolver(str(manifest_file))
+        resolver.calls = {"detect": 0, "install": 0}
+
+        def detect(browser_name):
+            resolver.calls["detect"] += 1
+            return browser_version
+
+        def install(browser_name):
+            resolver.calls["install"] += 1
+            return str(tmp_path / "installed-driver")
+
+        resolver._detect_browser_version = detect
+        resolver._install = install
+        return resolver
+
+    return make
+
+
+@allure.feature("驱动清单")
+class TestDriverResolver:
+    """驱动清单解析测试类"""
+
+    @allure.title("主版本相同时使用缓存的驱动")
+    def test_cache_hit_on_same_major(self, make_resolver, driver_file):
+        """浏览器小版本升级不触发重新下载"""
+        resolver = make_resolver(manifest={
+            "chrome": {"browser_version": "120.0.6099.71", "driver_path": str(driver_file)}
+        })
+
+        assert resolver.resolve("Chrome") == str(driver_file)
+        assert resolver.calls["install"] == 0
+
+    @allure.title("主版本变化或驱动缺失时重新安装")
+    @pytest.mark.parametrize("cached_version, missing", [("119.0.6045.105", False), ("120.0.6099.71", True)])
+    def test_install_on_mismatch(self, make_resolver, driver_file, cached_version, missing):
+        """重新安装并把新路径写回清单"""
+        if missing:
+            driver_file.unlink()
+        resolver = make_resolver(manifest={
+            "chrome": {"browser_version": cached_version, "driver_path": str(driver_file)}
+        })
+
+        driver_path = resolver.resolve("chrome")
+
+        assert resolver.calls["install"] == 1
+        assert driver_path.endswith("installed-driver")
+        saved = json.loads(resolver.manifest_file.read_text(encoding="utf-8"))
+        assert saved["chrome"] == {"browser_version": "120.0.6099.109", "driver_path": driver_path}
+
+    @allure.title("无法检测浏览器版本时信任缓存")
+    def test_unknown_version_trusts_cache(self, make_resolver, driver_file):
+        """版本为None且驱动文件存在时不重新安装"""
+        resolver = make_resolver(browser_version=None, manifest={
+            "chrome": {"browser_version": "119.0", "driver_path": str(driver_file)}
+        })
+
+        assert resolver.resolve("chrome") == str(driver_file)
+        assert resolver.calls["install"] == 0
+
+    @allure.title("同一进程内只解析一次")
+    def test_resolved_in_memory(self, make_resolver):
+        """第二次调用不再检测版本也不读清单"""
+        resolver = make_resolver()
+
+        first = resolver.resolve("chrome")
+        second = resolver.resolve("chrome")
+
+        assert first == second
+        assert resolver.calls == {"detect": 1, "install": 1}
+
+    @allure.title("损坏的清单视为空")
+    def test_corrupt_manifest(self, make_resolver):
+        """清单无法解析时重新安装并覆盖"""
+        resolver = make_resolver()
+        resolver.manifest_file.write_text("{not json", encoding="utf-8")
+
+        assert resolver._load_manifest() == {}
+        resolver.resolve("chrome")
+        assert "chrome" in json.loads(resolver.manifest_file.read_text(encoding="utf-8"))
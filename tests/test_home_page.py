@@ -48,7 +48,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试产品链接"):
             self.home_page.click_products_link()
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/products" in current_url,
@@ -60,7 +60,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试登录/注册链接"):
             self.home_page.click_signup_login_link()
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/login" in current_url,
@@ -72,7 +72,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试联系我们链接"):
             self.home_page.click_contact_us_link()
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/contact_us" in current_url,
@@ -101,6 +101,8 @@ class TestHomePage(BaseTest):
                 len(product_names) > 0,
                 f"应该能获取产品名称，实际获取到: {product_names}"
             )
+            # 轮播图中未显示的卡片名称为空，显示的第一个产品必须有名称
+            assert product_names[0].strip(), f"第一个产品名称不应为空: {product_names}"
 
         with allure.step("验证产品价格获取"):
             product_prices = self.home_page.get_product_prices()
@@ -108,10 +110,12 @@ class TestHomePage(BaseTest):
                 len(product_prices) > 0,
                 f"应该能获取产品价格，实际获取到: {product_prices}"
             )
+            for price in product_prices:
+                assert price == "" or price.startswith("Rs."), f"价格格式不正确: '{price}'"
 
         with allure.step("验证查看产品功能"):
             self.home_page.click_view_product_by_index(0)
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/product_details/" in current_url,
@@ -132,7 +136,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试女装分类"):
             self.home_page.click_women_dress_category()
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/category_products/1" in current_url,
@@ -144,7 +148,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试男装分类"):
             self.home_page.click_men_tshirts_category()
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/category_products/3" in current_url,
@@ -165,7 +169,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试Polo品牌"):
             self.home_page.click_brand("Polo")
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/brand_products/Polo" in current_url,
@@ -177,7 +181,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试H&M品牌"):
             self.home_page.click_brand("H&M")
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.home_page.get_current_url()
             self.assert_with_screenshot(
                 "/brand_products/H&M" in current_url,
@@ -195,7 +199,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("滚动到页脚"):
             self.home_page.scroll_to_bottom_of_page()
-            time.sleep(1)
+            self.wait_for_settled()
 
         with allure.step("验证订阅区域可见"):
             assert self.home_page.verify_subscription_section(), "订阅区域不可见"
@@ -219,7 +223,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("滚动到推荐商品区域"):
             self.home_page.scroll_to_element(self.home_page.RECOMMENDED_ITEMS_TITLE)
-            time.sleep(1)
+            self.wait_for_settled()
 
         with allure.step("验证推荐商品区域可见"):
             assert self.home_page.verify_recommended_items_section(), "推荐商品区域不可见"
@@ -235,7 +239,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("滚动到页面底部"):
             self.home_page.scroll_to_bottom_of_page()
-            time.sleep(1)
+            self.wait_for_settled()
 
             # 验证页脚元素可见
             assert self.home_page.verify_element_visible(
@@ -244,7 +248,7 @@ class TestHomePage(BaseTest):
 
         with allure.step("滚动到页面顶部"):
             self.home_page.scroll_to_top_of_page()
-            time.sleep(1)
+            self.wait_for_settled()
 
             # 验证顶部元素可见
             assert self.home_page.verify_element_visible(
@@ -265,17 +269,17 @@ class TestHomePage(BaseTest):
         try:
             with allure.step("测试移动端尺寸"):
                 self.driver.set_window_size(375, 667)  # iPhone 6/7/8
-                time.sleep(2)
+                self.wait_for_settled()
                 assert self.home_page.verify_element_visible(self.home_page.LOGO), "移动端Logo不可见"
 
             with allure.step("测试平板尺寸"):
                 self.driver.set_window_size(768, 1024)  # iPad
-                time.sleep(2)
+                self.wait_for_settled()
                 assert self.home_page.verify_element_visible(self.home_page.LOGO), "平板端Logo不可见"
 
             with allure.step("测试桌面尺寸"):
                 self.driver.set_window_size(1920, 1080)  # Desktop
-                time.sleep(2)
+                self.wait_for_settled()
                 assert self.home_page.verify_element_visible(self.home_page.LOGO), "桌面端Logo不可见"
 
         finally:
@@ -301,5 +305,5 @@ class TestHomePage(BaseTest):
 
         with allure.step("测试页面刷新"):
             self.home_page.refresh_page()
-            time.sleep(2)
+            self.wait_for_settled()
             assert self.home_page.verify_page_loaded(), "页面刷新后加载失败"
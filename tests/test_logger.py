@@ -0,0 +1,186 @@
+"""
+日志管理器测试
+使用独立的loguru副本和临时配置，不影响全局日志，不需要浏览器
+"""
+import allure
+import pytest
+from loguru._logger import Core, Logger as LoguruLogger
+
+import utils.logger as logger_module
+from utils.logger import Logger
+
+
+def new_loguru():
+    """
+    创建一个没有任何sink的独立loguru实例（与 loguru/__init__.py 创建全局logger的方式相同）
+
+    测试会话中的全局logger已经带有无法deepcopy的sink，因此不复制它
+    """
+    return LoguruLogger(core=Core(), exception=None, depth=0, record=False, lazy=False, colors=False,
+                        raw=False, capture=True, patchers=[], extra={})
+
+class FakeConfig:
+    """只提供日志配置的配置管理器替身"""
+
+    def __init__(self, values: dict):
+        self.values = values
+
+    def get(self, key: str, default=None):
+        return self.values.get(key, default)
+
+
+@pytest.fixture
+def make_logger(tmp_path, monkeypatch):
+    """创建输出到列表的日志管理器，返回 (实例, 输出行列表)"""
+    isolated_loguru = []
+
+    def make(profile="verbose", level="INFO", capture=False):
+        config = FakeConfig({
+            "logging.level": level,
+            "logging.format": "{level} | {message}",
+            "logging.file": str(tmp_path / "automation.log"),
+            "logging.test_capture": {"enabled": capture, "buffer_size": 3,
+                                     "failed_dir": str(tmp_path / "failed")},
+        })
+        isolated = new_loguru()
+        isolated_loguru.append(isolated)
+        monkeypatch.setattr(logger_module, "logger", isolated)
+        monkeypatch.setattr(logger_module.ConfigManager, "get_instance", staticmethod(lambda: config))
+        monkeypatch.delenv(logger_module.COLLECTOR_ENV, raising=False)
+
+        instance = Logger(profile=profile)
+        # 保留测试缓冲，其余控制台/文件sink换成列表
+        buffer = instance._test_buffer
+        isolated.remove()
+        lines = []
+        isolated.add(lines.append, format="{level} | {message}", level=level)
+        if buffer is not None:
+            isolated.add(buffer, format="{level} | {message}", level=level)
+        return instance, lines
+
+    yield make
+    for isolated in isolated_loguru:
+        isolated.remove()
+
+
+@allure.feature("日志管理器")
+class TestLoggerCategories:
+    """日志类别过滤测试类"""
+
+    @allure.title("verbose模式输出全部INFO类日志")
+    def test_verbose_enables_info_categories(self, make_logger):
+        """INFO级别下除debug外全部开启"""
+        instance, _ = make_logger("verbose")
+
+        assert instance.is_enabled("page_action")
+        assert instance.is_enabled("step")
+        assert not instance.is_enabled("debug")
+
+    @allure.title("quiet模式只保留步骤、结果和警告以上级别")
+    def test_quiet_keeps_summary_and_warnings(self, make_logger):
+        """quiet模式关闭其他INFO类日志"""
+        instance, _ = make_logger("quiet")
+
+        enabled = {category for category in Logger.CATEGORY_LEVELS if instance.is_enabled(category)}
+
+        assert enabled == {"step", "result", "warning", "error", "critical"}
+
+    @allure.title("日志级别高于类别级别时关闭")
+    def test_level_disables_lower_categories(self, make_logger):
+        """WARNING级别下步骤日志也不输出"""
+        instance, _ = make_logger("verbose", level="WARNING")
+
+        assert not instance.is_enabled("step")
+        assert instance.is_enabled("warning")
+
+    @allure.title("关闭的类别不构造消息")
+    def test_disabled_category_skips_message(self, make_logger):
+        """quiet模式下page_action的延迟消息函数不被调用"""
+        instance, lines = make_logger("quiet")
+        calls = []
+
+        instance.page_action("Click", lambda: calls.append(1) or "button")
+        instance.step(lambda: "Open home page")
+
+        assert calls == []
+        assert len(lines) == 1 and "STEP: Open home page" in lines[0]
+
+    @allure.title("消息内容渲染")
+    @pytest.mark.parametrize("value, expected", [
+        (lambda: "lazy", "lazy"),
+        (("xpath", "//a"), "xpath='//a'"),
+        ("plain", "plain"),
+    ])
+    def test_render(self, value, expected):
+        """函数延迟调用，定位器元组格式化为 by='value'"""
+        assert Logger._render(value) == expected
+
+
+@allure.feature("日志管理器")
+class TestTestLogCapture:
+    """测试日志缓冲测试类"""
+
+    @allure.title("未开始记录时不缓存")
+    def test_inactive_buffer_ignores_messages(self):
+        """没有当前测试时sink直接丢弃日志"""
+        buffer = logger_module.TestLogBuffer(max_lines=3)
+
+        buffer("before\n")
+
+        assert not buffer.active
+        assert buffer.drain() == ""
+
+    @allure.title("环形缓冲只保留最近的行")
+    def test_ring_drops_oldest_lines(self):
+        """超出max_lines后丢弃最早的行，drain后清空"""
+        buffer = logger_module.TestLogBuffer(max_lines=3)
+        buffer.start("tests/test_a.py::test_a")
+
+        for index in range(5):
+            buffer(f"line {index}\n")
+
+        assert buffer.drain() == "line 2\nline 3\nline 4\n"
+        assert buffer.drain() == ""
+
+    @allure.title("开始新测试或结束时清空缓存")
+    def test_start_and_stop_clear_lines(self):
+        """上一个测试的日志不会带入下一个测试"""
+        buffer = logger_module.TestLogBuffer()
+        buffer.start("first")
+        buffer("first line\n")
+        buffer.start("second")
+        buffer("second line\n")
+        buffer.stop()
+
+        assert not buffer.active
+        assert buffer.drain() == ""
+
+    @allure.title("失败时把缓存写入失败日志文件")
+    def test_flush_writes_failed_log(self, make_logger, tmp_path):
+        """文件名由nodeid转换，只包含当前测试的日志"""
+        instance, lines = make_logger(capture=True)
+        instance.info("outside test")
+        instance.start_test_capture("tests/test_login.py::TestLogin::test_valid[chrome]")
+        instance.info("inside test")
+
+        text = instance.flush_test_capture()
+        instance.stop_test_capture()
+
+        log_file = tmp_path / "failed" / "tests_test_login.py_TestLogin_test_valid_chrome.log"
+        assert text == "INFO | inside test\n"
+        assert log_file.read_text(encoding="utf-8") == text
+        assert instance.flush_test_capture() is None
+
+    @allure.title("持久日志只保留测试期间的摘要和警告")
+    def test_persistent_filter_during_capture(self, make_logger):
+        """测试执行期间普通INFO日志不写入持久sink"""
+        instance, _ = make_logger(capture=True)
+        record = {"extra": {}, "level": logger_module.logger.level("INFO")}
+        summary = {"extra": {"summary": True}, "level": logger_module.logger.level("INFO")}
+        warning = {"extra": {}, "level": logger_module.logger.level("WARNING")}
+
+        assert instance._persistent_filter(record)
+        instance.start_test_capture("test_id")
+        assert not instance._persistent_filter(record)
+        assert instance._persistent_filter(summary)
+        assert instance._persistent_filter(warning)
@@ -50,7 +50,7 @@ class TestProducts(BaseTest):
 
         with allure.step("点击查看第一个产品"):
             self.products_page.click_view_first_product()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证跳转到产品详情页"):
             current_url = self.products_page.get_current_url()
@@ -102,7 +102,7 @@ class TestProducts(BaseTest):
             assert self.navigate_to_products(), "产品页面加载失败"
 
             self.products_page.search_product(search_term)
-            time.sleep(2)
+            self.wait_for_settled()
 
             assert self.products_page.verify_searched_products_title(), "搜索结果标题不正确"
 
@@ -133,7 +133,7 @@ class TestProducts(BaseTest):
 
         with allure.step("执行空搜索"):
             self.products_page.search_product("")
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证搜索行为"):
             # 空搜索可能显示所有产品或保持原状
@@ -158,7 +158,7 @@ class TestProducts(BaseTest):
                 assert self.navigate_to_products(), "产品页面加载失败"
 
                 self.products_page.search_product(char)
-                time.sleep(2)
+                self.wait_for_settled()
 
                 # 验证页面没有崩溃
                 assert self.products_page.verify_element_visible(
@@ -184,7 +184,7 @@ class TestProducts(BaseTest):
 
         with allure.step("点击查看购物车"):
             self.products_page.click_view_cart_from_modal()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证跳转到购物车页面"):
             current_url = self.driver.current_url
@@ -215,7 +215,7 @@ class TestProducts(BaseTest):
 
         with allure.step("点击继续购物"):
             self.products_page.click_continue_shopping()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证仍在产品页面"):
             current_url = self.driver.current_url
@@ -257,6 +257,12 @@ class TestProducts(BaseTest):
                 f"应该显示品牌列表，实际获取到: {brands}"
             )
 
+        with allure.step("验证品牌名称"):
+            # 品牌名不含商品数角标，与页面显示的大写名称一致
+            for brand in brands:
+                assert brand and "(" not in brand and brand == brand.upper(), f"品牌名称不正确: '{brand}'"
+            assert "POLO" in brands, f"品牌列表中应该有POLO: {brands}"
+
     @allure.story("产品品牌")
     @allure.title("品牌筛选功能")
     @allure.description("测试点击品牌进行产品筛选")
@@ -269,7 +275,7 @@ class TestProducts(BaseTest):
 
         with allure.step("点击Polo品牌"):
             self.products_page.click_brand_by_name("Polo")
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证跳转到品牌页面"):
             current_url = self.driver.current_url
@@ -290,7 +296,7 @@ class TestProducts(BaseTest):
 
         with allure.step("鼠标悬停在第一个产品上"):
             self.products_page.hover_on_product_by_index(0)
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证页面仍然正常"):
             # 悬停后页面应该仍然可用
@@ -367,7 +373,7 @@ class TestProducts(BaseTest):
 
             # 尝试刷新页面
             self.products_page.refresh_page()
-            time.sleep(3)
+            self.wait_for_settled()
 
         with allure.step("验证页面恢复"):
             # 验证页面能够正常恢复
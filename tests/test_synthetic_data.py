@@ -0,0 +1,74 @@
+"""
+大批量合成数据生成器测试
+验证字段与DataManager一致、邮箱唯一和种子可复现，不需要浏览器
+"""
+import json
+import sys
+import allure
+import pytest
+from utils import synthetic_data
+from utils.config_manager import ConfigManager
+from utils.data_manager import DataManager
+from utils.synthetic_data import CONTACT_FIELDS, USER_FIELDS, SyntheticDataGenerator
+
+
+@pytest.fixture
+def data_manager():
+    """固定种子的数据管理器"""
+    return DataManager(ConfigManager.get_instance(), seed=1)
+
+
+@allure.feature("合成数据")
+class TestSyntheticData:
+    """大批量合成数据生成器测试类"""
+
+    @allure.title("字段顺序与DataManager生成的字典一致")
+    def test_fields_match_data_manager(self, data_manager):
+        """列顺序与 build_test_user / generate_contact_data 的键顺序相同"""
+        generator = SyntheticDataGenerator(seed=1)
+
+        users = next(generator.iter_chunks("user", 10))
+        contacts = next(generator.iter_chunks("contact", 10))
+
+        assert list(users.columns) == list(data_manager.build_test_user()) == list(USER_FIELDS)
+        assert list(contacts.columns) == list(data_manager.generate_contact_data()) == list(CONTACT_FIELDS)
+        assert all(isinstance(value, str) for value in users.iloc[0])
+
+    @allure.title("邮箱在所有数据块之间唯一")
+    def test_emails_unique_across_chunks(self):
+        """序号跨块连续，重名的用户邮箱也不重复"""
+        generator = SyntheticDataGenerator(seed=1, run_tag="t1")
+
+        emails = [email for chunk in generator.iter_chunks("user", 2500, chunk_size=1000)
+                  for email in chunk["email"]]
+
+        assert len(emails) == 2500
+        assert len(set(emails)) == 2500
+        assert all(".t1-" in email for email in emails)
+
+    @allure.title("相同种子生成相同数据")
+    def test_seed_determinism(self):
+        """种子和运行标记都相同时数据完全一致，种子不同时数据不同"""
+        first = next(SyntheticDataGenerator(seed=7, run_tag="r").iter_chunks("contact", 100))
+        second = next(SyntheticDataGenerator(seed=7, run_tag="r").iter_chunks("contact", 100))
+        other = next(SyntheticDataGenerator(seed=8, run_tag="r").iter_chunks("contact", 100))
+
+        assert first.equals(second)
+        assert not first.equals(other)
+
+    @allure.title("命令行按运行标记区分邮箱")
+    def test_cli_uses_run_id(self, tmp_path, monkeypatch):
+        """相同 --seed 的两次运行生成的邮箱不同"""
+        emails = []
+        for run_id in ("run1", "run2"):
+            output = tmp_path / f"{run_id}.jsonl"
+            monkeypatch.setenv(DataManager.RUN_ID_ENV, run_id)
+            monkeypatch.setattr(sys, "argv", ["synthetic_data", "--kind", "user", "--count", "5",
+                                              "--seed", "3", "--output", str(output)])
+            synthetic_data.main()
+            with open(output, encoding="utf-8") as file:
+                emails.append([json.loads(line)["email"] for line in file])
+
+        assert len(emails[0]) == 5
+        assert all(".run1-" in email for email in emails[0])
+        assert not set(emails[0]) & set(emails[1])
@@ -23,7 +23,7 @@ class TestUserAuthentication(BaseTest):
     def test_user_registration_success(self):
         """测试用户注册成功"""
         # 生成测试用户数据
-        user_data = self.test_data.generate_test_user()
+        user_data = self.test_data.next_test_user()
 
         with allure.step("导航到登录页面"):
             assert self.navigate_to_login(), "登录页面加载失败"
@@ -55,7 +55,7 @@ class TestUserAuthentication(BaseTest):
 
         with allure.step("点击继续按钮"):
             self.account_created_page.click_continue_button()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证登录成功"):
             current_url = self.driver.current_url
@@ -82,7 +82,7 @@ class TestUserAuthentication(BaseTest):
             self.login_page.signup_new_user("Test User", existing_email)
 
         with allure.step("验证错误消息"):
-            time.sleep(2)
+            self.wait_for_settled()
             error_visible = self.login_page.verify_email_already_exists_error()
             self.assert_with_screenshot(
                 error_visible,
@@ -104,7 +104,7 @@ class TestUserAuthentication(BaseTest):
 
         with allure.step("测试空表单提交"):
             self.login_page.signup_new_user("", "")
-            time.sleep(1)
+            self.wait_for_settled()
 
             # 验证仍在登录页面（表单验证阻止了提交）
             current_url = self.driver.current_url
@@ -113,7 +113,7 @@ class TestUserAuthentication(BaseTest):
         with allure.step("测试无效邮箱格式"):
             self.login_page.clear_signup_form()
             self.login_page.signup_new_user("Test User", "invalid-email")
-            time.sleep(1)
+            self.wait_for_settled()
 
             # 验证仍在登录页面
             current_url = self.driver.current_url
@@ -139,10 +139,10 @@ class TestUserAuthentication(BaseTest):
         with allure.step("输入登录凭据"):
             email = valid_user.get("email", "testuser@example.com")
             password = valid_user.get("password", "Test123456")
-            self.login_page.login_user(email, password)
+            logged_in = self.login_user(email, password)
 
         with allure.step("验证登录成功"):
-            time.sleep(3)
+            assert logged_in, "登录失败"
             current_url = self.driver.current_url
             self.assert_with_screenshot(
                 "/login" not in current_url,
@@ -164,7 +164,7 @@ class TestUserAuthentication(BaseTest):
             self.login_page.login_user("invalid@email.com", "wrongpassword")
 
         with allure.step("验证错误消息"):
-            time.sleep(2)
+            self.wait_for_settled()
             error_visible = self.login_page.verify_incorrect_login_error()
             self.assert_with_screenshot(
                 error_visible,
@@ -189,7 +189,7 @@ class TestUserAuthentication(BaseTest):
             self.login_page.login_user("", "")
 
         with allure.step("验证仍在登录页面"):
-            time.sleep(2)
+            self.wait_for_settled()
             current_url = self.driver.current_url
             assert "/login" in current_url, "空凭据登录不应该成功"
 
@@ -230,10 +230,9 @@ class TestUserAuthentication(BaseTest):
     def test_login_parametrized(self, email, password, expected):
         """参数化登录测试"""
         with allure.step(f"测试登录: {email}"):
-            assert self.navigate_to_login(), "登录页面加载失败"
-
-            self.login_page.login_user(email, password)
-            time.sleep(3)
+            # 有效凭据在本工作进程第二次登录时注入缓存的Cookie；缓存按邮箱和密码区分，无效凭据总是走登录表单
+            logged_in = self.login_user(email, password)
+            assert logged_in == (expected == "success"), f"登录结果不符合预期: {expected}"
 
             current_url = self.driver.current_url
 
@@ -256,14 +255,14 @@ class TestUserAuthentication(BaseTest):
     @pytest.mark.login
     def test_registration_and_login_flow(self):
         """测试注册和登录完整流程"""
-        user_data = self.test_data.generate_test_user()
+        user_data = self.test_data.next_test_user()
 
         with allure.step("执行用户注册"):
             assert self.register_new_user(user_data), "用户注册失败"
 
         with allure.step("注册完成后继续"):
             self.account_created_page.click_continue_button()
-            time.sleep(2)
+            self.wait_for_settled()
 
         with allure.step("验证自动登录"):
             current_url = self.driver.current_url
@@ -282,8 +281,7 @@ class TestUserAuthentication(BaseTest):
             email = user_data['email']
             password = user_data['password']
 
-            self.login_page.login_user(email, password)
-            time.sleep(3)
+            assert self.login_user(email, password), "使用注册凭据登录失败"
 
             current_url = self.driver.current_url
             self.assert_with_screenshot(
@@ -312,7 +310,7 @@ class TestUserAuthentication(BaseTest):
             with allure.step(f"测试SQL注入payload: {payload}"):
                 self.login_page.clear_login_form()
                 self.login_page.login_user(payload, payload)
-                time.sleep(2)
+                self.wait_for_settled()
 
                 # 验证仍在登录页面（SQL注入被阻止）
                 current_url = self.driver.current_url
@@ -342,7 +340,7 @@ class TestUserAuthentication(BaseTest):
             self.login_page.login_user(email, password)
 
             # 等待页面跳转
-            time.sleep(3)
+            self.wait_for_settled()
             end_time = time.time()
 
             response_time = end_time - start_time
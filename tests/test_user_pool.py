@@ -0,0 +1,102 @@
+"""
+测试用户池测试
+使用临时JSONL文件验证工作进程步长、行偏移和邮箱改写，不需要浏览器
+"""
+import itertools
+import json
+import os
+
+import allure
+import pytest
+
+from utils.user_pool import UserPool
+
+
+@pytest.fixture
+def generate_user():
+    """按序号生成用户的函数"""
+    counter = itertools.count()
+
+    def generate():
+        index = next(counter)
+        return {"name": f"user{index}", "email": f"user{index}@example.com"}
+
+    return generate
+
+
+@pytest.fixture
+def pool_file(tmp_path):
+    """用户池文件路径"""
+    return str(tmp_path / "user_pool.jsonl")
+
+
+@allure.feature("测试用户池")
+class TestUserPool:
+    """测试用户池测试类"""
+
+    @allure.title("补足用户且重复调用不再生成")
+    def test_ensure_is_idempotent(self, pool_file, generate_user):
+        """第二次ensure发现已有足够用户直接返回0"""
+        pool = UserPool(pool_file)
+
+        assert pool.ensure(generate_user, 5) == 5
+        assert pool.ensure(generate_user, 5) == 0
+        assert pool.ensure(generate_user, 7) == 2
+        assert UserPool(pool_file).size() == 7
+
+    @allure.title("部分写入时继续写完剩余字节")
+    def test_ensure_handles_short_writes(self, pool_file, generate_user, monkeypatch):
+        """os.write每次只写入一个字节时文件内容仍然完整"""
+        real_write = os.write
+        monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:1])))
+
+        UserPool(pool_file).ensure(generate_user, 3)
+
+        with open(pool_file, encoding="utf-8") as file:
+            names = [json.loads(line)["name"] for line in file]
+        assert names == ["user0", "user1", "user2"]
+
+    @allure.title("各工作进程按步长读取互不重叠的行")
+    def test_workers_take_disjoint_rows(self, pool_file, generate_user):
+        """三个工作进程取完9个用户，每行只被取一次"""
+        UserPool(pool_file).ensure(generate_user, 9)
+        pools = [UserPool(pool_file, index, 3, namespace=f"gw{index}") for index in range(3)]
+
+        taken = {index: [pool.take()["name"] for _ in range(3)] for index, pool in enumerate(pools)}
+
+        assert taken[1] == ["user1", "user4", "user7"]
+        assert sorted(itertools.chain(*taken.values())) == sorted(f"user{index}" for index in range(9))
+        assert all(pool.take() is None for pool in pools)
+
+    @allure.title("邮箱按命名空间和行号改写")
+    def test_email_rewritten_with_namespace(self, pool_file, generate_user):
+        """改写后的邮箱包含命名空间和所在行号"""
+        UserPool(pool_file).ensure(generate_user, 4)
+        pool = UserPool(pool_file, worker_index=1, worker_count=2, namespace="run1gw1")
+
+        assert pool.take()["email"] == "user1.run1gw1.1@example.com"
+        assert pool.take()["email"] == "user3.run1gw1.3@example.com"
+
+    @allure.title("用户不足时自动补充")
+    def test_take_refills_pool(self, pool_file, generate_user):
+        """池为空时按批量生成后再取出"""
+        pool = UserPool(pool_file, worker_index=1, worker_count=2)
+
+        user = pool.take(generate_user, batch_size=3)
+
+        assert user["name"] == "user1"
+        assert pool.size() == 4
+
+    @allure.title("未写完的行在补全之前不计入")
+    def test_partial_line_ignored_until_complete(self, pool_file):
+        """其他进程写了一半的行不记录偏移，写完后增量扫描读到它"""
+        with open(pool_file, "w", encoding="utf-8") as file:
+            file.write('{"name": "a", "email": "a@example.com"}\n{"name": "b", ')
+        pool = UserPool(pool_file)
+
+        assert pool.size() == 1
+        with open(pool_file, "a", encoding="utf-8") as file:
+            file.write('"email": "b@example.com"}\n')
+
+        assert pool.size() == 2
+        assert [pool.take()["name"] for _ in range(2)] == ["a", "b"]
@@ -0,0 +1,94 @@
+"""
+登录会话缓存
+每个账户在每个工作进程中只通过表单登录一次，之后通过注入Cookie恢复登录状态
+"""
+import hashlib
+import threading
+from typing import Callable, Dict, List, Tuple
+from utils.logger import log
+
+
+class AuthSessionCache:
+    """登录会话缓存类"""
+
+    def __init__(self, base_url: str, login_func: Callable, check_func: Callable):
+        """
+        初始化登录会话缓存
+
+        Args:
+            base_url: 站点基础URL，用于在注入Cookie前进入目标域名
+            login_func: 通过登录表单登录的函数 (driver, email, password) -> bool
+            check_func: 检查当前页面是否为已登录状态的函数 (driver) -> bool
+        """
+        self.base_url = base_url.rstrip("/")
+        self.login_func = login_func
+        self.check_func = check_func
+        # (邮箱, 密码摘要) -> Cookie，密码不同的登录不会命中缓存
+        self._cookies: Dict[Tuple[str, str], List[dict]] = {}
+        self._lock = threading.Lock()
+
+    def login(self, driver, email: str, password: str) -> bool:
+        """
+        使浏览器处于指定账户的登录状态
+
+        Args:
+            driver: WebDriver实例
+            email: 邮箱
+            password: 密码
+
+        Returns:
+            是否登录成功
+        """
+        key = self._key(email, password)
+        with self._lock:
+            cookies = self._cookies.get(key)
+
+        if cookies and self._restore(driver, cookies):
+            log.step(f"已通过缓存的Cookie恢复登录: {email}")
+            return True
+
+        # 首次登录、密码与缓存的不同或会话已过期，重新走登录表单
+        if not self.login_func(driver, email, password):
+            with self._lock:
+                self._cookies.pop(key, None)
+            return False
+
+        with self._lock:
+            self._cookies[key] = driver.get_cookies()
+        log.step(f"已登录并缓存会话Cookie: {email}")
+        return True
+
+    def invalidate(self, email: str = None):
+        """
+        清除缓存的会话
+
+        Args:
+            email: 邮箱，为None时清除所有账户
+        """
+        with self._lock:
+            if email is None:
+                self._cookies.clear()
+            else:
+                for key in [key for key in self._cookies if key[0] == email]:
+                    del self._cookies[key]
+
+    @staticmethod
+    def _key(email: str, password: str) -> Tuple[str, str]:
+        """缓存键：邮箱和密码摘要，不在内存中保存明文密码"""
+        return email, hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+    def _restore(self, driver, cookies: List[dict]) -> bool:
+        """注入Cookie并检查会话是否仍然有效"""
+        try:
+            # 先进入目标域名下的轻量页面，才能写入该域名的Cookie
+            driver.get(f"{self.base_url}/favicon.ico")
+            for cookie in cookies:
+                # get_cookies返回的sameSite字段回写时可能被浏览器拒绝
+                cookie = {key: value for key, value in cookie.items() if key != "sameSite"}
+                driver.add_cookie(cookie)
+
+            driver.get(self.base_url)
+            return self.check_func(driver)
+        except Exception as e:
+            log.warning(f"恢复登录会话失败: {str(e)}")
+            return False
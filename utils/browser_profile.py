@@ -0,0 +1,166 @@
+"""
+浏览器配置文件模板
+预先生成一个已预热HTTP缓存、已写入偏好设置的用户数据目录，每个会话从它的廉价副本启动
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, List
+from utils.logger import log
+
+
+class ProfileTemplate:
+    """浏览器配置文件模板类"""
+
+    # 浏览器运行时创建的锁文件，不能复制到副本中
+    LOCK_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile")
+
+    # 模板生成完成的标记文件
+    READY_MARKER = ".template_ready"
+
+    # 预热时写入的会话状态（Cookie、Local/Session Storage），不能带入每个副本
+    SESSION_STATE = ("Cookies", "Cookies-journal", "Network/Cookies", "Network/Cookies-journal",
+                     "Local Storage", "Session Storage", "Sessions")
+
+    def __init__(self, template_dir: str, clone_root: str = None):
+        """
+        初始化配置文件模板
+
+        Args:
+            template_dir: 模板目录
+            clone_root: 副本所在目录，默认优先使用内存文件系统 /dev/shm
+        """
+        self.template_dir = Path(template_dir)
+        self.clone_root = Path(clone_root or self._default_clone_root())
+        self._clones: List[Path] = []
+        self._lock = threading.Lock()
+        self._reflink_supported = sys.platform.startswith("linux")
+
+    def ensure(self, build_func: Callable[[str], None]):
+        """
+        确保模板存在，不存在时调用build_func生成
+
+        Args:
+            build_func: 以临时目录为参数、在其中启动浏览器并预热的函数
+        """
+        with self._lock:
+            if (self.template_dir / self.READY_MARKER).exists():
+                return
+
+            self.template_dir.parent.mkdir(parents=True, exist_ok=True)
+            build_dir = self.template_dir.with_name(f"{self.template_dir.name}.{uuid.uuid4().hex}.tmp")
+
+            log.browser_action("Building profile template", str(self.template_dir))
+            build_func(str(build_dir.resolve()))
+            self._remove_lock_files(build_dir)
+            self._remove_session_state(build_dir)
+            (build_dir / self.READY_MARKER).touch()
+
+            try:
+                # 并行的工作进程可能同时生成模板，先完成重命名的为准
+                os.replace(build_dir, self.template_dir)
+            except OSError:
+                shutil.rmtree(build_dir, ignore_errors=True)
+
+    def clone(self) -> str:
+        """
+        复制一份模板供单个浏览器会话使用
+
+        Returns:
+            副本目录的绝对路径
+        """
+        self.clone_root.mkdir(parents=True, exist_ok=True)
+        target = self.clone_root / f"profile-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+        # 优先使用写时复制的reflink，不支持时完整复制到内存文件系统
+        if not self._reflink_copy(target):
+            shutil.copytree(self.template_dir, target, symlinks=True,
+                            ignore=shutil.ignore_patterns(*self.LOCK_FILES))
+
+        with self._lock:
+            self._clones.append(target)
+        return str(target.resolve())
+
+    def remove_clone(self, clone_dir: str):
+        """
+        删除一个副本（浏览器会话退出后调用）
+
+        Args:
+            clone_dir: clone() 返回的副本目录
+        """
+        target = Path(clone_dir)
+        with self._lock:
+            self._clones = [clone for clone in self._clones if clone.resolve() != target]
+        shutil.rmtree(target, ignore_errors=True)
+
+    def cleanup(self):
+        """删除本进程创建的所有副本"""
+        with self._lock:
+            clones, self._clones = self._clones, []
+
+        for clone in clones:
+            shutil.rmtree(clone, ignore_errors=True)
+
+    def _reflink_copy(self, target: Path) -> bool:
+        """使用 cp --reflink=always 复制，文件系统不支持时返回False"""
+        if not self._reflink_supported:
+            return False
+
+        result = subprocess.run(
+            ["cp", "-a", "--reflink=always", str(self.template_dir), str(target)],
+            capture_output=True
+        )
+        if result.returncode == 0:
+            self._remove_lock_files(target)
+            return True
+
+        # 不支持reflink时后续不再尝试
+        self._reflink_supported = False
+        shutil.rmtree(target, ignore_errors=True)
+        return False
+
+    def _remove_lock_files(self, profile_dir: Path):
+        """删除浏览器锁文件"""
+        for name in self.LOCK_FILES:
+            path = profile_dir / name
+            if path.is_symlink() or path.exists():
+                path.unlink()
+
+    def _remove_session_state(self, profile_dir: Path):
+        """删除预热过程中写入的Cookie和页面存储，模板中只保留HTTP缓存和偏好设置"""
+        for user_dir in [profile_dir / "Default", *profile_dir.glob("Profile *")]:
+            for name in self.SESSION_STATE:
+                path = user_dir / name
+                if path.is_dir() and not path.is_symlink():
+                    shutil.rmtree(path, ignore_errors=True)
+                elif path.is_symlink() or path.exists():
+                    path.unlink()
+
+    @staticmethod
+    def _default_clone_root() -> str:
+        """默认副本目录"""
+        shm = Path("/dev/shm")
+        if shm.is_dir() and os.access(shm, os.W_OK):
+            return str(shm / "selenium-profiles")
+        return os.path.join(tempfile.gettempdir(), "selenium-profiles")
+
+    @staticmethod
+    def get_template(browser_name: str, template_root: str, clone_root: str = None) -> 'ProfileTemplate':
+        """获取浏览器对应的模板实例（每个浏览器一个）"""
+        if not hasattr(ProfileTemplate, '_instances'):
+            ProfileTemplate._instances = {}
+        if browser_name not in ProfileTemplate._instances:
+            template_dir = os.path.join(template_root, browser_name)
+            ProfileTemplate._instances[browser_name] = ProfileTemplate(template_dir, clone_root)
+        return ProfileTemplate._instances[browser_name]
+
+    @staticmethod
+    def cleanup_all():
+        """删除所有模板实例创建的副本"""
+        for template in getattr(ProfileTemplate, '_instances', {}).values():
+            template.cleanup()
@@ -0,0 +1,226 @@
+"""
+WebDriver命令分析器
+包装浏览器的command_executor，记录每条WebDriver命令的名称、耗时和发起命令的页面对象方法，
+按测试输出往返次数和耗时汇总
+"""
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+import allure
+from utils.logger import log
+from utils.round_trip_analyzer import RoundTripAnalyzer
+
+
+# 命令来源归属的目录：页面对象和测试用例
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SOURCE_DIRS = tuple(os.path.join(_PROJECT_ROOT, name) + os.sep for name in ("pages", "tests"))
+_BASE_PAGE_FILE = os.path.join(_PROJECT_ROOT, "pages", "base_page.py")
+
+# W3C协议中元素引用的键
+_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class CommandProfiler:
+    """WebDriver命令分析器类"""
+
+    def __init__(self, report_dir: str = "reports/profiles", slowest: int = 10,
+                 analyzer: RoundTripAnalyzer = None):
+        """
+        初始化命令分析器
+
+        Args:
+            report_dir: 每个测试的JSON汇总文件目录
+            slowest: 汇总中保留的最慢命令条数
+            analyzer: N+1往返检测器，为None时不做检测
+        """
+        self.report_dir = report_dir
+        self.slowest = slowest
+        self.analyzer = analyzer
+        self._records: List[dict] = []
+        self._active = False
+        self._test_name: Optional[str] = None
+        self._started_at = 0.0
+        self._lock = threading.Lock()
+
+    def attach(self, driver):
+        """
+        包装WebDriver的command_executor（同一个实例只包装一次）
+
+        Args:
+            driver: WebDriver实例
+        """
+        executor = driver.command_executor
+        if getattr(executor, "_command_profiler", None) is self:
+            return
+
+        original_execute = executor.execute
+
+        def execute(command, params):
+            if not self._active:
+                return original_execute(command, params)
+
+            start = time.perf_counter()
+            response = None
+            try:
+                response = original_execute(command, params)
+                return response
+            finally:
+                self._record(command, params, time.perf_counter() - start, response)
+
+        executor.execute = execute
+        executor._command_profiler = self
+
+    def start_test(self, test_name: str):
+        """
+        开始记录一个测试的命令
+
+        Args:
+            test_name: 测试名称（nodeid）
+        """
+        with self._lock:
+            self._records = []
+        self._test_name = test_name
+        self._started_at = time.perf_counter()
+        self._active = True
+
+    def stop_test(self) -> dict:
+        """
+        停止记录并生成当前测试的汇总
+
+        Returns:
+            汇总字典
+        """
+        self._active = False
+        wall_time = time.perf_counter() - self._started_at
+        with self._lock:
+            records, self._records = self._records, []
+
+        webdriver_time = sum(record["duration"] for record in records)
+        summary = {
+            "test": self._test_name,
+            "total_commands": len(records),
+            "wall_time": round(wall_time, 4),
+            "webdriver_time": round(webdriver_time, 4),
+            "python_time": round(max(wall_time - webdriver_time, 0), 4),
+            "by_command": self._group(records, "command"),
+            "by_caller": self._group(records, "caller"),
+            "slowest": sorted(records, key=lambda record: record["duration"], reverse=True)[:self.slowest],
+            "records": records
+        }
+        if self.analyzer is not None:
+            summary["n_plus_one"] = self.analyzer.analyze(records)
+        return summary
+
+    def report(self, summary: dict) -> str:
+        """
+        把汇总写入JSON文件并添加到Allure报告
+
+        Args:
+            summary: stop_test返回的汇总
+
+        Returns:
+            JSON文件路径
+        """
+        os.makedirs(self.report_dir, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]+", "_", summary["test"] or "unknown").strip("_") + ".json"
+        file_path = os.path.join(self.report_dir, file_name)
+
+        # 完整的命令列表只写入文件，Allure附件保留汇总部分
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+
+        overview = {key: value for key, value in summary.items() if key != "records"}
+        allure.attach(
+            json.dumps(overview, ensure_ascii=False, indent=2),
+            name="WebDriver命令统计",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+        log.performance(f"WebDriver commands ({summary['total_commands']}) time",
+                        summary["webdriver_time"], "seconds")
+        return file_path
+
+    def _record(self, command: str, params: dict, duration: float, response: dict = None):
+        """记录一条命令，返回元素列表的命令同时记录返回的元素引用"""
+        caller, site = self._find_caller()
+        record = {
+            "command": command,
+            "duration": round(duration, 6),
+            "caller": caller,
+            "site": site,
+            "element": self._target_element(params),
+            "elements": self._element_ids(response)
+        }
+        with self._lock:
+            self._records.append(record)
+
+    @staticmethod
+    def _target_element(params: dict) -> Optional[str]:
+        """
+        提取命令操作的元素引用
+
+        Selenium 4 的 get_attribute、is_displayed 等通过 executeScript 实现，
+        元素以W3C元素引用的形式放在 params["args"] 中，而不是 params["id"]
+        """
+        params = params or {}
+        if params.get("id") is not None:
+            return params["id"]
+        for arg in params.get("args") or ():
+            if isinstance(arg, dict) and _ELEMENT_KEY in arg:
+                return arg[_ELEMENT_KEY]
+        return None
+
+    @staticmethod
+    def _element_ids(response: dict) -> Optional[List[str]]:
+        """提取响应中返回的元素引用列表"""
+        value = response.get("value") if isinstance(response, dict) else None
+        if not isinstance(value, list) or not value:
+            return None
+        if not all(isinstance(item, dict) and _ELEMENT_KEY in item for item in value):
+            return None
+        return [item[_ELEMENT_KEY] for item in value]
+
+    @staticmethod
+    def _find_caller():
+        """
+        从调用栈中找出发起命令的页面对象方法和调用位置
+
+        Returns:
+            (页面对象方法, 调用位置 file:line)，BasePage的通用方法不算作发起者，
+            沿调用栈找到的第一个页面对象方法或测试方法即为发起者
+        """
+        frame = sys._getframe(3)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename.startswith(_SOURCE_DIRS) and code.co_filename != _BASE_PAGE_FILE:
+                site = f"{os.path.relpath(code.co_filename, _PROJECT_ROOT)}:{frame.f_lineno}"
+                return CommandProfiler._qualname(frame), site
+            frame = frame.f_back
+        return "<unknown>", None
+
+    @staticmethod
+    def _qualname(frame) -> str:
+        """获取帧所属方法的限定名，推导式等内部帧归属到外层方法"""
+        code = frame.f_code
+        qualname = getattr(code, "co_qualname", None)
+        if qualname is None:
+            owner = frame.f_locals.get("self")
+            qualname = f"{type(owner).__name__}.{code.co_name}" if owner is not None else code.co_name
+        return qualname.split(".<locals>")[0]
+
+    @staticmethod
+    def _group(records: List[dict], key: str) -> Dict[str, dict]:
+        """按字段分组统计次数和耗时，按耗时降序"""
+        groups: Dict[str, dict] = {}
+        for record in records:
+            group = groups.setdefault(record[key], {"count": 0, "duration": 0.0})
+            group["count"] += 1
+            group["duration"] += record["duration"]
+
+        for group in groups.values():
+            group["duration"] = round(group["duration"], 4)
+        return dict(sorted(groups.items(), key=lambda item: item[1]["duration"], reverse=True))
@@ -2,16 +2,27 @@
 配置管理器
 用于管理应用程序配置
 """
+import copy
 import os
+import threading
+import time
 import yaml
 from pathlib import Path
-from typing import Any, Dict
-from dotenv import load_dotenv
+from typing import Any, Dict, Tuple
+from dotenv import dotenv_values
+
+# get() 缓存中表示"配置不存在"的标记
+_MISSING = object()
 
 
 class ConfigManager:
     """配置管理器类"""
 
+    # 检查配置文件是否变更的最小间隔（秒）
+    RELOAD_CHECK_INTERVAL = 1.0
+
+    _instance_lock = threading.Lock()
+
     def __init__(self, config_file: str = "config/config.yaml"):
         """
         初始化配置管理器
@@ -21,14 +32,51 @@ class ConfigManager:
         """
         self.config_file = config_file
         self.config = {}
+        self._cache: Dict[str, Any] = {}
+        self._dotenv_keys = set()
+        self._mtimes = self._get_mtimes()
+        self._last_check = time.monotonic()
         self._load_env_file()
         self._load_config_file()
 
     def _load_env_file(self):
-        """加载环境变量文件"""
+        """加载环境变量文件（不覆盖进程启动时已存在的环境变量）"""
         env_file = Path(".env")
-        if env_file.exists():
-            load_dotenv(env_file)
+        if not env_file.exists():
+            return
+
+        for key, value in dotenv_values(env_file).items():
+            if value is None:
+                continue
+            if key not in os.environ or key in self._dotenv_keys:
+                os.environ[key] = value
+                self._dotenv_keys.add(key)
+
+    def _get_mtimes(self) -> Tuple[float, float]:
+        """获取配置文件和.env文件的修改时间"""
+        mtimes = []
+        for path in (self.config_file, ".env"):
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                mtimes.append(0.0)
+        return tuple(mtimes)
+
+    def _reload_if_changed(self):
+        """配置文件或.env在磁盘上发生变化时重新加载，并清空get()缓存"""
+        now = time.monotonic()
+        if now - self._last_check < self.RELOAD_CHECK_INTERVAL:
+            return
+        self._last_check = now
+
+        mtimes = self._get_mtimes()
+        if mtimes == self._mtimes:
+            return
+
+        self._mtimes = mtimes
+        self._load_env_file()
+        self._load_config_file()
+        self._cache.clear()
 
     def _load_config_file(self):
         """加载YAML配置文件"""
@@ -48,15 +96,37 @@ class ConfigManager:
             default: 默认值
 
         Returns:
-            配置值
+            配置值，字典和列表返回副本，修改它不会影响缓存和其他调用方
         """
-        # 首先检查环境变量
-        env_key = key.upper().replace('.', '_')
-        env_value = os.getenv(env_key)
+        self._reload_if_changed()
+
+        # 环境变量每次都重新读取，运行中设置的环境变量（如数据种子、运行标记）立即生效
+        env_value = os.getenv(key.upper().replace('.', '_'))
         if env_value is not None:
             return self._convert_type(env_value)
 
-        # 然后检查配置文件
+        # 只缓存配置文件中的值
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING and key not in self._cache:
+            value = self._resolve(key)
+            self._cache[key] = value
+
+        if value is _MISSING:
+            return default
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    def _resolve(self, key: str) -> Any:
+        """
+        解析配置文件中的值
+
+        Args:
+            key: 配置键
+
+        Returns:
+            配置值，不存在时返回 _MISSING
+        """
         keys = key.split('.')
         value = self.config
 
@@ -64,7 +134,7 @@ class ConfigManager:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
 
         return value
 
@@ -114,6 +184,7 @@ class ConfigManager:
             config = config[k]
 
         config[keys[-1]] = value
+        self._cache.clear()
 
     def get_all(self) -> Dict[str, Any]:
         """获取所有配置"""
@@ -127,6 +198,7 @@ class ConfigManager:
             config_dict: 配置字典
         """
         self._merge_dicts(self.config, config_dict)
+        self._cache.clear()
 
     def _merge_dicts(self, dict1: Dict, dict2: Dict):
         """
@@ -155,6 +227,15 @@ class ConfigManager:
         with open(save_path, 'w', encoding='utf-8') as file:
             yaml.dump(self.config, file, default_flow_style=False, allow_unicode=True)
 
+    @staticmethod
+    def get_instance() -> 'ConfigManager':
+        """获取进程内共享的配置实例（单例模式）"""
+        if not hasattr(ConfigManager, '_instance'):
+            with ConfigManager._instance_lock:
+                if not hasattr(ConfigManager, '_instance'):
+                    ConfigManager._instance = ConfigManager()
+        return ConfigManager._instance
+
     # 便捷方法
     @property
     def base_url(self) -> str:
@@ -2,29 +2,144 @@
 数据管理器
 用于管理测试数据
 """
+import hashlib
 import json
+import os
+import random
+import time
+import uuid
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence
 from faker import Faker
 from utils.config_manager import ConfigManager
 from utils.logger import log
+from utils.file_lock import FileLock
+from utils.user_pool import UserPool
+
+
+class LazyFaker:
+    """多语言Faker代理：每次调用随机选择语言，各语言的Faker在第一次被选中时才创建"""
+
+    def __init__(self, locales: Sequence[str], seed: int):
+        """
+        初始化Faker代理
+
+        Args:
+            locales: 语言列表
+            seed: 随机种子
+        """
+        self.locales = list(locales)
+        self._fakers: Dict[str, Faker] = {}
+        self.seed(seed)
+
+    def seed(self, seed: int):
+        """
+        重新设置随机种子，已创建的各语言Faker一并重置
+
+        Args:
+            seed: 随机种子
+        """
+        self._seed = seed
+        self._random = random.Random(seed)
+        for locale, faker in self._fakers.items():
+            faker.seed_instance(f"{seed}:{locale}")
+
+    def _faker(self, locale: str) -> Faker:
+        """获取某个语言的Faker，不存在时创建"""
+        faker = self._fakers.get(locale)
+        if faker is None:
+            faker = self._fakers[locale] = Faker(locale)
+            faker.seed_instance(f"{self._seed}:{locale}")
+        return faker
+
+    def __getattr__(self, name: str):
+        # 内部状态直接从实例字典读取：未经__init__创建的实例（copy/pickle过程中）访问属性时不会无限递归
+        state = self.__dict__
+        if name.startswith("__") or "_random" not in state:
+            raise AttributeError(name)
+
+        # 选中的语言没有该数据类型时（如zh_CN没有zipcode）依次尝试其他语言
+        locales = state["locales"]
+        first = state["_random"].randrange(len(locales))
+        for locale in locales[first:] + locales[:first]:
+            try:
+                return getattr(self._faker(locale), name)
+            except AttributeError:
+                continue
+        raise AttributeError(f"没有语言支持该数据类型: {name}")
 
 
 class DataManager:
     """数据管理器类"""
 
-    def __init__(self, config: ConfigManager):
+    # 主进程通过环境变量把本次运行的数据种子传给xdist工作进程
+    RUN_SEED_ENV = "AUTOMATION_DATA_SEED"
+
+    # 本次运行的唯一标记，与数据种子无关，固定种子复现数据时注册邮箱仍与之前的运行不同
+    RUN_ID_ENV = "AUTOMATION_RUN_ID"
+
+    def __init__(self, config: ConfigManager, seed: int = None):
         """
         初始化数据管理器
 
         Args:
             config: 配置管理器实例
+            seed: 本次运行的数据种子，默认见 get_run_seed
         """
         self.config = config
-        self.fake = Faker(['zh_CN', 'en_US'])
+        self.run_seed = seed if seed is not None else self.get_run_seed(config)
+        self.fake = LazyFaker(config.get("test_data.locales", ['zh_CN', 'en_US']), self.run_seed)
+        self._user_pool = None
         self._ensure_data_directories()
 
+    @classmethod
+    def get_run_seed(cls, config: ConfigManager = None) -> int:
+        """
+        获取本次运行的数据种子，第一次调用时确定并写入环境变量，之后启动的工作进程沿用同一个种子
+
+        Args:
+            config: 配置管理器实例
+
+        Returns:
+            环境变量中的种子，其次是配置 test_data.seed，都没有时随机生成
+        """
+        seed = os.environ.get(cls.RUN_SEED_ENV)
+        if seed is None:
+            seed = config.get("test_data.seed") if config is not None else None
+            if seed is None:
+                seed = random.SystemRandom().randrange(2 ** 32)
+            os.environ[cls.RUN_SEED_ENV] = str(seed)
+        return int(seed)
+
+    @classmethod
+    def get_run_id(cls) -> str:
+        """
+        获取本次运行的唯一标记，第一次调用时生成并写入环境变量，之后启动的工作进程沿用同一个标记
+
+        Returns:
+            时间戳加随机后缀组成的短字符串
+        """
+        run_id = os.environ.get(cls.RUN_ID_ENV)
+        if run_id is None:
+            run_id = os.environ[cls.RUN_ID_ENV] = f"{int(time.time()):x}{uuid.uuid4().hex[:4]}"
+        return run_id
+
+    def reseed(self, key: str) -> int:
+        """
+        按 运行种子+测试ID 重新设置随机种子，同一次运行中同一个测试总是得到相同的数据
+
+        Args:
+            key: 测试ID（nodeid）
+
+        Returns:
+            本测试使用的种子
+        """
+        digest = hashlib.sha256(f"{self.run_seed}:{key}".encode("utf-8")).digest()
+        seed = int.from_bytes(digest[:8], "big")
+        self.fake.seed(seed)
+        return seed
+
     def _ensure_data_directories(self):
         """确保数据目录存在"""
         data_dir = Path("data")
@@ -66,8 +181,11 @@ class DataManager:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(path, 'w', encoding='utf-8') as file:
+            # 先写临时文件再替换，读取方不会看到写了一半的文件
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as file:
                 json.dump(data, file, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
 
             log.data_operation(f"Saved JSON data to {file_path}", "JSON")
         except Exception as e:
@@ -135,7 +253,29 @@ class DataManager:
         Returns:
             用户数据字典
         """
-        user_data = {
+        user_data = self.build_test_user()
+
+        if save_to_file:
+            users_file = self.config.get("test_data.users_file", "data/users.json")
+            # 多个工作进程可能同时保存，读-改-写必须在文件锁内完成
+            with FileLock(f"{users_file}.lock"):
+                existing_users = self.load_json_data(users_file)
+                if "generated_users" not in existing_users:
+                    existing_users["generated_users"] = []
+                existing_users["generated_users"].append(user_data)
+                self.save_json_data(existing_users, users_file)
+
+        log.data_operation("Generated test user data", "User")
+        return user_data
+
+    def build_test_user(self) -> Dict[str, str]:
+        """
+        生成一个测试用户的字段，不记录日志也不保存
+
+        Returns:
+            用户数据字典
+        """
+        return {
             "first_name": self.fake.first_name(),
             "last_name": self.fake.last_name(),
             "email": self.fake.email(),
@@ -150,17 +290,31 @@ class DataManager:
             "mobile_number": self.fake.phone_number()
         }
 
-        if save_to_file:
-            users_file = self.config.get("test_data.users_file", "data/users.json")
-            existing_users = self.load_json_data(users_file)
-            if "generated_users" not in existing_users:
-                existing_users["generated_users"] = []
-            existing_users["generated_users"].append(user_data)
-            self.save_json_data(existing_users, users_file)
+    def next_test_user(self) -> Dict[str, str]:
+        """
+        从预先生成的用户池中取出当前工作进程的下一个注册用户，池不足时批量补充
 
-        log.data_operation("Generated test user data", "User")
+        Returns:
+            用户数据字典，邮箱按 运行+工作进程+行号 改写，并行注册不会冲突
+        """
+        if not self.config.get("user_pool.enabled", True):
+            return self.generate_test_user()
+
+        user_data = self._get_user_pool().take(self.build_test_user,
+                                               self.config.get("user_pool.batch_size", 1000))
+
+        log.data_operation("Took pooled test user", "User")
         return user_data
 
+    def _get_user_pool(self) -> UserPool:
+        """获取当前工作进程的用户池（延迟创建）"""
+        if self._user_pool is None:
+            self._user_pool = UserPool.for_worker(
+                self.config.get("user_pool.file", "data/user_pool.jsonl"),
+                run_tag=self.get_run_id()
+            )
+        return self._user_pool
+
     def generate_contact_data(self) -> Dict[str, str]:
         """生成联系我们表单数据"""
         contact_data = {
@@ -173,6 +327,28 @@ class DataManager:
         log.data_operation("Generated contact form data", "Contact")
         return contact_data
 
+    def generate_synthetic_data(self, kind: str, count: int, file_path: str = None) -> str:
+        """
+        批量生成大量注册用户或联系表单数据并分块写入文件，用于负载和数据驱动测试
+
+        Args:
+            kind: 数据类型 user/contact
+            count: 记录数
+            file_path: 输出文件（.jsonl 或 .parquet），默认写入 synthetic_data.output_dir
+
+        Returns:
+            输出文件路径
+        """
+        from utils.synthetic_data import SyntheticDataGenerator
+
+        if file_path is None:
+            output_dir = self.config.get("synthetic_data.output_dir", "data/synthetic")
+            file_path = str(Path(output_dir) / f"{kind}s.jsonl")
+
+        generator = SyntheticDataGenerator(self.run_seed, run_tag=self.get_run_id())
+        generator.write(kind, count, file_path, self.config.get("synthetic_data.chunk_size", 10000))
+        return file_path
+
     def get_test_data_by_scenario(self, scenario: str) -> List[Dict[str, Any]]:
         """
         根据场景获取测试数据
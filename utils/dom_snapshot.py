@@ -0,0 +1,116 @@
+"""
+离线DOM快照
+一次获取页面HTML后用lxml在本地解析，页面对象的 (By, value) 定位器在进程内直接求值，
+适用于不关心可见性和布局的只读检查
+"""
+from typing import Dict, List, Optional
+from cssselect import GenericTranslator
+from lxml import etree, html
+from selenium.webdriver.common.by import By
+
+
+class DomSnapshot:
+    """离线DOM快照类"""
+
+    # 已编译的XPath表达式缓存，所有快照共用
+    _compiled: Dict[tuple, etree.XPath] = {}
+    _translator = GenericTranslator()
+
+    def __init__(self, source: str, url: str = None):
+        """
+        初始化DOM快照
+
+        Args:
+            source: 页面HTML
+            url: 页面URL
+        """
+        self.source = source
+        self.url = url
+        self.tree = html.document_fromstring(source) if source.strip() else html.Element("html")
+
+    def find_elements(self, locator: tuple) -> List[html.HtmlElement]:
+        """
+        查找所有匹配的元素
+
+        Args:
+            locator: 定位器元组 (By.XPATH, "//div")
+
+        Returns:
+            lxml元素列表
+        """
+        by, value = locator
+        if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            links = self.tree.iter("a")
+            if by == By.LINK_TEXT:
+                return [link for link in links if self._normalize(link.text_content()) == value]
+            return [link for link in links if value in self._normalize(link.text_content())]
+
+        result = self._compile(locator)(self.tree)
+        return [node for node in result if isinstance(node, etree.ElementBase)]
+
+    def find_element(self, locator: tuple) -> Optional[html.HtmlElement]:
+        """查找第一个匹配的元素，不存在时返回None"""
+        elements = self.find_elements(locator)
+        return elements[0] if elements else None
+
+    def is_element_present(self, locator: tuple) -> bool:
+        """检查元素是否存在"""
+        return self.find_element(locator) is not None
+
+    def count(self, locator: tuple) -> int:
+        """统计匹配的元素数量"""
+        return len(self.find_elements(locator))
+
+    def get_text(self, locator: tuple) -> str:
+        """获取第一个匹配元素的文本（空白已合并），不存在时返回空字符串"""
+        element = self.find_element(locator)
+        return self._normalize(element.text_content()) if element is not None else ""
+
+    def get_texts(self, locator: tuple) -> List[str]:
+        """获取所有匹配元素的文本"""
+        return [self._normalize(element.text_content()) for element in self.find_elements(locator)]
+
+    def get_own_texts(self, locator: tuple) -> List[str]:
+        """获取所有匹配元素自身的文本，不包含子元素（如计数角标）的文本"""
+        return [self._normalize("".join(element.xpath("text()"))) for element in self.find_elements(locator)]
+
+    def get_attribute(self, locator: tuple, attribute: str) -> Optional[str]:
+        """获取第一个匹配元素的属性值（HTML中的原始值）"""
+        element = self.find_element(locator)
+        return element.get(attribute) if element is not None else None
+
+    @classmethod
+    def _compile(cls, locator: tuple) -> etree.XPath:
+        """把定位器转换为编译后的XPath表达式"""
+        compiled = cls._compiled.get(locator)
+        if compiled is not None:
+            return compiled
+
+        by, value = locator
+        if by == By.XPATH:
+            expression = value
+        elif by == By.CSS_SELECTOR:
+            expression = cls._translator.css_to_xpath(value)
+        elif by == By.ID:
+            expression = cls._translator.css_to_xpath(f"[id={cls._quote(value)}]")
+        elif by == By.NAME:
+            expression = cls._translator.css_to_xpath(f"[name={cls._quote(value)}]")
+        elif by == By.CLASS_NAME:
+            expression = cls._translator.css_to_xpath(f".{value}")
+        elif by == By.TAG_NAME:
+            expression = f"descendant-or-self::{value}"
+        else:
+            raise ValueError(f"不支持的定位方式: {by}")
+
+        compiled = cls._compiled[locator] = etree.XPath(expression)
+        return compiled
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """生成CSS属性选择器中的字符串字面量"""
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """合并空白字符"""
+        return " ".join(text.split())
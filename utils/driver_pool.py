@@ -0,0 +1,138 @@
+"""
+WebDriver池
+在同一个工作进程内复用浏览器实例，测试之间只重置浏览器状态
+"""
+import threading
+from typing import Callable, Dict, List
+from selenium.common.exceptions import WebDriverException
+from utils.logger import log
+
+
+class DriverPool:
+    """WebDriver池类"""
+
+    def __init__(self, factory: Callable, max_uses: int = 50, max_idle: int = 1):
+        """
+        初始化WebDriver池
+
+        Args:
+            factory: 创建新WebDriver实例的可调用对象
+            max_uses: 单个实例最多被使用的测试次数，达到后回收
+            max_idle: 池中最多保留的空闲实例数
+        """
+        self.factory = factory
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self._idle: List = []
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        借出一个WebDriver实例
+
+        Returns:
+            WebDriver实例
+        """
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+
+        if driver is None:
+            driver = self.factory()
+            self._uses[id(driver)] = 0
+            log.browser_action("Driver pool created new driver")
+
+        self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver, discard: bool = False):
+        """
+        归还WebDriver实例
+
+        Args:
+            driver: WebDriver实例
+            discard: 是否直接回收该实例，不再复用
+        """
+        uses = self._uses.get(id(driver), 0)
+
+        if discard or uses >= self.max_uses:
+            log.browser_action("Driver pool recycling driver", f"uses={uses}")
+            self._quit(driver)
+            return
+
+        if not self.reset(driver):
+            log.browser_action("Driver pool recycling driver", "reset failed")
+            self._quit(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return
+
+        self._quit(driver)
+
+    def reset(self, driver) -> bool:
+        """
+        重置浏览器状态：关闭多余窗口、处理警告框、清理Cookie和Web存储
+
+        Args:
+            driver: WebDriver实例
+
+        Returns:
+            是否重置成功
+        """
+        try:
+            # 关闭未处理的警告框
+            try:
+                driver.switch_to.alert.dismiss()
+            except WebDriverException:
+                pass
+
+            # 只保留第一个窗口
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.switch_to.default_content()
+
+            # 在当前域名下清理存储和Cookie
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.delete_all_cookies()
+
+            # Chromium内核可以一次性清除所有域名的Cookie
+            self._clear_all_cookies(driver)
+
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            log.warning(f"Driver reset failed: {str(e)}")
+            return False
+
+    @staticmethod
+    def _clear_all_cookies(driver):
+        """通过CDP清除所有域名的Cookie（仅Chromium内核的本地会话支持）"""
+        try:
+            driver.execute("executeCdpCommand", {"cmd": "Network.clearBrowserCookies", "params": {}})
+        except Exception:
+            pass
+
+    def close_all(self):
+        """关闭池中所有空闲实例"""
+        with self._lock:
+            drivers, self._idle = self._idle, []
+
+        for driver in drivers:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        """退出浏览器实例"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            log.warning(f"Driver quit failed: {str(e)}")
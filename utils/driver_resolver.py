@@ -0,0 +1,155 @@
+"""
+WebDriver驱动路径解析器
+每个会话只解析一次驱动路径，并按浏览器版本缓存到磁盘清单中供后续运行离线复用
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from utils.config_manager import ConfigManager
+from utils.logger import log
+
+
+class DriverResolver:
+    """WebDriver驱动路径解析器类"""
+
+    # 浏览器名称到webdriver_manager浏览器类型的映射
+    BROWSER_TYPES = {
+        "chrome": "google-chrome",
+        "firefox": "firefox",
+        "edge": "edge"
+    }
+
+    def __init__(self, manifest_file: str = None):
+        """
+        初始化驱动路径解析器
+
+        Args:
+            manifest_file: 磁盘清单文件路径，默认读取配置 driver_cache.manifest
+        """
+        config = ConfigManager.get_instance()
+        self.manifest_file = Path(manifest_file or config.get("driver_cache.manifest", ".webdriver/manifest.json"))
+        self._resolved: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, browser_name: str) -> str:
+        """
+        获取浏览器对应的驱动路径
+
+        Args:
+            browser_name: 浏览器名称 chrome/firefox/edge
+
+        Returns:
+            驱动可执行文件路径
+        """
+        browser_name = browser_name.lower()
+
+        with self._lock:
+            if browser_name in self._resolved:
+                return self._resolved[browser_name]
+
+            browser_version = self._detect_browser_version(browser_name)
+            entry = self._load_manifest().get(browser_name, {})
+
+            if self._is_cache_valid(entry, browser_version):
+                driver_path = entry["driver_path"]
+                log.browser_action("Using cached driver", f"{browser_name} {browser_version} -> {driver_path}")
+            else:
+                driver_path = self._install(browser_name)
+                self._save_entry(browser_name, browser_version, driver_path)
+                log.browser_action("Resolved driver", f"{browser_name} {browser_version} -> {driver_path}")
+
+            self._resolved[browser_name] = driver_path
+            return driver_path
+
+    def _is_cache_valid(self, entry: dict, browser_version: Optional[str]) -> bool:
+        """
+        判断缓存条目是否可用
+
+        Args:
+            entry: 清单中的缓存条目
+            browser_version: 当前安装的浏览器版本
+
+        Returns:
+            缓存是否可用
+        """
+        driver_path = entry.get("driver_path")
+        if not driver_path or not os.path.isfile(driver_path):
+            return False
+
+        # 无法检测浏览器版本时信任已有的缓存
+        if browser_version is None:
+            return True
+
+        return self._major_version(entry.get("browser_version")) == self._major_version(browser_version)
+
+    def _detect_browser_version(self, browser_name: str) -> Optional[str]:
+        """检测本机已安装的浏览器版本"""
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager
+            return OperationSystemManager().get_browser_version_from_os(self.BROWSER_TYPES.get(browser_name))
+        except Exception as e:
+            log.warning(f"检测浏览器版本失败: {str(e)}")
+            return None
+
+    def _install(self, browser_name: str) -> str:
+        """通过webdriver_manager下载或定位驱动"""
+        if browser_name == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return self._fix_chromedriver_path(ChromeDriverManager().install())
+        if browser_name == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        if browser_name == "edge":
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            return EdgeChromiumDriverManager().install()
+        raise ValueError(f"不支持的浏览器: {browser_name}")
+
+    @staticmethod
+    def _fix_chromedriver_path(driver_path: str) -> str:
+        """确保路径指向正确的chromedriver.exe"""
+        if not driver_path.endswith('.exe'):
+            # 如果路径不是.exe文件，尝试找到正确的chromedriver.exe
+            driver_dir = os.path.dirname(driver_path)
+            for file in os.listdir(driver_dir):
+                if file.startswith('chromedriver') and file.endswith('.exe'):
+                    return os.path.join(driver_dir, file)
+        return driver_path
+
+    @staticmethod
+    def _major_version(version: Optional[str]) -> Optional[str]:
+        """获取主版本号"""
+        return version.split(".")[0] if version else None
+
+    def _load_manifest(self) -> dict:
+        """读取磁盘清单"""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_entry(self, browser_name: str, browser_version: Optional[str], driver_path: str):
+        """写入清单条目（先写临时文件再替换，避免并行进程读到半个文件）"""
+        try:
+            manifest = self._load_manifest()
+            manifest[browser_name] = {
+                "browser_version": browser_version,
+                "driver_path": driver_path
+            }
+
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.manifest_file.with_name(f"{self.manifest_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.manifest_file)
+        except OSError as e:
+            log.warning(f"保存驱动清单失败: {str(e)}")
+
+    @staticmethod
+    def get_resolver() -> 'DriverResolver':
+        """获取解析器实例（单例模式）"""
+        if not hasattr(DriverResolver, '_instance'):
+            DriverResolver._instance = DriverResolver()
+        return DriverResolver._instance
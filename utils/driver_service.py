@@ -0,0 +1,124 @@
+"""
+驱动服务管理器
+每个工作进程只启动一个长期运行的驱动服务（chromedriver/geckodriver/msedgedriver），
+所有浏览器会话都连接到该服务的URL
+"""
+import threading
+from typing import Dict
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from utils.config_manager import ConfigManager
+from utils.driver_resolver import DriverResolver
+from utils.logger import log
+
+
+class DriverServiceManager:
+    """驱动服务管理器类"""
+
+    SERVICE_CLASSES = {
+        "chrome": ChromeService,
+        "firefox": FirefoxService,
+        "edge": EdgeService
+    }
+
+    def __init__(self, ignore_proxy: bool = None):
+        """
+        初始化驱动服务管理器
+
+        Args:
+            ignore_proxy: 连接本地驱动服务时是否忽略HTTP(S)_PROXY环境变量，
+                默认读取配置 browser.ignore_local_proxy
+        """
+        if ignore_proxy is None:
+            ignore_proxy = ConfigManager.get_instance().get("browser.ignore_local_proxy", False)
+        self.ignore_proxy = ignore_proxy
+        self._services: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def create_driver(self, browser_name: str, options):
+        """
+        在共享的驱动服务上创建新的浏览器会话
+
+        Args:
+            browser_name: 浏览器名称 chrome/firefox/edge
+            options: 浏览器选项
+
+        Returns:
+            WebDriver实例
+        """
+        browser_name = browser_name.lower()
+        service_url = self.get_service_url(browser_name, options)
+        ignore_proxy = self.ignore_proxy
+
+        if browser_name == "chrome":
+            executor = ChromiumRemoteConnection(service_url, "goog", "chrome", keep_alive=True,
+                                                ignore_proxy=ignore_proxy)
+        elif browser_name == "edge":
+            executor = ChromiumRemoteConnection(service_url, "ms", "MicrosoftEdge", keep_alive=True,
+                                                ignore_proxy=ignore_proxy)
+        else:
+            executor = FirefoxRemoteConnection(service_url, keep_alive=True, ignore_proxy=ignore_proxy)
+
+        return webdriver.Remote(command_executor=executor, options=options)
+
+    def get_service_url(self, browser_name: str, options) -> str:
+        """
+        获取驱动服务地址，服务未启动或已退出时重新启动
+
+        Args:
+            browser_name: 浏览器名称
+            options: 浏览器选项（驱动路径解析失败时用于Selenium Manager查找驱动）
+
+        Returns:
+            服务URL
+        """
+        with self._lock:
+            service = self._services.get(browser_name)
+            if service is not None and service.process.poll() is None:
+                return service.service_url
+
+            service = self._start_service(browser_name, options)
+            self._services[browser_name] = service
+            return service.service_url
+
+    def _start_service(self, browser_name: str, options):
+        """启动驱动服务进程"""
+        service_class = self.SERVICE_CLASSES.get(browser_name)
+        if service_class is None:
+            raise ValueError(f"不支持的浏览器: {browser_name}")
+
+        try:
+            service = service_class(DriverResolver.get_resolver().resolve(browser_name))
+        except Exception as e:
+            # 如果自动下载失败，交给Selenium Manager查找系统中的驱动
+            log.warning(f"自动下载{browser_name}驱动失败，尝试使用系统驱动: {str(e)}")
+            service = service_class()
+            service.path = DriverFinder.get_path(service, options)
+
+        service.start()
+        log.browser_action("Started driver service", f"{browser_name} {service.service_url}")
+        return service
+
+    def stop_all(self):
+        """停止所有驱动服务"""
+        with self._lock:
+            services, self._services = list(self._services.items()), {}
+
+        for browser_name, service in services:
+            try:
+                service.stop()
+                log.browser_action("Stopped driver service", browser_name)
+            except Exception as e:
+                log.warning(f"停止驱动服务失败: {str(e)}")
+
+    @staticmethod
+    def get_manager() -> 'DriverServiceManager':
+        """获取驱动服务管理器实例（单例模式）"""
+        if not hasattr(DriverServiceManager, '_instance'):
+            DriverServiceManager._instance = DriverServiceManager()
+        return DriverServiceManager._instance
@@ -0,0 +1,187 @@
+"""
+浏览器预热器
+后台线程提前启动若干备用浏览器会话，测试需要时立即取用
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+from utils.logger import log
+
+
+class DriverSpawner:
+    """浏览器预热器类"""
+
+    # 因内存不足暂停预热时，重新检查可用内存的间隔（秒）
+    MEMORY_RECHECK_INTERVAL = 10
+
+    # 预热失败后的重试间隔（秒）：首次间隔和最大间隔，连续失败达到次数上限后停止预热
+    RETRY_DELAY = (5, 60)
+    MAX_FAILURES = 5
+
+    def __init__(self, factory: Callable, depth: int = 1, memory_ceiling_mb: int = 2048,
+                 session_memory_mb: int = 400):
+        """
+        初始化浏览器预热器
+
+        Args:
+            factory: 创建已配置好窗口大小和超时的WebDriver实例的可调用对象
+            depth: 保持的备用会话数量
+            memory_ceiling_mb: 备用会话可占用的内存上限（MB）
+            session_memory_mb: 单个浏览器会话的预估内存（MB）
+        """
+        self.factory = factory
+        self.depth = depth
+        self.memory_ceiling_mb = memory_ceiling_mb
+        self.session_memory_mb = session_memory_mb
+        self._spares = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._memory_paused = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """启动后台预热线程"""
+        if self.depth <= 0 or self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="driver-spawner", daemon=True)
+        self._thread.start()
+        log.browser_action("Driver spawner started", f"depth={self.depth}")
+
+    def take(self):
+        """
+        获取一个浏览器会话，优先使用已预热的备用会话
+
+        Returns:
+            WebDriver实例
+        """
+        while True:
+            with self._condition:
+                driver = self._spares.popleft() if self._spares else None
+                # 通知后台线程补充备用会话
+                self._condition.notify()
+
+            if driver is None:
+                return self.factory()
+
+            # 备用会话可能闲置超过Grid的会话超时而失效，交出前先确认仍然可用
+            if self._is_alive(driver):
+                log.browser_action("Took pre-warmed driver")
+                return driver
+
+            log.warning("备用浏览器会话已失效，丢弃并改用其他会话")
+            self._quit(driver)
+
+    def stop(self):
+        """停止后台线程并关闭所有备用会话"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join(timeout=60)
+            self._thread = None
+
+        with self._condition:
+            spares, self._spares = list(self._spares), deque()
+
+        for driver in spares:
+            self._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        """用一次廉价的命令探测会话是否仍然有效"""
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        """退出浏览器实例，会话已失效时忽略错误"""
+        try:
+            driver.quit()
+        except Exception as e:
+            log.warning(f"Driver quit failed: {str(e)}")
+
+    def _run(self):
+        """后台线程：保持备用会话数量"""
+        failures = 0
+        while True:
+            with self._condition:
+                # 带超时等待：因内存不足暂停时，内存释放后无需等到下一次take()也能继续预热
+                while not self._stopped and not self._should_spawn():
+                    self._condition.wait(timeout=self.MEMORY_RECHECK_INTERVAL)
+                if self._stopped:
+                    return
+
+            try:
+                driver = self.factory()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                if failures >= self.MAX_FAILURES:
+                    log.error(f"预热浏览器连续失败{failures}次，停止预热，之后的会话按需创建: {str(e)}")
+                    return
+                first, longest = self.RETRY_DELAY
+                delay = min(first * (2 ** (failures - 1)), longest)
+                log.warning(f"预热浏览器失败，{delay}秒后重试: {str(e)}")
+                with self._condition:
+                    # 等待期间可以被stop()唤醒
+                    if not self._stopped:
+                        self._condition.wait(timeout=delay)
+                continue
+
+            with self._condition:
+                if self._stopped:
+                    stopped_driver = driver
+                else:
+                    self._spares.append(driver)
+                    stopped_driver = None
+
+            if stopped_driver is not None:
+                stopped_driver.quit()
+                return
+
+    def _should_spawn(self) -> bool:
+        """判断是否需要再启动一个备用会话"""
+        if len(self._spares) >= self.depth:
+            return False
+
+        if (len(self._spares) + 1) * self.session_memory_mb > self.memory_ceiling_mb:
+            return False
+
+        available_mb = self._available_memory_mb()
+        if available_mb is not None and available_mb < self.session_memory_mb:
+            # 暂停期间会定期重新检查，只在开始暂停时记录一次
+            if not self._memory_paused:
+                log.warning(f"可用内存不足 ({available_mb}MB)，暂停预热浏览器")
+                self._memory_paused = True
+            return False
+
+        if self._memory_paused:
+            log.browser_action("Driver spawner resumed", f"available={available_mb}MB")
+            self._memory_paused = False
+
+        return True
+
+    @staticmethod
+    def _available_memory_mb() -> Optional[int]:
+        """获取系统可用内存（MB），无法获取时返回None"""
+        try:
+            import psutil
+            return int(psutil.virtual_memory().available / 1024 / 1024)
+        except ImportError:
+            pass
+
+        try:
+            with open("/proc/meminfo", 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) // 1024
+        except OSError:
+            pass
+
+        return None
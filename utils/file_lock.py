@@ -0,0 +1,87 @@
+"""
+跨进程文件锁
+基于操作系统的文件锁（POSIX fcntl.flock / Windows msvcrt.locking），持有锁的进程退出时自动释放
+"""
+import os
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Windows没有fcntl，使用msvcrt的字节锁
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """基于操作系统文件锁的跨进程锁，持有锁的进程退出时由系统自动释放，不会留下失效的锁"""
+
+    def __init__(self, path: str, timeout: float = 30):
+        """
+        初始化文件锁
+
+        Args:
+            path: 锁文件路径（长期保留，只用于加锁）
+            timeout: 等待锁的最长时间（秒）
+        """
+        self.path = str(path)
+        self.timeout = timeout
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> 'FileLock':
+        """
+        获取锁，timeout为0时只尝试一次
+
+        Returns:
+            锁自身
+
+        Raises:
+            TimeoutError: 超时仍未获取到锁
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._lock(fd)
+                self._fd = fd
+                return self
+            except OSError:
+                if time.monotonic() > deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"等待文件锁超时: {self.path}")
+                time.sleep(0.05)
+
+    def release(self):
+        """释放锁"""
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            self._unlock(fd)
+        finally:
+            os.close(fd)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    @staticmethod
+    def _lock(fd: int):
+        """非阻塞加排他锁，已被占用时抛出OSError"""
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    @staticmethod
+    def _unlock(fd: int):
+        """释放锁"""
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,207 @@
+"""
+Selenium Grid客户端
+查询Hub的会话槽位，为各个xdist工作进程分配会话配额
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.request
+from typing import Callable, Dict, List, Tuple
+from utils.file_lock import FileLock
+from utils.logger import log
+
+
+class GridClient:
+    """Selenium Grid客户端类"""
+
+    # 浏览器名称到Grid节点stereotype中browserName的映射
+    BROWSER_NAMES = {
+        "chrome": "chrome",
+        "firefox": "firefox",
+        "edge": "MicrosoftEdge"
+    }
+
+    def __init__(self, grid_url: str, request_timeout: int = 5, slot_dir: str = ".webdriver/grid_slots"):
+        """
+        初始化Grid客户端
+
+        Args:
+            grid_url: Grid Hub地址，如 http://localhost:4444
+            request_timeout: 查询状态接口的超时时间
+            slot_dir: 槽位令牌（文件锁）所在目录，同一台机器上的所有工作进程共用
+        """
+        self.grid_url = grid_url.rstrip("/")
+        if self.grid_url.endswith("/wd/hub"):
+            self.grid_url = self.grid_url[:-len("/wd/hub")]
+        self.request_timeout = request_timeout
+        self.slot_dir = slot_dir
+        self._budgets: Dict[str, Tuple[int, int]] = {}
+        self._held: List[FileLock] = []
+        self._session_count = 0
+        self._lock = threading.Lock()
+
+    def get_status(self) -> Dict:
+        """获取Hub的 /status 信息"""
+        with urllib.request.urlopen(f"{self.grid_url}/status", timeout=self.request_timeout) as response:
+            return json.loads(response.read().decode("utf-8")).get("value", {})
+
+    def get_slots(self, browser_name: str) -> Tuple[int, int]:
+        """
+        统计某个浏览器的槽位
+
+        Args:
+            browser_name: 浏览器名称 chrome/firefox/edge
+
+        Returns:
+            (总槽位数, 空闲槽位数)
+        """
+        grid_browser = self.BROWSER_NAMES.get(browser_name.lower(), browser_name)
+        total = free = 0
+
+        for node in self.get_status().get("nodes", []):
+            if node.get("availability") != "UP":
+                continue
+            for slot in node.get("slots", []):
+                if slot.get("stereotype", {}).get("browserName") != grid_browser:
+                    continue
+                total += 1
+                if slot.get("session") is None:
+                    free += 1
+
+        return total, free
+
+    def wait_for_free_slot(self, browser_name: str, timeout: int = 300, poll_interval: float = 1.0) -> bool:
+        """
+        等待出现空闲槽位，避免新会话进入Hub的排队队列
+
+        Args:
+            browser_name: 浏览器名称
+            timeout: 最长等待时间
+            poll_interval: 轮询间隔
+
+        Returns:
+            是否等到空闲槽位
+        """
+        deadline = time.time() + timeout
+        while True:
+            try:
+                _, free = self.get_slots(browser_name)
+                if free > 0:
+                    return True
+            except Exception as e:
+                log.warning(f"查询Grid状态失败: {str(e)}")
+
+            if time.time() >= deadline:
+                log.warning(f"等待Grid空闲槽位超时: {browser_name}")
+                return False
+            time.sleep(poll_interval)
+
+    def get_worker_session_budget(self, browser_name: str) -> int:
+        """
+        计算当前xdist工作进程可同时打开的会话数
+
+        总槽位在各工作进程之间平均分配，余数分给编号靠前的进程
+
+        Args:
+            browser_name: 浏览器名称
+
+        Returns:
+            会话配额（至少为1）
+        """
+        try:
+            total, _ = self.get_slots(browser_name)
+        except Exception as e:
+            log.warning(f"查询Grid状态失败: {str(e)}")
+            self._budgets[browser_name.lower()] = (0, 1)
+            return 1
+
+        worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+        worker_id = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+        worker_index = int(worker_id[2:]) if worker_id[2:].isdigit() else 0
+
+        budget = total // worker_count + (1 if worker_index < total % worker_count else 0)
+        log.browser_action("Grid session budget", f"{worker_id}: {budget}/{total} slots")
+        if budget == 0:
+            log.warning(f"工作进程数({worker_count})多于Grid槽位({total})，{worker_id} 与其他进程轮流使用槽位")
+        self._budgets[browser_name.lower()] = (total, max(1, budget))
+        return max(1, budget)
+
+    def reserve_session(self, browser_name: str, timeout: int = 300,
+                        poll_interval: float = 1.0) -> Callable[[], None]:
+        """
+        为一个新会话占用槽位，会话退出后调用返回的函数释放
+
+        本工作进程的会话（使用中+备用）不超过配额；所有工作进程合计不超过Hub的总槽位，
+        每个槽位对应共享目录下的一个文件锁，进程退出时由系统释放；
+        占到令牌后再确认Hub上确实有空闲槽位（Hub可能还有其他客户端）
+
+        Args:
+            browser_name: 浏览器名称
+            timeout: 最长等待时间
+            poll_interval: 轮询间隔
+
+        Returns:
+            释放槽位的函数
+
+        Raises:
+            RuntimeError: 超时仍没有可用槽位
+        """
+        key = browser_name.lower()
+        if key not in self._budgets:
+            self.get_worker_session_budget(browser_name)
+        total, budget = self._budgets[key]
+
+        deadline = time.time() + timeout
+        while True:
+            token = self._take_token(key, total, budget)
+            if token is not None:
+                remaining = max(deadline - time.time(), 0)
+                if self.wait_for_free_slot(browser_name, timeout=remaining, poll_interval=poll_interval):
+                    return lambda: self._return_token(token)
+                self._return_token(token)
+                break
+
+            if time.time() >= deadline:
+                break
+            time.sleep(poll_interval)
+
+        raise RuntimeError(f"Selenium Grid在{timeout}秒内没有可用的 {browser_name} 槽位"
+                           f"（本进程配额 {budget}，总槽位 {total}），未创建会话")
+
+    def _take_token(self, key: str, total: int, budget: int):
+        """
+        尝试占用一个槽位令牌，不等待
+
+        Returns:
+            令牌（总槽位未知时为True），本进程已达配额或所有槽位都被占用时返回None
+        """
+        with self._lock:
+            if self._session_count >= budget:
+                return None
+
+            # 查询不到总槽位时只限制本进程的会话数
+            if total <= 0:
+                self._session_count += 1
+                return True
+
+            url_hash = hashlib.md5(self.grid_url.encode("utf-8")).hexdigest()[:8]
+            for index in range(total):
+                lock = FileLock(os.path.join(self.slot_dir, f"{url_hash}-{key}-{index}.lock"), timeout=0)
+                try:
+                    lock.acquire()
+                except TimeoutError:
+                    continue
+                self._held.append(lock)
+                self._session_count += 1
+                return lock
+        return None
+
+    def _return_token(self, token):
+        """释放槽位令牌"""
+        with self._lock:
+            self._session_count -= 1
+            if isinstance(token, FileLock):
+                self._held.remove(token)
+                token.release()
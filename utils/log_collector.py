@@ -0,0 +1,123 @@
+"""
+日志汇集服务
+并行执行时主进程监听本地端口，xdist工作进程把格式化好的日志行发送过来，
+只有主进程写入和轮转日志文件
+"""
+import json
+import socket
+import socketserver
+import struct
+import sys
+import threading
+from typing import Callable, Optional
+
+
+# 主进程通过环境变量把汇集服务地址传给之后启动的工作进程
+COLLECTOR_ENV = "AUTOMATION_LOG_COLLECTOR"
+
+# 每条日志的帧头：4字节大端长度
+_HEADER = struct.Struct(">I")
+
+
+class _CollectorHandler(socketserver.StreamRequestHandler):
+    """读取一个工作进程连接上的所有日志帧"""
+
+    def handle(self):
+        while True:
+            header = self.rfile.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            (size,) = _HEADER.unpack(header)
+            record = json.loads(self.rfile.read(size).decode("utf-8"))
+            self.server.write(record["level"], record["text"])
+
+
+class _CollectorServer(socketserver.ThreadingTCPServer):
+    """每个连接一个守护线程的TCP服务"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple, write: Callable[[str, str], None]):
+        super().__init__(address, _CollectorHandler)
+        self.write = write
+
+
+class LogCollector:
+    """日志汇集服务类（运行在主进程）"""
+
+    def __init__(self, write: Callable[[str, str], None], host: str = "127.0.0.1", port: int = 0):
+        """
+        初始化日志汇集服务
+
+        Args:
+            write: 写入一条日志的函数，参数为 (级别名称, 格式化好的日志行)
+            host: 监听地址
+            port: 监听端口，0表示由系统分配
+        """
+        self._write = write
+        self._host = host
+        self._port = port
+        self._server: Optional[_CollectorServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """
+        启动汇集服务
+
+        Returns:
+            监听地址 host:port
+        """
+        if self._server is None:
+            self._server = _CollectorServer((self._host, self._port), self._write)
+            self._thread = threading.Thread(target=self._server.serve_forever,
+                                            name="log-collector", daemon=True)
+            self._thread.start()
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def stop(self):
+        """停止汇集服务"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+
+class SocketSink:
+    """工作进程的loguru sink：把格式化好的日志行发送给主进程的LogCollector"""
+
+    def __init__(self, address: str):
+        """
+        初始化sink
+
+        Args:
+            address: 汇集服务地址 host:port
+        """
+        host, port = address.rsplit(":", 1)
+        self._address = (host, int(port))
+        self._socket: Optional[socket.socket] = None
+
+    def __call__(self, message):
+        """发送一条日志，连接失败时写到stderr，不影响测试执行"""
+        payload = json.dumps({
+            "level": message.record["level"].name,
+            "text": str(message)
+        }, ensure_ascii=False).encode("utf-8")
+        try:
+            if self._socket is None:
+                self._socket = socket.create_connection(self._address, timeout=5)
+            self._socket.sendall(_HEADER.pack(len(payload)) + payload)
+        except OSError:
+            self._close()
+            sys.stderr.write(str(message))
+
+    def _close(self):
+        """关闭连接"""
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
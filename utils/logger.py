@@ -3,18 +3,98 @@
 基于loguru的日志记录功能
 """
 import os
+import re
 import sys
+import threading
+from collections import deque
 from pathlib import Path
+from typing import Callable, Optional, Union
 from loguru import logger
 from utils.config_manager import ConfigManager
+from utils.log_collector import COLLECTOR_ENV, LogCollector, SocketSink
+
+
+# 日志消息：字符串，或只在日志级别开启时才调用的无参函数
+Message = Union[str, Callable[[], str]]
+
+
+class TestLogBuffer:
+    """单个测试的环形日志缓冲sink，只保留最近的若干行"""
+
+    def __init__(self, max_lines: int = 5000):
+        """
+        初始化缓冲
+
+        Args:
+            max_lines: 最多保留的日志行数，超出后丢弃最早的行
+        """
+        self.test_id: Optional[str] = None
+        self._lines = deque(maxlen=max_lines)
+
+    @property
+    def active(self) -> bool:
+        """是否正在记录某个测试"""
+        return self.test_id is not None
+
+    def __call__(self, message):
+        """loguru sink：测试执行期间缓存格式化好的日志行"""
+        if self.test_id is not None:
+            self._lines.append(str(message))
+
+    def start(self, test_id: str):
+        """开始记录一个测试"""
+        self._lines.clear()
+        self.test_id = test_id
+
+    def drain(self) -> str:
+        """取出并清空已缓存的日志"""
+        text = "".join(self._lines)
+        self._lines.clear()
+        return text
+
+    def stop(self):
+        """结束当前测试，丢弃缓存"""
+        self._lines.clear()
+        self.test_id = None
 
 
 class Logger:
     """日志管理器类"""
 
-    def __init__(self):
-        """初始化日志管理器"""
-        self.config = ConfigManager()
+    # 各类日志对应的级别
+    CATEGORY_LEVELS = {
+        "debug": "DEBUG",
+        "info": "INFO",
+        "warning": "WARNING",
+        "error": "ERROR",
+        "critical": "CRITICAL",
+        "step": "INFO",
+        "result": "INFO",
+        "api": "INFO",
+        "page_action": "INFO",
+        "assertion": "INFO",
+        "test": "INFO",
+        "browser": "INFO",
+        "data": "INFO",
+        "performance": "INFO"
+    }
+
+    # quiet模式下保留的INFO类日志（警告及以上级别始终保留）
+    QUIET_CATEGORIES = ("step", "result")
+
+    _lock = threading.Lock()
+
+    def __init__(self, profile: str = None):
+        """
+        初始化日志管理器
+
+        Args:
+            profile: 日志模式 verbose/quiet，默认读取配置 logging.profile
+        """
+        self.config = ConfigManager.get_instance()
+        self.profile = profile or self.config.get("logging.profile", "verbose")
+        self._collector = None
+        self._test_buffer: Optional[TestLogBuffer] = None
         self._setup_logger()
 
     def _setup_logger(self):
@@ -29,116 +109,271 @@ class Logger:
         log_file = self.config.get("logging.file", "reports/logs/automation.log")
         rotation = self.config.get("logging.rotation", "10 MB")
         retention = self.config.get("logging.retention", "30 days")
+        capture = self.config.get("logging.test_capture", {}) or {}
+        self._warning_level = logger.level("WARNING").no
+        self._failed_dir = capture.get("failed_dir", "reports/logs/failed")
 
-        # 确保日志目录存在
-        log_dir = Path(log_file).parent
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        # 添加控制台输出
+        # 添加控制台输出（其他工作进程转发来的日志只写文件）
         logger.add(
             sys.stdout,
             format=log_format,
             level=log_level,
             colorize=True,
-            enqueue=True
+            filter=lambda record: "forwarded" not in record["extra"]
         )
 
-        # 添加文件输出
-        logger.add(
-            log_file,
-            format=log_format,
-            level=log_level,
-            rotation=rotation,
-            retention=retention,
-            encoding="utf-8",
-            enqueue=True
-        )
+        collector_address = os.environ.get(COLLECTOR_ENV)
+        if collector_address and os.environ.get("PYTEST_XDIST_WORKER"):
+            # xdist工作进程把日志发送给主进程，不再各自打开和轮转同一个日志文件
+            logger.add(SocketSink(collector_address), format=log_format, level=log_level,
+                       filter=self._persistent_filter)
+        else:
+            # 确保日志目录存在
+            log_dir = Path(log_file).parent
+            log_dir.mkdir(parents=True, exist_ok=True)
+
+            # 添加文件输出
+            logger.add(
+                log_file,
+                format=log_format,
+                level=log_level,
+                rotation=rotation,
+                retention=retention,
+                encoding="utf-8",
+                enqueue=True,
+                filter=self._persistent_filter
+            )
+
+        # 测试执行期间的完整日志先进入环形缓冲，失败时才写入磁盘
+        if capture.get("enabled", False):
+            self._test_buffer = TestLogBuffer(capture.get("buffer_size", 5000))
+            logger.add(
+                self._test_buffer,
+                format=log_format,
+                level=log_level,
+                filter=lambda record: "forwarded" not in record["extra"]
+            )
 
-        # 绑定到实例
+        # 绑定到实例，步骤、结果和测试起止日志标记为摘要
         self.logger = logger.bind(name="AutomationTest")
+        self._summary_logger = logger.bind(name="AutomationTest", summary=True)
 
-    def info(self, message: str, **kwargs):
+        # 预先计算每类日志是否输出，关闭的日志在构造消息之前直接返回
+        min_level = logger.level(log_level.upper()).no
+        quiet = self.profile == "quiet"
+        self._enabled = {}
+        for category, level in self.CATEGORY_LEVELS.items():
+            level_no = logger.level(level).no
+            self._enabled[category] = level_no >= min_level and (
+                not quiet or level_no >= self._warning_level or category in self.QUIET_CATEGORIES
+            )
+
+    def is_enabled(self, category: str) -> bool:
+        """
+        判断某类日志是否会输出
+
+        Args:
+            category: 日志类别，见 CATEGORY_LEVELS
+
+        Returns:
+            是否输出
+        """
+        return self._enabled.get(category, True)
+
+    def _persistent_filter(self, record) -> bool:
+        """
+        持久日志的过滤条件：测试执行期间只写入摘要和警告以上级别的日志，
+        其余日志由测试缓冲决定是否落盘；测试之外（会话准备、收尾）的日志照常写入
+        """
+        buffer = self._test_buffer
+        return (buffer is None or not buffer.active or "summary" in record["extra"] or
+                "forwarded" in record["extra"] or record["level"].no >= self._warning_level)
+
+    def start_test_capture(self, test_id: str):
+        """
+        开始缓存一个测试的日志
+
+        Args:
+            test_id: 测试ID（nodeid）
+        """
+        if self._test_buffer is not None:
+            self._test_buffer.start(test_id)
+
+    def flush_test_capture(self) -> Optional[str]:
+        """
+        把当前测试已缓存的日志追加写入失败日志文件，测试失败时调用
+
+        Returns:
+            写入的日志内容，未开启缓存或没有日志时返回None
+        """
+        buffer = self._test_buffer
+        if buffer is None or not buffer.active:
+            return None
+        text = buffer.drain()
+        if not text:
+            return None
+
+        os.makedirs(self._failed_dir, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]+", "_", buffer.test_id).strip("_") + ".log"
+        with open(os.path.join(self._failed_dir, file_name), "a", encoding="utf-8") as file:
+            file.write(text)
+        return text
+
+    def stop_test_capture(self):
+        """结束当前测试，丢弃未写入的缓存"""
+        if self._test_buffer is not None:
+            self._test_buffer.stop()
+
+    @staticmethod
+    def _render(value) -> str:
+        """生成消息内容：函数延迟调用，定位器元组格式化为 by='value'"""
+        if callable(value):
+            return value()
+        if isinstance(value, tuple) and len(value) == 2:
+            return f"{value[0]}='{value[1]}'"
+        return value
+
+    def info(self, message: Message, **kwargs):
         """记录信息日志"""
-        self.logger.info(message, **kwargs)
+        if self._enabled["info"]:
+            self.logger.info(self._render(message), **kwargs)
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: Message, **kwargs):
         """记录调试日志"""
-        self.logger.debug(message, **kwargs)
+        if self._enabled["debug"]:
+            self.logger.debug(self._render(message), **kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: Message, **kwargs):
         """记录警告日志"""
-        self.logger.warning(message, **kwargs)
+        if self._enabled["warning"]:
+            self.logger.warning(self._render(message), **kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: Message, **kwargs):
         """记录错误日志"""
-        self.logger.error(message, **kwargs)
+        if self._enabled["error"]:
+            self.logger.error(self._render(message), **kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: Message, **kwargs):
         """记录严重错误日志"""
-        self.logger.critical(message, **kwargs)
+        if self._enabled["critical"]:
+            self.logger.critical(self._render(message), **kwargs)
 
-    def exception(self, message: str, **kwargs):
+    def exception(self, message: Message, **kwargs):
         """记录异常日志"""
-        self.logger.exception(message, **kwargs)
+        if self._enabled["error"]:
+            self.logger.exception(self._render(message), **kwargs)
 
-    def step(self, message: str, **kwargs):
+    def step(self, message: Message, **kwargs):
         """记录测试步骤"""
-        self.logger.info(f"🔸 STEP: {message}", **kwargs)
+        if self._enabled["step"]:
+            self._summary_logger.info(f"🔸 STEP: {self._render(message)}", **kwargs)
 
-    def result(self, message: str, success: bool = True, **kwargs):
+    def result(self, message: Message, success: bool = True, **kwargs):
         """记录测试结果"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        self.logger.info(f"{status}: {message}", **kwargs)
+        if self._enabled["result"]:
+            status = "✅ PASS" if success else "❌ FAIL"
+            self._summary_logger.info(f"{status}: {self._render(message)}", **kwargs)
 
     def api_request(self, method: str, url: str, **kwargs):
         """记录API请求"""
-        self.logger.info(f"📤 API Request: {method} {url}", **kwargs)
+        if self._enabled["api"]:
+            self.logger.info(f"📤 API Request: {method} {url}", **kwargs)
 
     def api_response(self, status_code: int, response_time: float = None, **kwargs):
         """记录API响应"""
-        time_info = f" ({response_time:.2f}s)" if response_time else ""
-        self.logger.info(f"📥 API Response: {status_code}{time_info}", **kwargs)
+        if self._enabled["api"]:
+            time_info = f" ({response_time:.2f}s)" if response_time else ""
+            self.logger.info(f"📥 API Response: {status_code}{time_info}", **kwargs)
+
+    def page_action(self, action: str, element: Union[Message, tuple] = None, **kwargs):
+        """
+        记录页面操作
 
-    def page_action(self, action: str, element: str = None, **kwargs):
-        """记录页面操作"""
-        element_info = f" on '{element}'" if element else ""
-        self.logger.info(f"🔄 Page Action: {action}{element_info}", **kwargs)
+        Args:
+            action: 操作名称
+            element: 操作对象，可以是字符串、定位器元组或延迟生成字符串的函数
+        """
+        if self._enabled["page_action"]:
+            element_info = f" on '{self._render(element)}'" if element else ""
+            self.logger.info(f"🔄 Page Action: {action}{element_info}", **kwargs)
 
     def assertion(self, message: str, expected: str, actual: str, **kwargs):
         """记录断言信息"""
-        self.logger.info(f"🔍 Assertion: {message} | Expected: '{expected}' | Actual: '{actual}'", **kwargs)
+        if self._enabled["assertion"]:
+            self.logger.info(f"🔍 Assertion: {message} | Expected: '{expected}' | Actual: '{actual}'", **kwargs)
 
     def test_start(self, test_name: str, **kwargs):
         """记录测试开始"""
-        self.logger.info(f"🚀 Test Started: {test_name}", **kwargs)
+        if self._enabled["test"]:
+            self._summary_logger.info(f"🚀 Test Started: {test_name}", **kwargs)
 
     def test_end(self, test_name: str, status: str, duration: float = None, **kwargs):
         """记录测试结束"""
-        duration_info = f" ({duration:.2f}s)" if duration else ""
-        emoji = "✅" if status.upper() == "PASSED" else "❌" if status.upper() == "FAILED" else "⏭️"
-        self.logger.info(f"{emoji} Test Finished: {test_name} - {status.upper()}{duration_info}", **kwargs)
+        if self._enabled["test"]:
+            duration_info = f" ({duration:.2f}s)" if duration else ""
+            emoji = "✅" if status.upper() == "PASSED" else "❌" if status.upper() == "FAILED" else "⏭️"
+            self._summary_logger.info(f"{emoji} Test Finished: {test_name} - {status.upper()}{duration_info}", **kwargs)
 
-    def browser_action(self, action: str, details: str = None, **kwargs):
+    def browser_action(self, action: str, details: Message = None, **kwargs):
         """记录浏览器操作"""
-        details_info = f" - {details}" if details else ""
-        self.logger.info(f"🌐 Browser: {action}{details_info}", **kwargs)
+        if self._enabled["browser"]:
+            details_info = f" - {self._render(details)}" if details else ""
+            self.logger.info(f"🌐 Browser: {action}{details_info}", **kwargs)
 
     def data_operation(self, operation: str, data_type: str = None, **kwargs):
         """记录数据操作"""
-        data_info = f" ({data_type})" if data_type else ""
-        self.logger.info(f"📊 Data Operation: {operation}{data_info}", **kwargs)
+        if self._enabled["data"]:
+            data_info = f" ({data_type})" if data_type else ""
+            self.logger.info(f"📊 Data Operation: {operation}{data_info}", **kwargs)
 
     def performance(self, metric: str, value: float, unit: str = "ms", **kwargs):
         """记录性能指标"""
-        self.logger.info(f"⚡ Performance: {metric} = {value}{unit}", **kwargs)
+        if self._enabled["performance"]:
+            self.logger.info(f"⚡ Performance: {metric} = {value}{unit}", **kwargs)
+
+    def start_collector(self) -> str:
+        """
+        在主进程启动日志汇集服务，之后启动的xdist工作进程通过环境变量找到它
+
+        Returns:
+            汇集服务地址 host:port
+        """
+        if self._collector is None:
+            self._collector = LogCollector(self._write_forwarded)
+            os.environ[COLLECTOR_ENV] = self._collector.start()
+        return os.environ[COLLECTOR_ENV]
+
+    def stop_collector(self):
+        """停止日志汇集服务"""
+        if self._collector is not None:
+            self._collector.stop()
+            self._collector = None
+            os.environ.pop(COLLECTOR_ENV, None)
+
+    @staticmethod
+    def _write_forwarded(level: str, text: str):
+        """把工作进程发送来的日志行原样写入日志文件"""
+        logger.bind(forwarded=True).opt(raw=True).log(level, text)
 
     @staticmethod
     def get_logger() -> 'Logger':
-        """获取日志实例（单例模式）"""
+        """获取日志实例（单例模式，每个进程只初始化一次）"""
         if not hasattr(Logger, '_instance'):
-            Logger._instance = Logger()
+            with Logger._lock:
+                if not hasattr(Logger, '_instance'):
+                    Logger._instance = Logger()
         return Logger._instance
 
 
+class _LazyLog:
+    """全局日志代理：导入时不读取配置也不添加sink，第一次记录日志时才初始化Logger"""
+
+    def __getattr__(self, name: str):
+        value = getattr(Logger.get_logger(), name)
+        # 缓存到代理自身，之后的调用不再经过 __getattr__
+        setattr(self, name, value)
+        return value
+
+
 # 便捷的全局日志实例
-log = Logger.get_logger()
+log = _LazyLog()
@@ -0,0 +1,107 @@
+"""
+N+1往返检测器
+分析CommandProfiler记录的命令，找出对同一次查找返回的兄弟元素逐个发送同类命令的循环，
+按浪费的往返耗时输出需要改为批量读取的页面对象方法
+"""
+import json
+import os
+from typing import Dict, List
+
+
+class RoundTripAnalyzer:
+    """N+1往返检测器类"""
+
+    def __init__(self, min_elements: int = 3):
+        """
+        初始化检测器
+
+        Args:
+            min_elements: 同一调用位置对多少个兄弟元素发送同类命令时视为N+1
+        """
+        self.min_elements = min_elements
+        self._totals: Dict[tuple, dict] = {}
+
+    def analyze(self, records: List[dict]) -> List[dict]:
+        """
+        分析一个测试的命令记录
+
+        Args:
+            records: CommandProfiler记录的命令列表
+
+        Returns:
+            N+1问题列表，按耗时降序
+        """
+        # 元素引用 -> 返回它的查找命令序号，同一次查找返回的元素互为兄弟元素
+        origins: Dict[str, int] = {}
+        groups: Dict[tuple, dict] = {}
+
+        for index, record in enumerate(records):
+            for element_id in record.get("elements") or ():
+                origins.setdefault(element_id, index)
+
+            element_id = record.get("element")
+            if element_id is None or element_id not in origins:
+                continue
+
+            key = (record["caller"], record["site"], record["command"], origins[element_id])
+            group = groups.setdefault(key, {"elements": set(), "count": 0, "duration": 0.0})
+            group["elements"].add(element_id)
+            group["count"] += 1
+            group["duration"] += record["duration"]
+
+        findings = []
+        for (caller, site, command, origin), group in groups.items():
+            if len(group["elements"]) < self.min_elements:
+                continue
+            findings.append({
+                "caller": caller,
+                "site": site,
+                "command": command,
+                "lookup": records[origin]["command"],
+                "elements": len(group["elements"]),
+                "round_trips": group["count"],
+                "duration": round(group["duration"], 4)
+            })
+            self._add_to_totals(findings[-1])
+
+        return sorted(findings, key=lambda finding: finding["duration"], reverse=True)
+
+    def ranking(self) -> List[dict]:
+        """
+        汇总所有已分析测试中的N+1问题
+
+        Returns:
+            按总耗时降序排列的 页面对象方法+调用位置+命令 列表
+        """
+        ranking = [dict(total, duration=round(total["duration"], 4)) for total in self._totals.values()]
+        return sorted(ranking, key=lambda total: total["duration"], reverse=True)
+
+    def write_report(self, file_path: str) -> str:
+        """
+        写入汇总报告
+
+        Args:
+            file_path: JSON文件路径
+
+        Returns:
+            JSON文件路径
+        """
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.ranking(), file, ensure_ascii=False, indent=2)
+        return file_path
+
+    def _add_to_totals(self, finding: dict):
+        """累加到全局汇总"""
+        key = (finding["caller"], finding["site"], finding["command"])
+        total = self._totals.setdefault(key, {
+            "caller": finding["caller"],
+            "site": finding["site"],
+            "command": finding["command"],
+            "occurrences": 0,
+            "round_trips": 0,
+            "duration": 0.0
+        })
+        total["occurrences"] += 1
+        total["round_trips"] += finding["round_trips"]
+        total["duration"] += finding["duration"]
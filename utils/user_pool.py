@@ -0,0 +1,159 @@
+"""
+测试用户池
+预先批量生成注册用的测试用户，追加写入JSONL文件；每个xdist工作进程按固定步长读取其中的一部分，
+邮箱按 运行标记+工作进程+行号 改写，并行注册不会冲突
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from utils.file_lock import FileLock
+from utils.logger import log
+
+
+class UserPool:
+    """测试用户池类"""
+
+    def __init__(self, path: str = "data/user_pool.jsonl", worker_index: int = 0, worker_count: int = 1,
+                 namespace: str = ""):
+        """
+        初始化用户池
+
+        Args:
+            path: JSONL文件路径，每行一个用户
+            worker_index: 当前工作进程序号，读取第 worker_index, worker_index+worker_count, ... 行
+            worker_count: 工作进程总数
+            namespace: 改写邮箱时使用的前缀，区分不同的运行和工作进程
+        """
+        self.path = Path(path)
+        self.worker_index = worker_index
+        self.worker_count = max(worker_count, 1)
+        self.namespace = namespace
+        self._lock = FileLock(f"{self.path}.lock")
+        self._offsets: List[int] = []
+        self._scanned = 0
+        self._cursor = 0
+
+    @classmethod
+    def for_worker(cls, path: str, run_tag: str = "") -> 'UserPool':
+        """
+        按xdist环境变量创建当前工作进程的用户池
+
+        Args:
+            path: JSONL文件路径
+            run_tag: 本次运行的标记，与工作进程ID一起组成邮箱前缀
+
+        Returns:
+            用户池实例
+        """
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        worker_index = int(worker[2:]) if worker[2:].isdigit() else 0
+        worker_count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+        return cls(path, worker_index, worker_count, namespace=f"{run_tag}{worker}")
+
+    def size(self) -> int:
+        """
+        获取池中已写入的用户数
+
+        Returns:
+            用户数
+        """
+        return len(self._scan())
+
+    def ensure(self, generate_user: Callable[[], dict], total: int) -> int:
+        """
+        确保池中至少有total个用户，不足时在文件锁内生成并追加写入
+
+        Args:
+            generate_user: 生成单个用户字典的函数
+            total: 需要的用户总数
+
+        Returns:
+            新生成的用户数
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            # 其他工作进程可能已经在等待锁期间补足了用户
+            missing = total - len(self._scan())
+            if missing <= 0:
+                return 0
+
+            lines = "".join(json.dumps(generate_user(), ensure_ascii=False) + "\n" for _ in range(missing))
+            data = memoryview(lines.encode("utf-8"))
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # os.write 可能只写入一部分（信号中断、磁盘将满），循环写完剩余字节
+                while data:
+                    written = os.write(fd, data)
+                    data = data[written:]
+            finally:
+                os.close(fd)
+
+        log.data_operation(f"Generated {missing} pooled users", str(self.path))
+        return missing
+
+    def take(self, generate_user: Callable[[], dict] = None, batch_size: int = 1000) -> Optional[Dict[str, str]]:
+        """
+        取出当前工作进程的下一个用户
+
+        Args:
+            generate_user: 池中用户不足时用于批量补充的函数，为None时不补充
+            batch_size: 每次补充的用户数
+
+        Returns:
+            邮箱已改写的用户字典，池中没有属于本进程的用户且无法补充时返回None
+        """
+        position = self.worker_index + self._cursor * self.worker_count
+        offsets = self._offsets if position < len(self._offsets) else self._scan()
+        if position >= len(offsets):
+            if generate_user is None:
+                return None
+            self.ensure(generate_user, position + batch_size)
+            offsets = self._scan()
+
+        with open(self.path, "rb") as file:
+            file.seek(offsets[position])
+            user = json.loads(file.readline().decode("utf-8"))
+        self._cursor += 1
+
+        local, _, domain = user["email"].partition("@")
+        user["email"] = f"{local}.{self.namespace}.{position}@{domain}"
+        return user
+
+    def _scan(self) -> List[int]:
+        """从上次扫描的位置继续记录完整行的起始偏移，只有追加的部分需要读取"""
+        if not self.path.exists():
+            return self._offsets
+
+        with open(self.path, "rb") as file:
+            file.seek(self._scanned)
+            position = self._scanned
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                self._offsets.append(position)
+                position += len(line)
+            self._scanned = position
+        return self._offsets
+
+
+def main():
+    """命令行入口：预先生成用户池"""
+    from utils.config_manager import ConfigManager
+    from utils.data_manager import DataManager
+
+    config = ConfigManager.get_instance()
+    parser = argparse.ArgumentParser(description="预先生成测试用户池")
+    parser.add_argument("--count", type=int, default=config.get("user_pool.size", 5000), help="用户池总数")
+    parser.add_argument("--path", default=config.get("user_pool.file", "data/user_pool.jsonl"), help="JSONL文件路径")
+    args = parser.parse_args()
+
+    data_manager = DataManager(config)
+    pool = UserPool(args.path)
+    added = pool.ensure(data_manager.build_test_user, args.count)
+    print(f"用户池 {args.path}: 新增 {added}，共 {pool.size()}")
+
+
+if __name__ == "__main__":
+    main()
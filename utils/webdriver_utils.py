@@ -2,6 +2,7 @@
 WebDriver工具类
 提供常用的WebDriver操作方法
 """
+import copy
 import time
 from typing import List, Optional, Union
 from selenium.webdriver.common.by import By
@@ -12,27 +13,510 @@ from selenium.webdriver.support.ui import Select
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     ElementNotInteractableException,
-    StaleElementReferenceException
+    StaleElementReferenceException,
+    NoSuchElementException,
+    UnexpectedAlertPresentException,
+    JavascriptException,
+    WebDriverException
 )
+from utils.config_manager import ConfigManager
+from utils.dom_snapshot import DomSnapshot
 from utils.logger import log
 
 
+# 页面内埋点脚本：统计进行中的fetch/XHR请求数，并用MutationObserver记录最后一次DOM变化时间
+SETTLE_INSTRUMENTATION_JS = """
+(function () {
+    if (window.__pomSettle) { return; }
+    var state = window.__pomSettle = {
+        inflight: 0, lastActivity: Date.now(), domVersion: 0, documentId: Math.random().toString(36).slice(2)
+    };
+    var touch = function () { state.lastActivity = Date.now(); };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            state.inflight++;
+            touch();
+            return originalFetch.apply(this, arguments).finally(function () {
+                state.inflight--;
+                touch();
+            });
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.inflight++;
+        touch();
+        this.addEventListener('loadend', function () {
+            state.inflight--;
+            touch();
+        });
+        return originalSend.apply(this, arguments);
+    };
+
+    new MutationObserver(function () {
+        state.domVersion++;
+        touch();
+    }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+# 异步等待脚本：页面加载完成、没有进行中的请求且DOM安静了quietMs毫秒后返回
+SETTLE_WAIT_JS = SETTLE_INSTRUMENTATION_JS + """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var state = window.__pomSettle, start = Date.now();
+(function check() {
+    var now = Date.now();
+    if (document.readyState === 'complete' && state.inflight <= 0 && now - state.lastActivity >= quietMs) {
+        return done(true);
+    }
+    if (now - start >= timeoutMs) {
+        return done(false);
+    }
+    setTimeout(check, 25);
+})();
+"""
+
+# 浏览器端的定位器解析和可见性判断函数，按Selenium的By定位方式查找元素，供各页面内脚本共用
+LOCATOR_JS = """
+function findAll(by, value) {
+    var selector;
+    switch (by) {
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+                var linkText = (a.innerText || '').trim();
+                return by === 'link text' ? linkText === value : linkText.indexOf(value) !== -1;
+            });
+        case 'id': selector = '#' + CSS.escape(value); break;
+        case 'name': selector = '[name="' + CSS.escape(value) + '"]'; break;
+        case 'class name': selector = '.' + CSS.escape(value); break;
+        default: selector = value;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(selector));
+}
+
+function isVisible(el) {
+    if (!el.isConnected) { return false; }
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility !== 'visible' || parseFloat(style.opacity) === 0) {
+        return false;
+    }
+    var rects = el.getClientRects();
+    for (var i = 0; i < rects.length; i++) {
+        if (rects[i].width > 0 && rects[i].height > 0) { return true; }
+    }
+    return false;
+}
+"""
+
+# 浏览器端推送等待脚本：先检查一次条件，不满足时由MutationObserver和过渡/动画结束事件触发重新检查，
+# 满足条件后立即返回，无需客户端每500ms轮询一次。mode为any/all时同一个循环内检查多个定位器
+PUSH_WAIT_JS = LOCATOR_JS + """
+var locators = arguments[0], state = arguments[1], text = arguments[2], mode = arguments[3],
+    timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+
+function checkOne(locator) {
+    var nodes = findAll(locator[0], locator[1]), el = nodes[0];
+    switch (state) {
+        case 'present': return el || null;
+        case 'all_present': return nodes.length ? nodes : null;
+        case 'visible': return el && isVisible(el) ? el : null;
+        case 'clickable': return el && isVisible(el) && !el.disabled ? el : null;
+        case 'invisible': return !el || !isVisible(el) ? true : null;
+        case 'text': return el && (el.innerText || '').indexOf(text) !== -1 ? true : null;
+    }
+    return null;
+}
+
+function check() {
+    var i;
+    if (mode === 'any') {
+        for (i = 0; i < locators.length; i++) {
+            if (checkOne(locators[i]) !== null) { return {index: i}; }
+        }
+        return null;
+    }
+    if (mode === 'all') {
+        for (i = 0; i < locators.length; i++) {
+            if (checkOne(locators[i]) === null) { return null; }
+        }
+        return true;
+    }
+    return checkOne(locators[0]);
+}
+
+var result = check();
+if (result !== null || timeoutMs <= 0) { return done(result); }
+
+var finished = false, observer, timer, ticker;
+function finish(value) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(ticker);
+    document.removeEventListener('transitionend', recheck, true);
+    document.removeEventListener('animationend', recheck, true);
+    done(value);
+}
+function recheck() {
+    var value = check();
+    if (value !== null) { finish(value); }
+}
+
+observer = new MutationObserver(recheck);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+document.addEventListener('transitionend', recheck, true);
+document.addEventListener('animationend', recheck, true);
+// 布局或样式变化不一定产生DOM变更，低频兜底检查
+ticker = setInterval(recheck, 100);
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+# 批量填写表单脚本：通过原生setter写入值并触发input/change事件，返回需要在客户端填写的字段序号
+FILL_FORM_JS = LOCATOR_JS + """
+var fields = arguments[0], pending = [];
+
+function setNativeValue(el, value) {
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+}
+
+function isHidden(el) {
+    if (el.type === 'hidden') { return true; }
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) { return true; }
+    var style = window.getComputedStyle(el);
+    return style.visibility === 'hidden' || style.visibility === 'collapse';
+}
+
+// 与send_keys一致：不可见或不可编辑的字段不直接写值，返回 [序号, 原因] 交给客户端处理
+function skipReason(el) {
+    if (!el) { return 'not found'; }
+    if (el.matches(':disabled')) { return 'disabled'; }
+    if (el.readOnly) { return 'readonly'; }
+    if (el.type === 'file') { return 'file'; }
+    if (isHidden(el)) { return 'hidden'; }
+    return null;
+}
+
+fields.forEach(function (field, index) {
+    var el = findAll(field[0], field[1])[0], value = field[2];
+    var reason = skipReason(el);
+    if (reason) {
+        pending.push([index, reason]);
+        return;
+    }
+
+    if (el instanceof HTMLSelectElement) {
+        var option = Array.prototype.find.call(el.options, function (opt) {
+            return opt.value === String(value) || opt.text.trim() === String(value);
+        });
+        if (!option) { pending.push([index, 'no option']); return; }
+        el.value = option.value;
+    } else if (el.type === 'checkbox' || el.type === 'radio') {
+        el.checked = !!value;
+    } else {
+        el.focus();
+        setNativeValue(el, String(value));
+    }
+
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+});
+return pending;
+"""
+
+# 带缓存校验的只读提取脚本：页面URL、文档标识和DOM版本与上次一致时只返回版本号，不重复提取
+EXTRACT_CACHED_JS = SETTLE_INSTRUMENTATION_JS + """
+var token = arguments[0], state = window.__pomSettle;
+var version = [window.location.href, state.documentId, state.domVersion];
+if (token && token[0] === version[0] && token[1] === version[1] && token[2] === version[2]) {
+    return {version: version, cached: true};
+}
+return {version: version, data: (function () { /*EXTRACT*/ })()};
+"""
+
+# 页面快照脚本：一次返回每个定位器的存在性、可见性、数量、文本和值
+SNAPSHOT_JS = LOCATOR_JS + """
+var locators = arguments[0], snapshot = {};
+Object.keys(locators).forEach(function (name) {
+    var nodes;
+    try {
+        nodes = findAll(locators[name][0], locators[name][1]);
+    } catch (e) {
+        nodes = [];
+    }
+    var el = nodes[0];
+    snapshot[name] = {
+        present: !!el,
+        visible: !!el && isVisible(el),
+        count: nodes.length,
+        text: el ? (el.innerText || '').trim() : '',
+        texts: nodes.map(function (node) { return (node.innerText || '').trim(); }),
+        value: el && el.value !== undefined ? String(el.value) : null
+    };
+});
+return snapshot;
+"""
+
+
 class WebDriverUtils:
     """WebDriver工具类"""
 
-    def __init__(self, driver, timeout: int = 15):
+    # 浏览器端推送等待支持的定位方式
+    PUSH_STRATEGIES = (By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.CSS_SELECTOR, By.XPATH,
+                       By.LINK_TEXT, By.PARTIAL_LINK_TEXT)
+
+    # 单次推送等待脚本的最长时间（秒），需小于驱动的脚本超时，页面跳转后在新文档上继续等待
+    PUSH_WAIT_CHUNK = 5
+
+    # 页面跳转打断浏览器端脚本时各驱动返回的错误信息片段（小写）
+    NAVIGATION_ERRORS = ("unload", "execution context was destroyed", "cannot find context",
+                         "navigated or closed")
+
+    # 页面跳转后重试浏览器端脚本的退避时间（秒）：首次间隔和最大间隔
+    NAVIGATION_RETRY_DELAY = (0.05, 0.5)
+
+    # 推送等待状态对应的轮询等待条件
+    POLL_CONDITIONS = {
+        "present": EC.presence_of_element_located,
+        "all_present": EC.presence_of_all_elements_located,
+        "visible": EC.visibility_of_element_located,
+        "clickable": EC.element_to_be_clickable,
+        "invisible": EC.invisibility_of_element_located,
+        "text": EC.text_to_be_present_in_element
+    }
+
+    def __init__(self, driver, timeout: int = 15, push_waits: bool = None):
         """
         初始化WebDriver工具类
 
         Args:
             driver: WebDriver实例
             timeout: 默认等待时间
+            push_waits: 是否使用浏览器端推送等待，默认读取配置 browser.push_waits
         """
         self.driver = driver
         self.wait = WebDriverWait(driver, timeout)
         self.timeout = timeout
+        config = ConfigManager.get_instance()
+        if push_waits is None:
+            push_waits = config.get("browser.push_waits", False)
+        self.push_waits = push_waits
+        # 页面空闲等待的默认超时：轮播图、广告等持续变化的页面永远不会安静，不能按元素等待的超时阻塞
+        self.settle_timeout = config.get("browser.settle_timeout", 2)
+        self._extract_cache = {}
+        self._dom_snapshot = None
+
+    def _wait_until(self, condition, timeout: int = None):
+        """
+        客户端轮询等待，用于无法在浏览器端观察的条件，也是推送等待的回退方案
+
+        Args:
+            condition: 等待条件（expected_conditions或接收driver的可调用对象）
+            timeout: 本次调用的等待时间，None表示使用默认值，0表示只检查一次
+
+        Returns:
+            条件返回的值
+
+        Raises:
+            TimeoutException: 超时仍未满足条件
+        """
+        wait_time = self.timeout if timeout is None else timeout
+        return WebDriverWait(self.driver, wait_time).until(condition)
+
+    def _wait_for(self, locator: tuple, state: str, timeout: int = None, text: str = None):
+        """
+        等待元素进入指定状态，优先使用浏览器端推送等待，无法推送时回退到轮询
+
+        Args:
+            locator: 定位器元组
+            state: present/all_present/visible/clickable/invisible/text
+            timeout: 等待超时时间，None表示使用默认值，0表示只检查一次
+            text: state为text时需要包含的文本
+
+        Returns:
+            条件返回的值
+
+        Raises:
+            TimeoutException: 超时仍未满足条件
+        """
+        if self.push_waits and locator[0] in self.PUSH_STRATEGIES:
+            try:
+                return self._push_wait([locator], state, timeout, text)
+            except JavascriptException as e:
+                # 脚本本身执行失败（例如选择器无效），交给轮询等待给出标准的异常
+                log.debug(lambda: f"Push wait unavailable for {locator}, falling back to polling: {str(e)}")
+
+        condition_class = self.POLL_CONDITIONS[state]
+        condition = condition_class(locator, text) if state == "text" else condition_class(locator)
+        return self._wait_until(condition, timeout)
+
+    def _push_wait(self, locators: list, state: str, timeout: int = None, text: str = None,
+                   mode: str = "single"):
+        """
+        在浏览器端等待条件满足，由页面内的MutationObserver推送结果
+
+        Args:
+            locators: 定位器元组列表
+            state: 等待的元素状态
+            timeout: 等待超时时间
+            text: state为text时需要包含的文本
+            mode: single只检查第一个定位器，any任一满足，all全部满足
+
+        Returns:
+            条件返回的值
+
+        Raises:
+            TimeoutException: 超时仍未满足条件
+            JavascriptException: 等待脚本无法执行
+        """
+        wait_time = self.timeout if timeout is None else timeout
+        deadline = time.time() + wait_time
+        retries = 0
+
+        while True:
+            chunk_ms = int(min(max(deadline - time.time(), 0), self.PUSH_WAIT_CHUNK) * 1000)
+            try:
+                result = self.driver.execute_async_script(
+                    PUSH_WAIT_JS, [list(locator) for locator in locators], state, text, mode, chunk_ms
+                )
+                if result:
+                    return result
+            except WebDriverException as e:
+                # 只有页面跳转导致的脚本中断才在新文档上继续等待，其他错误（会话失效、窗口关闭、警告框等）直接抛出
+                if not self._is_navigation_error(e):
+                    raise
+                retries = self._navigation_backoff(retries, deadline)
+
+            if time.time() >= deadline:
+                raise TimeoutException(f"Condition '{state}' ({mode}) not met for {locators} within {wait_time} seconds")
+
+    @classmethod
+    def _is_navigation_error(cls, error: WebDriverException) -> bool:
+        """
+        判断浏览器端脚本是否因为页面跳转（旧文档卸载）而中断
+
+        Args:
+            error: 执行脚本时抛出的异常
+
+        Returns:
+            是否为页面跳转导致的中断
+        """
+        if isinstance(error, StaleElementReferenceException):
+            return True
+        if type(error) not in (JavascriptException, WebDriverException):
+            return False
+        message = (error.msg or "").lower()
+        return any(fragment in message for fragment in cls.NAVIGATION_ERRORS)
+
+    def _navigation_backoff(self, retries: int, deadline: float) -> int:
+        """
+        页面跳转后等待新文档开始加载再重试，间隔按次数翻倍，不超过截止时间
+
+        Args:
+            retries: 已重试的次数
+            deadline: 等待的截止时间
+
+        Returns:
+            新的重试次数
+        """
+        first, longest = self.NAVIGATION_RETRY_DELAY
+        delay = min(first * (2 ** retries), longest, max(deadline - time.time(), 0))
+        if delay > 0:
+            time.sleep(delay)
+        return retries + 1
+
+    def _wait_composite(self, locators: tuple, state: str, mode: str, timeout: int = None):
+        """
+        在一个等待循环内检查多个定位器
+
+        Args:
+            locators: 定位器元组
+            state: 等待的元素状态
+            mode: any任一满足时返回 {"index": 序号}，all全部满足时返回True
+            timeout: 等待超时时间
+
+        Returns:
+            条件返回的值
+
+        Raises:
+            TimeoutException: 超时仍未满足条件
+        """
+        if self.push_waits and all(locator[0] in self.PUSH_STRATEGIES for locator in locators):
+            try:
+                return self._push_wait(list(locators), state, timeout, mode=mode)
+            except JavascriptException as e:
+                log.debug(lambda: f"Push wait unavailable for {locators}, falling back to polling: {str(e)}")
+
+        conditions = [self.POLL_CONDITIONS[state](locator) for locator in locators]
+
+        def check_one(condition, driver):
+            try:
+                return condition(driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                return False
+
+        def check(driver):
+            if mode == "any":
+                for index, condition in enumerate(conditions):
+                    if check_one(condition, driver):
+                        return {"index": index}
+                return False
+            return all(check_one(condition, driver) for condition in conditions)
+
+        return self._wait_until(check, timeout)
+
+    def wait_any(self, *locators: tuple, timeout: int = None, state: str = "visible") -> Optional[tuple]:
+        """
+        等待任意一个定位器满足条件
+
+        Args:
+            *locators: 定位器元组
+            timeout: 等待超时时间，所有定位器共用
+            state: 元素状态 present/visible/clickable/invisible
+
+        Returns:
+            最先满足条件的定位器，超时返回None
+        """
+        try:
+            result = self._wait_composite(locators, state, "any", timeout)
+            matched = locators[result["index"]]
+            log.page_action("Wait any matched", matched)
+            return matched
+        except TimeoutException:
+            log.warning(f"None of the elements became {state}: {locators}")
+            return None
+
+    def wait_all(self, *locators: tuple, timeout: int = None, state: str = "visible") -> bool:
+        """
+        等待所有定位器满足条件
+
+        Args:
+            *locators: 定位器元组
+            timeout: 等待超时时间，所有定位器共用
+            state: 元素状态 present/visible/clickable/invisible
+
+        Returns:
+            是否全部满足条件
+        """
+        try:
+            self._wait_composite(locators, state, "all", timeout)
+            log.page_action("Wait all matched", lambda: f"{len(locators)} elements {state}")
+            return True
+        except TimeoutException:
+            log.warning(f"Not all elements became {state}: {locators}")
+            return False
 
     def find_element(self, locator: tuple, timeout: int = None) -> Optional[WebElement]:
         """
@@ -46,11 +530,8 @@ class WebDriverUtils:
             WebElement或None
         """
         try:
-            wait_time = timeout or self.timeout
-            element = WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_element_located(locator)
-            )
-            log.page_action("Found element", f"{locator[0]}='{locator[1]}'")
+            element = self._wait_for(locator, "present", timeout)
+            log.page_action("Found element", locator)
             return element
         except TimeoutException:
             log.warning(f"Element not found: {locator}")
@@ -68,11 +549,8 @@ class WebDriverUtils:
             WebElement列表
         """
         try:
-            wait_time = timeout or self.timeout
-            elements = WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_all_elements_located(locator)
-            )
-            log.page_action("Found elements", f"{locator[0]}='{locator[1]}' (count: {len(elements)})")
+            elements = self._wait_for(locator, "all_present", timeout)
+            log.page_action("Found elements", lambda: f"{locator[0]}='{locator[1]}' (count: {len(elements)})")
             return elements
         except TimeoutException:
             log.warning(f"Elements not found: {locator}")
@@ -90,11 +568,8 @@ class WebDriverUtils:
             WebElement或None
         """
         try:
-            wait_time = timeout or self.timeout
-            element = WebDriverWait(self.driver, wait_time).until(
-                EC.visibility_of_element_located(locator)
-            )
-            log.page_action("Element visible", f"{locator[0]}='{locator[1]}'")
+            element = self._wait_for(locator, "visible", timeout)
+            log.page_action("Element visible", locator)
             return element
         except TimeoutException:
             log.warning(f"Element not visible: {locator}")
@@ -112,11 +587,8 @@ class WebDriverUtils:
             WebElement或None
         """
         try:
-            wait_time = timeout or self.timeout
-            element = WebDriverWait(self.driver, wait_time).until(
-                EC.element_to_be_clickable(locator)
-            )
-            log.page_action("Element clickable", f"{locator[0]}='{locator[1]}'")
+            element = self._wait_for(locator, "clickable", timeout)
+            log.page_action("Element clickable", locator)
             return element
         except TimeoutException:
             log.warning(f"Element not clickable: {locator}")
@@ -137,7 +609,7 @@ class WebDriverUtils:
             element = self.wait_for_element_clickable(locator, timeout)
             if element:
                 element.click()
-                log.page_action("Clicked element", f"{locator[0]}='{locator[1]}'")
+                log.page_action("Clicked element", locator)
                 return True
             return False
         except Exception as e:
@@ -163,13 +635,83 @@ class WebDriverUtils:
                 if clear:
                     element.clear()
                 element.send_keys(text)
-                log.page_action("Sent keys", f"{locator[0]}='{locator[1]}' text='{text}'")
+                log.page_action("Sent keys", lambda: f"{locator[0]}='{locator[1]}' text='{text}'")
                 return True
             return False
         except Exception as e:
             log.error(f"Send keys failed: {str(e)}")
             return False
 
+    def fill_form(self, fields: dict, typed: tuple = (), timeout: int = None) -> bool:
+        """
+        批量填写表单，一次脚本调用写入所有字段并触发input/change事件
+
+        Args:
+            fields: {定位器: 值}，输入框为文本，下拉框为选项值或文本，复选框/单选框为布尔值
+            typed: 需要真实键盘输入的定位器，这些字段在批量填写后通过send_keys逐键输入
+            timeout: 未找到字段时的等待超时时间
+
+        Returns:
+            是否所有字段都填写成功
+        """
+        bulk = [(locator, value) for locator, value in fields.items()
+                if locator not in typed and locator[0] in self.PUSH_STRATEGIES]
+        pending = [(locator, value) for locator, value in fields.items() if (locator, value) not in bulk]
+
+        try:
+            if bulk:
+                skipped = self.driver.execute_script(
+                    FILL_FORM_JS, [[locator[0], locator[1], value] for locator, value in bulk]
+                )
+                # 尚未渲染、隐藏、禁用、只读或文件上传字段交给客户端逐个填写：
+                # 会等待字段出现，仍然不可见或不可编辑时与input_text一样返回失败
+                for index, reason in skipped:
+                    log.debug(lambda: f"Bulk fill skipped {bulk[index][0]}: {reason}")
+                pending = [bulk[index] for index, _ in skipped] + pending
+                log.page_action("Filled form", lambda: f"{len(bulk) - len(skipped)} fields in one call")
+        except WebDriverException as e:
+            log.warning(f"Bulk form fill failed, falling back to send_keys: {str(e)}")
+            pending = list(fields.items())
+
+        success = True
+        for locator, value in pending:
+            success = self._fill_field(locator, value, timeout) and success
+        return success
+
+    def _fill_field(self, locator: tuple, value, timeout: int = None) -> bool:
+        """
+        通过WebDriver原生交互填写单个字段
+
+        Args:
+            locator: 定位器元组
+            value: 字段值
+            timeout: 等待超时时间
+
+        Returns:
+            是否填写成功
+        """
+        element = self.wait_for_element_visible(locator, timeout)
+        if element is None:
+            return False
+
+        try:
+            if element.tag_name.lower() == "select":
+                select = Select(element)
+                try:
+                    select.select_by_value(str(value))
+                except Exception:
+                    select.select_by_visible_text(str(value))
+                return True
+            if isinstance(value, bool):
+                if element.is_selected() != value:
+                    element.click()
+                return True
+            return self.send_keys(locator, str(value), clear=element.get_attribute("type") != "file",
+                                  timeout=timeout)
+        except Exception as e:
+            log.error(f"Fill field failed: {locator} {str(e)}")
+            return False
+
     def get_text(self, locator: tuple, timeout: int = None) -> str:
         """
         获取元素文本
@@ -185,7 +727,7 @@ class WebDriverUtils:
             element = self.wait_for_element_visible(locator, timeout)
             if element:
                 text = element.text
-                log.page_action("Got text", f"{locator[0]}='{locator[1]}' text='{text}'")
+                log.page_action("Got text", lambda: f"{locator[0]}='{locator[1]}' text='{text}'")
                 return text
             return ""
         except Exception as e:
@@ -208,27 +750,35 @@ class WebDriverUtils:
             element = self.wait_for_element_visible(locator, timeout)
             if element:
                 value = element.get_attribute(attribute)
-                log.page_action("Got attribute", f"{locator[0]}='{locator[1]}' {attribute}='{value}'")
+                log.page_action("Got attribute", lambda: f"{locator[0]}='{locator[1]}' {attribute}='{value}'")
                 return value or ""
             return ""
         except Exception as e:
             log.error(f"Get attribute failed: {str(e)}")
             return ""
 
-    def is_element_present(self, locator: tuple) -> bool:
+    def is_element_present(self, locator: tuple, timeout: int = None) -> bool:
         """
         检查元素是否存在
 
         Args:
             locator: 定位器元组
+            timeout: 等待超时时间，为None时直接查找一次（受驱动的隐式等待影响），0表示不等待只检查一次
 
         Returns:
             是否存在
         """
+        if timeout is None:
+            try:
+                self.driver.find_element(*locator)
+                return True
+            except NoSuchElementException:
+                return False
+
         try:
-            self.driver.find_element(*locator)
+            self._wait_for(locator, "present", timeout)
             return True
-        except NoSuchElementException:
+        except TimeoutException:
             return False
 
     def is_element_visible(self, locator: tuple, timeout: int = 3) -> bool:
@@ -243,11 +793,46 @@ class WebDriverUtils:
             是否可见
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self._wait_for(locator, "visible", timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def is_element_invisible(self, locator: tuple, timeout: int = 3) -> bool:
+        """
+        检查元素是否不可见（元素不存在时立即返回True）
+
+        Args:
+            locator: 定位器元组
+            timeout: 等待元素消失的超时时间
+
+        Returns:
+            是否不可见
+        """
+        try:
+            self._wait_for(locator, "invisible", timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_text(self, locator: tuple, text: str, timeout: int = None) -> bool:
+        """
+        等待元素文本包含指定内容
+
+        Args:
+            locator: 定位器元组
+            text: 期望包含的文本
+            timeout: 等待超时时间
+
+        Returns:
+            是否在超时前出现该文本
+        """
+        try:
+            self._wait_for(locator, "text", timeout, text)
+            log.page_action("Text present", lambda: f"{locator[0]}='{locator[1]}' text='{text}'")
             return True
         except TimeoutException:
+            log.warning(f"Text '{text}' not present in element: {locator}")
             return False
 
     def select_dropdown_by_text(self, locator: tuple, text: str, timeout: int = None) -> bool:
@@ -267,7 +852,7 @@ class WebDriverUtils:
             if element:
                 select = Select(element)
                 select.select_by_visible_text(text)
-                log.page_action("Selected dropdown", f"{locator[0]}='{locator[1]}' text='{text}'")
+                log.page_action("Selected dropdown", lambda: f"{locator[0]}='{locator[1]}' text='{text}'")
                 return True
             return False
         except Exception as e:
@@ -291,7 +876,7 @@ class WebDriverUtils:
             if element:
                 select = Select(element)
                 select.select_by_value(value)
-                log.page_action("Selected dropdown", f"{locator[0]}='{locator[1]}' value='{value}'")
+                log.page_action("Selected dropdown", lambda: f"{locator[0]}='{locator[1]}' value='{value}'")
                 return True
             return False
         except Exception as e:
@@ -313,7 +898,7 @@ class WebDriverUtils:
             element = self.wait_for_element_visible(locator, timeout)
             if element:
                 ActionChains(self.driver).move_to_element(element).perform()
-                log.page_action("Hovered element", f"{locator[0]}='{locator[1]}'")
+                log.page_action("Hovered element", locator)
                 return True
             return False
         except Exception as e:
@@ -335,7 +920,7 @@ class WebDriverUtils:
             element = self.wait_for_element_clickable(locator, timeout)
             if element:
                 ActionChains(self.driver).double_click(element).perform()
-                log.page_action("Double clicked element", f"{locator[0]}='{locator[1]}'")
+                log.page_action("Double clicked element", locator)
                 return True
             return False
         except Exception as e:
@@ -357,7 +942,7 @@ class WebDriverUtils:
             element = self.find_element(locator, timeout)
             if element:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                log.page_action("Scrolled to element", f"{locator[0]}='{locator[1]}'")
+                log.page_action("Scrolled to element", locator)
                 return True
             return False
         except Exception as e:
@@ -371,12 +956,75 @@ class WebDriverUtils:
         Args:
             timeout: 等待超时时间
         """
-        wait_time = timeout or self.timeout
-        WebDriverWait(self.driver, wait_time).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        self._wait_until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete",
+            timeout
         )
         log.page_action("Page loaded")
 
+    def wait_for_settled(self, timeout: int = None, quiet_ms: int = 300) -> bool:
+        """
+        等待页面空闲：加载完成、没有进行中的fetch/XHR请求且DOM在quiet_ms内没有变化
+
+        Args:
+            timeout: 等待超时时间，默认为配置 browser.settle_timeout
+            quiet_ms: DOM保持不变的时间窗口（毫秒）
+
+        Returns:
+            是否在超时前进入空闲状态，出现警告框时返回False（警告框需要由调用方处理）
+
+        Raises:
+            WebDriverException: 会话失效、窗口已关闭等非页面跳转导致的错误
+        """
+        wait_time = self.settle_timeout if timeout is None else timeout
+        deadline = time.time() + wait_time
+        retries = 0
+
+        while True:
+            remaining_ms = int(max(deadline - time.time(), 0) * 1000)
+            try:
+                settled = self.driver.execute_async_script(SETTLE_WAIT_JS, quiet_ms, remaining_ms)
+                if settled:
+                    log.page_action("Page settled")
+                else:
+                    log.warning(f"Page not settled within {wait_time} seconds")
+                return bool(settled)
+            except UnexpectedAlertPresentException:
+                # 警告框需要由调用方处理，页面并未进入空闲状态
+                log.page_action("Alert present, page not settled")
+                return False
+            except WebDriverException as e:
+                # 点击触发了页面跳转，旧文档卸载导致脚本中断，在新页面上继续等待；
+                # 会话失效、窗口已关闭等错误直接抛出
+                if not self._is_navigation_error(e):
+                    raise
+                if time.time() >= deadline:
+                    log.warning(f"Page not settled within {wait_time} seconds")
+                    return False
+                retries = self._navigation_backoff(retries, deadline)
+
+    @staticmethod
+    def install_settle_instrumentation(driver) -> bool:
+        """
+        让浏览器在每个新文档开始时注入页面埋点脚本（仅Chromium内核的本地会话支持）
+
+        未注入时 wait_for_settled 会在首次调用时补注入
+
+        Args:
+            driver: WebDriver实例
+
+        Returns:
+            是否注入成功
+        """
+        try:
+            driver.execute("executeCdpCommand", {
+                "cmd": "Page.addScriptToEvaluateOnNewDocument",
+                "params": {"source": SETTLE_INSTRUMENTATION_JS}
+            })
+            return True
+        except Exception:
+            return False
+
     def switch_to_frame(self, locator: tuple, timeout: int = None) -> bool:
         """
         切换到iframe
@@ -392,7 +1040,7 @@ class WebDriverUtils:
             element = self.wait_for_element_visible(locator, timeout)
             if element:
                 self.driver.switch_to.frame(element)
-                log.page_action("Switched to frame", f"{locator[0]}='{locator[1]}'")
+                log.page_action("Switched to frame", locator)
                 return True
             return False
         except Exception as e:
@@ -443,9 +1091,86 @@ class WebDriverUtils:
             执行结果
         """
         result = self.driver.execute_script(script, *args)
-        log.page_action("Executed JavaScript", script[:50] + "..." if len(script) > 50 else script)
+        log.page_action("Executed JavaScript", lambda: script[:50] + "..." if len(script) > 50 else script)
         return result
 
+    def snapshot(self, locators: dict) -> dict:
+        """
+        一次脚本调用获取多个定位器对应元素的状态（不等待）
+
+        Args:
+            locators: {名称: 定位器元组}
+
+        Returns:
+            {名称: {"present", "visible", "count", "text", "texts", "value"}}，
+            无法在浏览器端解析的定位器通过WebDriver逐个查询
+        """
+        pushable = {name: list(locator) for name, locator in locators.items()
+                    if locator[0] in self.PUSH_STRATEGIES}
+        result = self.driver.execute_script(SNAPSHOT_JS, pushable) if pushable else {}
+
+        for name, locator in locators.items():
+            if name not in result:
+                elements = self.driver.find_elements(*locator)
+                first = elements[0] if elements else None
+                result[name] = {
+                    "present": first is not None,
+                    "visible": first is not None and first.is_displayed(),
+                    "count": len(elements),
+                    "text": first.text.strip() if first is not None else "",
+                    "texts": [element.text.strip() for element in elements],
+                    "value": first.get_attribute("value") if first is not None else None
+                }
+
+        log.page_action("Took page snapshot", lambda: f"{len(locators)} locators")
+        return result
+
+    def extract_cached(self, key: str, script: str):
+        """
+        在一次脚本调用中提取页面数据，结果按页面URL和DOM版本缓存
+
+        页面未跳转且DOM没有变化时，脚本只返回版本号，直接使用上次的结果
+
+        Args:
+            key: 缓存键
+            script: 返回提取结果的JavaScript函数体（只读，不能修改页面）
+
+        Returns:
+            提取结果
+        """
+        cached = self._extract_cache.get(key)
+        result = self.driver.execute_script(
+            EXTRACT_CACHED_JS.replace("/*EXTRACT*/", script),
+            cached["version"] if cached else None
+        )
+
+        if result.get("cached"):
+            log.page_action("Used cached extraction", key)
+        else:
+            cached = {"version": result["version"], "data": result["data"]}
+            self._extract_cache[key] = cached
+            log.page_action("Extracted page data", key)
+
+        return copy.deepcopy(cached["data"])
+
+    def get_dom_snapshot(self) -> DomSnapshot:
+        """
+        获取当前页面的离线DOM快照
+
+        页面HTML通过 extract_cached 获取并解析，页面跳转或DOM变化前重复调用直接返回同一个快照
+
+        Returns:
+            DomSnapshot实例
+        """
+        source = self.extract_cached("page_source", "return document.documentElement.outerHTML;")
+        version = self._extract_cache["page_source"]["version"]
+
+        if self._dom_snapshot is None or self._dom_snapshot[0] != version:
+            self._dom_snapshot = (version, DomSnapshot(source, version[0]))
+            log.page_action("Parsed DOM snapshot", lambda: f"{version[0]} (version {version[2]})")
+
+        return self._dom_snapshot[1]
+
     def take_screenshot(self, file_path: str) -> bool:
         """
         截图